@@ -0,0 +1,132 @@
+from typing import Optional
+
+import numpy as np
+
+from app.core.config import settings
+
+
+class KerasBackend:
+    """
+    Runs a full precision Keras model.
+
+    Args:
+        model_path (str): The path to the saved Keras model.
+    """
+
+    def __init__(self, model_path: str):
+        self.model_path = model_path
+        self._model = None
+
+    def load(self):
+        from keras.models import load_model
+
+        self._model = load_model(self.model_path, compile=False)
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Runs the model on a float32 batch.
+
+        Args:
+            batch (np.ndarray): The model input.
+
+        Returns:
+            np.ndarray: The float32 model output.
+        """
+        return np.asarray(self._model.predict_on_batch(batch))
+
+
+class TFLiteBackend:
+    """
+    Runs a post-training quantized TFLite model on CPU.
+
+    Both float16 and full integer models are supported. For integer models the
+    input is quantized and the output dequantized with the scales stored in the model.
+
+    Args:
+        model_path (str): The path to the ``.tflite`` file.
+        num_threads (int): The number of CPU threads used by the interpreter.
+    """
+
+    def __init__(self, model_path: str, num_threads: int = settings.RECOGNIZER_NUM_THREADS):
+        self.model_path = model_path
+        self.num_threads = num_threads
+        self._interpreter = None
+        self._input = None
+        self._output = None
+        self._batch_size = None
+
+    def load(self):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+
+            Interpreter = tf.lite.Interpreter
+
+        self._interpreter = Interpreter(model_path=self.model_path, num_threads=self.num_threads)
+        self._interpreter.allocate_tensors()
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self._batch_size = int(self._input["shape"][0])
+
+    def _resize(self, batch_size: int):
+        shape = list(self._input["shape"])
+        shape[0] = batch_size
+        self._interpreter.resize_tensor_input(self._input["index"], shape)
+        self._interpreter.allocate_tensors()
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self._batch_size = batch_size
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Runs the model on a float32 batch.
+
+        Args:
+            batch (np.ndarray): The model input.
+
+        Returns:
+            np.ndarray: The float32 model output.
+        """
+        if len(batch) != self._batch_size:
+            self._resize(len(batch))
+
+        input_type = self._input["dtype"]
+        if input_type in (np.int8, np.uint8):
+            scale, zero_point = self._input["quantization"]
+            info = np.iinfo(input_type)
+            batch = np.clip(np.round(batch / scale + zero_point), info.min, info.max).astype(input_type)
+        self._interpreter.set_tensor(self._input["index"], batch)
+        self._interpreter.invoke()
+
+        output = self._interpreter.get_tensor(self._output["index"])
+        if self._output["dtype"] in (np.int8, np.uint8):
+            scale, zero_point = self._output["quantization"]
+            output = (output.astype(np.float32) - zero_point) * scale
+        return output
+
+
+BACKENDS = {
+    "keras": (KerasBackend, settings.RECOGNIZER_MODEL_PATH),
+    "tflite": (TFLiteBackend, settings.RECOGNIZER_TFLITE_MODEL_PATH),
+}
+
+
+def get_backend(name: str, model_path: Optional[str] = None):
+    """
+    Creates an inference backend by name.
+
+    Args:
+        name (str): ``keras`` or ``tflite``.
+        model_path (str, optional): Overrides the model path from the settings.
+
+    Returns:
+        KerasBackend | TFLiteBackend: The backend, not loaded yet.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown recognizer backend: {name}")
+    backend_class, default_path = BACKENDS[name]
+    return backend_class(model_path or default_path)
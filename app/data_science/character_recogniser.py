@@ -0,0 +1,140 @@
+import threading
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.data_science.backends import get_backend
+
+ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+@dataclass
+class PlateRead:
+    text: str
+    probabilities: np.ndarray
+
+    @property
+    def confidence(self) -> float:
+        """The probability that every character is read correctly."""
+        if not self.text:
+            return 0.0
+        return float(np.prod(self.probabilities.max(axis=1)))
+
+
+class CharacterRecognizer:
+    """
+    License plate character recognizer.
+
+    Plate crops are segmented into characters, and every character is classified
+    over :data:`ALPHABET`. TensorFlow, Keras and OpenCV are imported on first use
+    only, so importing this module stays cheap.
+
+    The model runs either as the full Keras model or as a quantized TFLite model
+    on CPU, selected by ``RECOGNIZER_BACKEND``.
+
+    Args:
+        backend (str): ``keras`` or ``tflite``.
+        model_path (str, optional): Overrides the model path from the settings.
+        max_batch (int): The maximum number of plate crops per inference call.
+    """
+
+    def __init__(
+        self,
+        backend: str = settings.RECOGNIZER_BACKEND,
+        model_path: Optional[str] = None,
+        max_batch: int = 32,
+    ):
+        self.backend = get_backend(backend, model_path)
+        self.max_batch = max_batch
+        self._model = None
+        self._preprocessor = None
+        self._load_lock = threading.Lock()
+        self._infer_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+
+    def load(self):
+        """
+        Loads the model and allocates the preprocessing buffers if not done yet.
+
+        Returns:
+            The inference backend.
+        """
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    from app.data_science.preprocessing import PlateBatchPreprocessor
+
+                    self._preprocessor = PlateBatchPreprocessor(max_batch=self.max_batch)
+                    self.backend.load()
+                    self._model = self.backend
+        return self._model
+
+    def recognize(self, image: np.ndarray) -> str:
+        """
+        Reads the characters of a single plate crop.
+
+        Args:
+            image (np.ndarray): A BGR uint8 plate crop.
+
+        Returns:
+            str: The recognized plate text.
+        """
+        return self.recognize_batch([image])[0]
+
+    def recognize_batch(self, crops: list[np.ndarray]) -> list[str]:
+        """
+        Reads the characters of a batch of plate crops with one model call.
+
+        Args:
+            crops (list[np.ndarray]): BGR uint8 plate crops.
+
+        Returns:
+            list[str]: The recognized plate texts, in input order.
+        """
+        return [read.text for read in self.read_batch(crops)]
+
+    def read_batch(self, crops: list[np.ndarray]) -> list[PlateRead]:
+        """
+        Reads a batch of plate crops, keeping the per-character probabilities.
+
+        Args:
+            crops (list[np.ndarray]): BGR uint8 plate crops.
+
+        Returns:
+            list[PlateRead]: The reads, in input order.
+        """
+        model = self.load()
+        with self._infer_lock:
+            preprocessor = self._preprocessor
+            preprocessor.process(crops)
+            segments = preprocessor.segment(len(crops))
+            chars = preprocessor.characters(segments)
+            if len(chars):
+                probabilities = model.predict(chars)
+            else:
+                probabilities = np.empty((0, len(ALPHABET)), dtype=np.float32)
+
+        reads = []
+        start = 0
+        for plate_segments in segments:
+            end = start + len(plate_segments)
+            plate_probabilities = probabilities[start:end]
+            text = "".join(ALPHABET[label] for label in plate_probabilities.argmax(axis=1))
+            reads.append(PlateRead(text, plate_probabilities))
+            start = end
+        return reads
+
+    def warmup(self):
+        """Loads the model and runs a dummy plate through it."""
+        self.load()
+        plate = np.full((64, 256, 3), 255, dtype=np.uint8)
+        plate[16:48, 16:40] = 0
+        self.recognize_batch([plate])
+
+
+character_recognizer = CharacterRecognizer()
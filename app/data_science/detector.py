@@ -0,0 +1,109 @@
+import threading
+from typing import Optional
+
+import numpy as np
+
+from app.core.config import settings
+
+Box = tuple[int, int, int, int]
+
+
+class Detector:
+    """
+    License plate detector backed by a Keras model.
+
+    The model predicts one normalized ``(x1, y1, x2, y2)`` box per image. TensorFlow,
+    Keras and OpenCV are imported on first use only, so importing this module
+    stays cheap for workers that never run recognition.
+
+    Args:
+        model_path (str): The path to the saved Keras model.
+        input_size (int): The side of the square model input.
+        max_batch (int): The maximum number of images per inference call.
+    """
+
+    def __init__(
+        self,
+        model_path: str = settings.DETECTOR_MODEL_PATH,
+        input_size: int = settings.DETECTOR_INPUT_SIZE,
+        max_batch: int = 32,
+    ):
+        self.model_path = model_path
+        self.input_size = input_size
+        self.max_batch = max_batch
+        self._model = None
+        self._batch: Optional[np.ndarray] = None
+        self._load_lock = threading.Lock()
+        self._infer_lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+
+    def load(self):
+        """
+        Loads the model if it is not loaded yet.
+
+        Returns:
+            The Keras model.
+        """
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    from keras.models import load_model
+
+                    self._batch = np.empty(
+                        (self.max_batch, self.input_size, self.input_size, 3), dtype=np.float32
+                    )
+                    self._model = load_model(self.model_path, compile=False)
+        return self._model
+
+    def detect(self, image: np.ndarray) -> list[Box]:
+        """
+        Detects license plates on a single image.
+
+        Args:
+            image (np.ndarray): A BGR uint8 image.
+
+        Returns:
+            list[Box]: Plate boxes in pixel coordinates.
+        """
+        return self.detect_batch([image])[0]
+
+    def detect_batch(self, images: list[np.ndarray]) -> list[list[Box]]:
+        """
+        Detects license plates on a batch of images with one model call.
+
+        Args:
+            images (list[np.ndarray]): BGR uint8 images of any size.
+
+        Returns:
+            list[list[Box]]: Plate boxes in pixel coordinates, per image.
+        """
+        if len(images) > self.max_batch:
+            raise ValueError(f"Batch of {len(images)} images exceeds max_batch={self.max_batch}")
+        model = self.load()
+        import cv2
+
+        with self._infer_lock:
+            batch = self._batch[: len(images)]
+            for slot, image in zip(batch, images):
+                resized = cv2.resize(image, (self.input_size, self.input_size))
+                np.multiply(resized, np.float32(1 / 255), out=slot, casting="unsafe")
+            outputs = np.asarray(model.predict_on_batch(batch))
+
+        results = []
+        for image, output in zip(images, outputs):
+            height, width = image.shape[:2]
+            x1, y1, x2, y2 = np.clip(output[:4], 0.0, 1.0)
+            box = (int(x1 * width), int(y1 * height), int(x2 * width), int(y2 * height))
+            results.append([box] if box[2] > box[0] and box[3] > box[1] else [])
+        return results
+
+    def warmup(self):
+        """Loads the model and runs a dummy batch through it."""
+        self.load()
+        self.detect_batch([np.zeros((self.input_size, self.input_size, 3), dtype=np.uint8)])
+
+
+detector = Detector()
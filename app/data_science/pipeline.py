@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from app.data_science.character_recogniser import CharacterRecognizer, PlateRead
+from app.data_science.detector import Detector
+from app.data_science.scheduler import Frame
+from app.data_science.voting import PlateVoter, VoteResult
+
+
+@dataclass
+class PipelineStats:
+    frames: int = 0
+    skipped: int = 0
+    detections: int = 0
+    recognitions: int = 0
+    expired: int = 0
+
+
+class RecognitionPipeline:
+    """
+    Runs frames through the detector and the character recognizer.
+
+    Frames that carry a ``track_id`` are voted on across the track, and frames of
+    tracks whose plate is already final skip both models. Tracks that have not
+    been seen for a while are forgotten after every batch.
+
+    Args:
+        detector (Detector): The plate detector.
+        recognizer (CharacterRecognizer): The character recognizer.
+        voter (PlateVoter): The per-track vote aggregator.
+    """
+
+    def __init__(self, detector: Detector, recognizer: CharacterRecognizer, voter: PlateVoter):
+        self.detector = detector
+        self.recognizer = recognizer
+        self.voter = voter
+        self.stats = PipelineStats()
+
+    def process_batch(self, frames: list[Frame]) -> list[Optional[VoteResult]]:
+        """
+        Processes a batch of frames with one call to each model.
+
+        Args:
+            frames (list[Frame]): The frames, possibly from several cameras.
+
+        Returns:
+            list[Optional[VoteResult]]: Per frame, the plate read on a frame without a
+            track, the final plate of a track finalized by this frame, or None.
+        """
+        results = self._process(frames)
+        self.stats.expired += len(self.voter.expire())
+        return results
+
+    def _process(self, frames: list[Frame]) -> list[Optional[VoteResult]]:
+        self.stats.frames += len(frames)
+        results: list[Optional[VoteResult]] = [None] * len(frames)
+        pending = [
+            index for index, frame in enumerate(frames)
+            if frame.track_id is None or self.voter.should_recognize(frame.track_id)
+        ]
+        self.stats.skipped += len(frames) - len(pending)
+        if not pending:
+            return results
+
+        detections = self.detector.detect_batch([frames[index].image for index in pending])
+        owners = []
+        crops = []
+        for index, boxes in zip(pending, detections):
+            if boxes:
+                x1, y1, x2, y2 = boxes[0]
+                owners.append(index)
+                crops.append(frames[index].image[y1:y2, x1:x2])
+        self.stats.detections += len(crops)
+        if not crops:
+            return results
+
+        reads: list[PlateRead] = self.recognizer.read_batch(crops)
+        self.stats.recognitions += len(reads)
+        for index, read in zip(owners, reads):
+            track_id = frames[index].track_id
+            if track_id is None:
+                results[index] = VoteResult(read.text, read.confidence, 1)
+            else:
+                results[index] = self.voter.add(track_id, read)
+        return results
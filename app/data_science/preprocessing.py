@@ -0,0 +1,176 @@
+import cv2
+import numpy as np
+
+
+class PlateBatchPreprocessor:
+    """
+    Batched preprocessing of license plate crops for the character recognizer.
+
+    All intermediate and output arrays are allocated once, in the constructor.
+    Every call writes into the same buffers and returns views of them, so the
+    results stay valid only until the next call.
+
+    Args:
+        max_batch (int): The maximum number of crops per batch.
+        height (int): The height of a normalized plate.
+        width (int): The width of a normalized plate.
+        channels (int): 1 for grayscale output, 3 for BGR output.
+        char_size (tuple[int, int]): The (width, height) of a segmented character.
+        max_chars (int): The maximum number of characters kept per plate.
+        min_char_width (int): Column runs narrower than this are treated as noise.
+        pad_value (int): The intensity used to pad crops to the plate size.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 32,
+        height: int = 64,
+        width: int = 256,
+        channels: int = 1,
+        char_size: tuple[int, int] = (28, 28),
+        max_chars: int = 10,
+        min_char_width: int = 3,
+        pad_value: int = 255,
+    ):
+        if channels not in (1, 3):
+            raise ValueError("channels must be 1 or 3")
+        self.max_batch = max_batch
+        self.height = height
+        self.width = width
+        self.channels = channels
+        self.char_size = char_size
+        self.max_chars = max_chars
+        self.min_char_width = min_char_width
+        self.pad_value = pad_value
+
+        self._bgr = np.empty((max_batch, height, width, 3), dtype=np.uint8)
+        self._gray = np.empty((max_batch, height, width), dtype=np.uint8)
+        self._batch = np.empty((max_batch, height, width, channels), dtype=np.float32)
+        self._threshold = np.empty((max_batch, 1, 1), dtype=np.float32)
+        self._mask = np.empty((max_batch, height, width), dtype=bool)
+        self._columns = np.empty((max_batch, width), dtype=np.int32)
+        self._edges = np.zeros((max_batch, width + 2), dtype=np.int8)
+        self._runs = np.empty((max_batch, width + 1), dtype=np.int8)
+        self._char_pixels = np.empty(
+            (max_batch * max_chars, char_size[1], char_size[0]), dtype=np.uint8
+        )
+        self._chars = np.empty(
+            (max_batch * max_chars, char_size[1], char_size[0], 1), dtype=np.float32
+        )
+
+    def _check_batch(self, crops: list[np.ndarray]) -> int:
+        count = len(crops)
+        if count > self.max_batch:
+            raise ValueError(f"Batch of {count} crops exceeds max_batch={self.max_batch}")
+        return count
+
+    def process(self, crops: list[np.ndarray]) -> np.ndarray:
+        """
+        Resizes, pads and normalizes a batch of plate crops.
+
+        Each crop is scaled to fit the plate size with its aspect ratio kept and
+        is padded on the right and bottom. Color conversion and normalization
+        run once over the whole batch.
+
+        Args:
+            crops (list[np.ndarray]): BGR or grayscale uint8 crops of any size.
+
+        Returns:
+            np.ndarray: A float32 view of shape (N, H, W, C) with values in [0, 1].
+        """
+        count = self._check_batch(crops)
+        bgr = self._bgr[:count]
+        bgr.fill(self.pad_value)
+
+        for slot, crop in zip(bgr, crops):
+            if crop.ndim == 2:
+                crop = cv2.cvtColor(crop, cv2.COLOR_GRAY2BGR)
+            crop_height, crop_width = crop.shape[:2]
+            scale = min(self.width / crop_width, self.height / crop_height)
+            new_width = max(1, min(self.width, round(crop_width * scale)))
+            new_height = max(1, min(self.height, round(crop_height * scale)))
+            cv2.resize(
+                crop,
+                (new_width, new_height),
+                dst=slot[:new_height, :new_width],
+                interpolation=cv2.INTER_AREA,
+            )
+
+        gray = self._gray[:count]
+        cv2.cvtColor(
+            bgr.reshape(count * self.height, self.width, 3),
+            cv2.COLOR_BGR2GRAY,
+            dst=gray.reshape(count * self.height, self.width),
+        )
+
+        batch = self._batch[:count]
+        source = gray[..., np.newaxis] if self.channels == 1 else bgr
+        np.multiply(source, np.float32(1 / 255), out=batch, casting="unsafe")
+        return batch
+
+    def segment(self, count: int) -> list[list[tuple[int, int]]]:
+        """
+        Finds character columns in the last processed batch.
+
+        Characters are assumed darker than the plate background. Every plate is
+        binarized against its own mean intensity, and runs of columns that
+        contain dark pixels are taken as characters.
+
+        Args:
+            count (int): The number of plates in the last processed batch.
+
+        Returns:
+            list[list[tuple[int, int]]]: The (start, end) columns of each character, per plate.
+        """
+        gray = self._gray[:count]
+        threshold = self._threshold[:count]
+        np.mean(gray, axis=(1, 2), keepdims=True, out=threshold)
+        mask = self._mask[:count]
+        np.less(gray, threshold, out=mask)
+
+        columns = self._columns[:count]
+        np.sum(mask, axis=1, out=columns)
+
+        edges = self._edges[:count]
+        np.greater(columns, 0, out=edges[:, 1:-1], casting="unsafe")
+        runs = self._runs[:count]
+        np.subtract(edges[:, 1:], edges[:, :-1], out=runs)
+
+        plates, starts = np.nonzero(runs == 1)
+        _, ends = np.nonzero(runs == -1)
+
+        segments: list[list[tuple[int, int]]] = [[] for _ in range(count)]
+        for plate, start, end in zip(plates.tolist(), starts.tolist(), ends.tolist()):
+            if end - start >= self.min_char_width and len(segments[plate]) < self.max_chars:
+                segments[plate].append((start, end))
+        return segments
+
+    def characters(self, segments: list[list[tuple[int, int]]]) -> np.ndarray:
+        """
+        Cuts segmented characters out of the last processed batch.
+
+        Args:
+            segments (list[list[tuple[int, int]]]): The output of :meth:`segment`.
+
+        Returns:
+            np.ndarray: A float32 view of shape (M, char_h, char_w, 1), characters in plate order.
+        """
+        index = 0
+        for plate, plate_segments in enumerate(segments):
+            for start, end in plate_segments:
+                cv2.resize(
+                    self._gray[plate, :, start:end],
+                    self.char_size,
+                    dst=self._char_pixels[index],
+                    interpolation=cv2.INTER_AREA,
+                )
+                index += 1
+
+        chars = self._chars[:index]
+        np.multiply(
+            self._char_pixels[:index, ..., np.newaxis],
+            np.float32(1 / 255),
+            out=chars,
+            casting="unsafe",
+        )
+        return chars
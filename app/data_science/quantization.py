@@ -0,0 +1,56 @@
+from typing import Iterable
+
+import numpy as np
+
+
+def quantize_model(
+    keras_path: str,
+    output_path: str,
+    mode: str = "int8",
+    representative_data: Iterable[np.ndarray] = (),
+) -> int:
+    """
+    Converts a Keras model into a post-training quantized TFLite model.
+
+    Args:
+        keras_path (str): The path to the saved Keras model.
+        output_path (str): Where to write the ``.tflite`` file.
+        mode (str): ``int8`` for full integer quantization, ``float16`` for float16 weights.
+        representative_data (Iterable[np.ndarray]): Sample float32 inputs used to
+            calibrate activation ranges, required for ``int8``.
+
+    Returns:
+        int: The size of the written model in bytes.
+
+    Raises:
+        ValueError: If the mode is unknown or int8 calibration data is missing.
+    """
+    import tensorflow as tf
+    from keras.models import load_model
+
+    model = load_model(keras_path, compile=False)
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+
+    if mode == "float16":
+        converter.target_spec.supported_types = [tf.float16]
+    elif mode == "int8":
+        samples = list(representative_data)
+        if not samples:
+            raise ValueError("int8 quantization needs representative data")
+
+        def representative_dataset():
+            for sample in samples:
+                yield [np.asarray(sample, dtype=np.float32)[np.newaxis]]
+
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+    else:
+        raise ValueError(f"Unknown quantization mode: {mode}")
+
+    content = converter.convert()
+    with open(output_path, "wb") as file:
+        file.write(content)
+    return len(content)
@@ -0,0 +1,229 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Optional
+
+from app.core.config import settings
+
+
+class DropPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    LATEST_ONLY = "latest_only"
+
+
+@dataclass
+class Frame:
+    camera_id: str
+    image: Any
+    captured_at: float = field(default_factory=time.monotonic)
+    track_id: Optional[str] = None
+
+
+@dataclass
+class CameraStats:
+    submitted: int = 0
+    dropped: int = 0
+    processed: int = 0
+    depth: int = 0
+    lag: float = 0.0
+    max_lag: float = 0.0
+
+
+class CameraQueue:
+    """Bounded frame queue of a single camera.
+
+    Args:
+        camera_id (str): The ID of the camera.
+        maxsize (int): The maximum number of frames kept in the queue.
+        policy (DropPolicy): What to drop when the queue is full.
+        weight (int): How many frames this camera may hand over per scheduling round.
+    """
+
+    def __init__(self, camera_id: str, maxsize: int, policy: DropPolicy, weight: int = 1):
+        if policy is DropPolicy.LATEST_ONLY:
+            maxsize = 1
+        self.camera_id = camera_id
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+        self.weight = max(1, weight)
+        self.frames: deque[Frame] = deque()
+        self.stats = CameraStats()
+
+    def push(self, frame: Frame) -> bool:
+        """
+        Puts a frame into the queue, shedding load according to the drop policy.
+
+        Args:
+            frame (Frame): The frame to enqueue.
+
+        Returns:
+            bool: False if the given frame was dropped, True otherwise.
+        """
+        self.stats.submitted += 1
+        if len(self.frames) >= self.maxsize:
+            self.stats.dropped += 1
+            if self.policy is DropPolicy.DROP_NEWEST:
+                return False
+            self.frames.popleft()
+        self.frames.append(frame)
+        self.stats.depth = len(self.frames)
+        return True
+
+    def pop(self) -> Frame:
+        """
+        Takes the oldest frame from the queue and records its lag.
+
+        Returns:
+            Frame: The dequeued frame.
+        """
+        frame = self.frames.popleft()
+        lag = time.monotonic() - frame.captured_at
+        self.stats.depth = len(self.frames)
+        self.stats.lag = lag
+        self.stats.max_lag = max(self.stats.max_lag, lag)
+        return frame
+
+
+class FrameScheduler:
+    """
+    Fair scheduler between the gate cameras and the recognition stage.
+
+    Every camera owns a bounded queue, so a noisy camera only sheds its own frames.
+    Frames are dequeued in weighted round-robin order: a camera with weight ``n``
+    hands over up to ``n`` frames before the next camera gets its turn.
+
+    Args:
+        queue_size (int): The maximum number of pending frames per camera.
+        drop_policy (DropPolicy): What to drop when a camera queue is full.
+        weights (dict[str, int]): Scheduling weights by camera ID, 1 by default.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = settings.RECOGNITION_QUEUE_SIZE,
+        drop_policy: DropPolicy = DropPolicy(settings.RECOGNITION_DROP_POLICY),
+        weights: Optional[dict[str, int]] = None,
+    ):
+        self.queue_size = queue_size
+        self.drop_policy = DropPolicy(drop_policy)
+        self.weights = dict(settings.RECOGNITION_CAMERA_WEIGHTS if weights is None else weights)
+        self._queues: dict[str, CameraQueue] = {}
+        self._order: list[str] = []
+        self._cursor = 0
+        self._credit = 0
+        self._pending = 0
+        self._ready = asyncio.Event()
+
+    def register_camera(self, camera_id: str, weight: Optional[int] = None) -> CameraQueue:
+        """
+        Registers a camera, or returns its queue if it is already known.
+
+        Args:
+            camera_id (str): The ID of the camera.
+            weight (Optional[int]): The scheduling weight, taken from the settings if omitted.
+
+        Returns:
+            CameraQueue: The queue of the camera.
+        """
+        queue = self._queues.get(camera_id)
+        if queue is None:
+            if weight is None:
+                weight = self.weights.get(camera_id, 1)
+            queue = CameraQueue(camera_id, self.queue_size, self.drop_policy, weight)
+            self._queues[camera_id] = queue
+            self._order.append(camera_id)
+            if len(self._order) == 1:
+                self._credit = queue.weight
+        return queue
+
+    def submit(self, frame: Frame) -> bool:
+        """
+        Enqueues a frame without blocking the producer.
+
+        Args:
+            frame (Frame): The frame coming from a camera.
+
+        Returns:
+            bool: False if the frame was dropped right away, True otherwise.
+        """
+        queue = self.register_camera(frame.camera_id)
+        before = len(queue.frames)
+        accepted = queue.push(frame)
+        self._pending += len(queue.frames) - before
+        self._ready.set()
+        return accepted
+
+    def _advance(self):
+        self._cursor = (self._cursor + 1) % len(self._order)
+        self._credit = self._queues[self._order[self._cursor]].weight
+
+    def _pop_next(self) -> Optional[Frame]:
+        for _ in range(len(self._order) + 1):
+            queue = self._queues[self._order[self._cursor]]
+            if queue.frames and self._credit > 0:
+                self._credit -= 1
+                self._pending -= 1
+                return queue.pop()
+            self._advance()
+        return None
+
+    async def next_batch(self, max_size: int = 1) -> list[Frame]:
+        """
+        Waits for pending frames and takes up to ``max_size`` of them in fair order.
+
+        Args:
+            max_size (int): The maximum number of frames in the batch.
+
+        Returns:
+            list[Frame]: The frames to pass to the inference stage.
+        """
+        while not self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+
+        batch = []
+        while len(batch) < max_size:
+            frame = self._pop_next()
+            if frame is None:
+                break
+            batch.append(frame)
+        return batch
+
+    async def run(
+        self,
+        process_batch: Callable[[list[Frame]], list],
+        on_result: Optional[Callable[[Frame, Any], Awaitable[None]]] = None,
+        batch_size: int = 1,
+    ):
+        """
+        Feeds frames into the inference stage until the task is cancelled.
+
+        The stage is synchronous, so every batch runs in the default executor
+        to keep the event loop responsive.
+
+        Args:
+            process_batch (Callable): Takes a list of frames and returns one result per frame,
+                such as :meth:`RecognitionPipeline.process_batch`.
+            on_result (Optional[Callable]): Coroutine called with each frame and its result.
+            batch_size (int): The maximum number of frames per inference call.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self.next_batch(batch_size)
+            results = await loop.run_in_executor(None, process_batch, batch)
+            for frame, result in zip(batch, results):
+                self._queues[frame.camera_id].stats.processed += 1
+                if on_result is not None:
+                    await on_result(frame, result)
+
+    def stats(self) -> dict[str, CameraStats]:
+        """
+        Returns the counters of every camera.
+
+        Returns:
+            dict[str, CameraStats]: Submitted, dropped and processed frames, queue depth and lag by camera ID.
+        """
+        return {camera_id: queue.stats for camera_id, queue in self._queues.items()}
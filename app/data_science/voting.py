@@ -0,0 +1,152 @@
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.data_science.character_recogniser import ALPHABET, PlateRead
+
+_MIN_PROBABILITY = 1e-6
+
+
+@dataclass
+class VoteResult:
+    text: str
+    confidence: float
+    frames: int
+
+
+@dataclass
+class TrackVotes:
+    frames: int = 0
+    log_probabilities: dict[int, np.ndarray] = field(default_factory=dict)
+    length_votes: dict[int, int] = field(default_factory=dict)
+    result: Optional[VoteResult] = None
+    last_seen: float = field(default_factory=time.monotonic)
+
+
+class PlateVoter:
+    """
+    Combines the reads of one vehicle across consecutive frames.
+
+    For every track, per-character log-probabilities are summed over frames that
+    read the same number of characters, which gives the per-position posterior of
+    every character. Once the most likely plate reaches the confidence threshold,
+    the track is finalized and :meth:`should_recognize` tells the caller to stop
+    sending its frames to the recognizer.
+
+    Args:
+        threshold (float): The plate confidence needed to finalize a track.
+        min_frames (int): The minimum number of reads before finalizing.
+        max_frames (int): After this many reads the best guess is final anyway.
+        track_ttl (float): Seconds after which an idle track is forgotten.
+    """
+
+    def __init__(
+        self,
+        threshold: float = settings.VOTING_CONFIDENCE,
+        min_frames: int = settings.VOTING_MIN_FRAMES,
+        max_frames: int = settings.VOTING_MAX_FRAMES,
+        track_ttl: float = settings.VOTING_TRACK_TTL,
+    ):
+        self.threshold = threshold
+        self.min_frames = min_frames
+        self.max_frames = max_frames
+        self.track_ttl = track_ttl
+        self._tracks: dict[str, TrackVotes] = {}
+
+    def should_recognize(self, track_id: str) -> bool:
+        """
+        Tells whether frames of the track still need the recognizer.
+
+        Args:
+            track_id (str): The ID of the vehicle track.
+
+        Returns:
+            bool: False once the plate of the track is final.
+        """
+        track = self._tracks.get(track_id)
+        if track is None:
+            return True
+        track.last_seen = time.monotonic()
+        return track.result is None
+
+    def result(self, track_id: str) -> Optional[VoteResult]:
+        track = self._tracks.get(track_id)
+        return track.result if track is not None else None
+
+    def estimate(self, track: TrackVotes) -> VoteResult:
+        """
+        Returns the most likely plate of a track given the reads so far.
+
+        Args:
+            track (TrackVotes): The accumulated votes.
+
+        Returns:
+            VoteResult: The plate, its confidence and the number of reads.
+        """
+        length = max(track.length_votes, key=track.length_votes.get)
+        length_share = track.length_votes[length] / track.frames
+        if length == 0:
+            return VoteResult("", 0.0, track.frames)
+
+        log_probabilities = track.log_probabilities[length]
+        posterior = np.exp(log_probabilities - log_probabilities.max(axis=1, keepdims=True))
+        posterior /= posterior.sum(axis=1, keepdims=True)
+        labels = posterior.argmax(axis=1)
+        confidence = float(np.prod(posterior[np.arange(length), labels])) * length_share
+        text = "".join(ALPHABET[label] for label in labels)
+        return VoteResult(text, confidence, track.frames)
+
+    def add(self, track_id: str, read: PlateRead) -> Optional[VoteResult]:
+        """
+        Adds the read of one frame to its track.
+
+        Args:
+            track_id (str): The ID of the vehicle track.
+            read (PlateRead): The recognizer output for the frame.
+
+        Returns:
+            Optional[VoteResult]: The final plate if this read finalized the track, None otherwise.
+        """
+        track = self._tracks.setdefault(track_id, TrackVotes())
+        track.last_seen = time.monotonic()
+        if track.result is not None:
+            return None
+
+        length = len(read.text)
+        track.frames += 1
+        track.length_votes[length] = track.length_votes.get(length, 0) + 1
+        if length:
+            log_probabilities = np.log(np.maximum(read.probabilities, _MIN_PROBABILITY))
+            if length in track.log_probabilities:
+                track.log_probabilities[length] += log_probabilities
+            else:
+                track.log_probabilities[length] = log_probabilities.astype(np.float64)
+
+        estimate = self.estimate(track)
+        confident = track.frames >= self.min_frames and estimate.confidence >= self.threshold
+        if confident or track.frames >= self.max_frames:
+            track.result = estimate
+            return estimate
+        return None
+
+    def expire(self, now: Optional[float] = None) -> list[str]:
+        """
+        Forgets tracks that have not been seen for ``track_ttl`` seconds.
+
+        Args:
+            now (Optional[float]): The current monotonic time.
+
+        Returns:
+            list[str]: The IDs of the forgotten tracks.
+        """
+        now = time.monotonic() if now is None else now
+        expired = [
+            track_id for track_id, track in self._tracks.items()
+            if now - track.last_seen > self.track_ttl
+        ]
+        for track_id in expired:
+            del self._tracks[track_id]
+        return expired
@@ -1,12 +1,35 @@
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from app.core.config import settings
+from app.db.pool import InstrumentedPool
+from app.db.profiler import instrument
 
 DATABASE_URL = settings.DATABASE_URL
 if DATABASE_URL is None:
     raise ValueError("DATABASE_URL is not set in the environment variables")
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+
+def make_engine(url: str):
+    # The asyncpg dialect reads the size of its prepared statement cache from the URL.
+    url = make_url(url).update_query_dict(
+        {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+    )
+    engine = create_async_engine(
+        url,
+        echo=False,
+        poolclass=InstrumentedPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    instrument(engine.sync_engine)
+    return engine
+
+
+engine = make_engine(DATABASE_URL)
 
 async_session = async_sessionmaker(engine, expire_on_commit=False)
 
@@ -0,0 +1,136 @@
+import time
+from typing import NamedTuple, Optional
+
+import asyncpg
+
+from app.core.config import settings
+from app.db.listener import asyncpg_dsn
+from app.db.profiler import record_query
+
+
+class UserRecord:
+    __slots__ = ("id", "name", "email", "hashed_password", "is_admin", "is_active")
+
+    def __init__(self, id, name, email, hashed_password, is_admin, is_active):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.hashed_password = hashed_password
+        self.is_admin = is_admin
+        self.is_active = is_active
+
+
+class CommentRecord:
+    __slots__ = ("id", "owner_id", "description", "license_plate", "created_at", "status")
+
+    def __init__(self, id, owner_id, description, license_plate, created_at, status):
+        self.id = id
+        self.owner_id = owner_id
+        self.description = description
+        self.license_plate = license_plate
+        self.created_at = created_at
+        self.status = status
+
+
+class Query(NamedTuple):
+    sql: str
+    record: type
+
+
+# Columns are listed in the order of the record's constructor arguments.
+QUERIES = {
+    "user_by_email": Query(
+        "SELECT id, name, email, hashed_password, is_admin, is_active FROM users WHERE email = $1",
+        UserRecord,
+    ),
+    "comment_by_id": Query(
+        "SELECT id, owner_id, description, license_plate, created_at, status FROM comments WHERE id = $1",
+        CommentRecord,
+    ),
+}
+
+
+class FastPathConnection(asyncpg.Connection):
+    __slots__ = ("statements",)
+
+
+class FastPath:
+    """
+    Runs the hottest read queries directly on asyncpg, bypassing the ORM.
+
+    Every connection of the pool prepares all statements in :data:`QUERIES` once
+    when it is opened; a query then costs one bind/execute round trip and the
+    construction of a ``__slots__`` record, without statement compilation, ORM
+    hydration or an identity map. Records are plain read-only values: they are
+    not attached to any session.
+
+    Args:
+        url (str): The SQLAlchemy database URL.
+        min_size (int): Connections opened at start.
+        max_size (int): The pool size.
+    """
+
+    def __init__(
+        self,
+        url: str = settings.DATABASE_URL,
+        min_size: int = settings.FASTPATH_POOL_SIZE,
+        max_size: int = settings.FASTPATH_POOL_SIZE,
+    ):
+        self.url = url
+        self.min_size = min_size
+        self.max_size = max_size
+        self._pool: Optional[asyncpg.Pool] = None
+
+    @property
+    def available(self) -> bool:
+        return self._pool is not None
+
+    @staticmethod
+    async def _prepare(connection: FastPathConnection):
+        connection.statements = {name: await connection.prepare(query.sql) for name, query in QUERIES.items()}
+
+    async def start(self):
+        """Opens the pool; until then, :attr:`available` is False."""
+        if self._pool is None:
+            self._pool = await asyncpg.create_pool(
+                asyncpg_dsn(self.url),
+                min_size=self.min_size,
+                max_size=self.max_size,
+                connection_class=FastPathConnection,
+                init=self._prepare,
+            )
+
+    async def close(self):
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+
+    async def fetch_one(self, name: str, *args):
+        """
+        Runs a registered query that returns at most one row.
+
+        Args:
+            name (str): The name of the query in :data:`QUERIES`.
+            *args: The query parameters.
+
+        Returns:
+            The record, or None if no row matched.
+        """
+        started = time.perf_counter()
+        async with self._pool.acquire() as connection:
+            row = await connection.statements[name].fetchrow(*args)
+        record_query(QUERIES[name].sql, time.perf_counter() - started, int(row is not None))
+        return None if row is None else QUERIES[name].record(*row)
+
+    async def fetch_all(self, name: str, *args) -> list:
+        """Runs a registered query and returns a record per row."""
+        started = time.perf_counter()
+        async with self._pool.acquire() as connection:
+            rows = await connection.statements[name].fetch(*args)
+        record_query(QUERIES[name].sql, time.perf_counter() - started, len(rows))
+        record = QUERIES[name].record
+        return [record(*row) for row in rows]
+
+
+fastpath = FastPath()
+
@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import uuid
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+Handler = Callable[[str], None]
+
+# Lets a worker recognize, and skip, the notifications it sent itself.
+WORKER_ID = uuid.uuid4().hex
+
+
+def asyncpg_dsn(url: str) -> str:
+    """Turns an SQLAlchemy database URL into a DSN that asyncpg accepts."""
+    return make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+async def notify(session: AsyncSession, channel: str, payload: str):
+    """
+    Queues a notification on the session's transaction.
+
+    Postgres delivers it to all listeners when the transaction commits, and drops
+    it on rollback, so workers never hear about changes that did not happen.
+
+    Args:
+        session (AsyncSession): The session of the current unit of work.
+        channel (str): The channel name.
+        payload (str): The message, under 8000 bytes.
+    """
+    await session.execute(select(func.pg_notify(channel, payload)))
+
+
+class PgListener:
+    """
+    Keeps one dedicated connection per worker that LISTENs on Postgres channels.
+
+    Handlers run on the event loop for every notification of their channel. The
+    connection is reopened after failures; handlers registered with
+    :meth:`on_reconnect` run after each reconnection, because notifications sent
+    while disconnected are lost.
+
+    Args:
+        url (str): The SQLAlchemy database URL.
+        reconnect_delay (float): Seconds to wait before reconnecting.
+    """
+
+    def __init__(
+        self,
+        url: str = settings.DATABASE_URL,
+        reconnect_delay: float = settings.PG_LISTENER_RECONNECT_DELAY,
+    ):
+        self.url = url
+        self.reconnect_delay = reconnect_delay
+        self._handlers: dict[str, list[Handler]] = {}
+        self._reconnect_handlers: list[Callable[[], Awaitable[None]]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def listen(self, channel: str, handler: Handler):
+        """Registers a handler for a channel. Call before :meth:`start`."""
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def on_reconnect(self, handler: Callable[[], Awaitable[None]]):
+        """Registers a coroutine function to run after the connection was lost and reopened."""
+        self._reconnect_handlers.append(handler)
+
+    def _dispatch(self, connection, pid: int, channel: str, payload: str):
+        for handler in self._handlers.get(channel, ()):
+            try:
+                handler(payload)
+            except Exception as e:
+                logging.error(f"Error handling notification on {channel}: {e}")
+
+    async def _run(self):
+        import asyncpg
+
+        connected_before = False
+        while True:
+            try:
+                connection = await asyncpg.connect(asyncpg_dsn(self.url))
+            except Exception as e:
+                logging.error(f"Error connecting the notification listener: {e}")
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _: closed.set())
+            try:
+                for channel in self._handlers:
+                    await connection.add_listener(channel, self._dispatch)
+                if connected_before:
+                    for handler in self._reconnect_handlers:
+                        await handler()
+                connected_before = True
+                await closed.wait()
+            except asyncio.CancelledError:
+                await connection.close()
+                raise
+            except Exception as e:
+                logging.error(f"Notification listener failed: {e}")
+                connection.terminate()
+            await asyncio.sleep(self.reconnect_delay)
+
+    def start(self):
+        """Starts listening in a background task on the running loop."""
+        if self._task is None and self._handlers:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stops listening and closes the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+pg_listener = PgListener()
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Connection pool that records how long checkouts take.
+
+    A checkout covers waiting for a free connection, opening a new one within
+    the overflow, and the pre-ping, i.e. everything a request waits for before
+    its first statement runs.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait = time.perf_counter() - started
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "mean_wait_ms": self.total_wait / self.checkouts * 1000 if self.checkouts else 0.0,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+def pool_stats(engine: AsyncEngine) -> dict:
+    """Returns the live statistics of an engine's pool."""
+    pool = engine.sync_engine.pool
+    if isinstance(pool, InstrumentedPool):
+        return pool.stats()
+    return {"status": pool.status()}
+
+
+async def warm_up(
+    engine: AsyncEngine,
+    size: int,
+    prepare: Callable[[AsyncConnection], Awaitable[None]],
+):
+    """
+    Opens ``size`` connections at once and runs ``prepare`` on each.
+
+    All connections are held until every one is open, so the pool really ends up
+    with ``size`` distinct connections, each with the prepared statements that
+    ``prepare`` executed in its statement cache.
+
+    Args:
+        engine (AsyncEngine): The engine whose pool to fill.
+        size (int): The number of connections, at most the pool size.
+        prepare (Callable[[AsyncConnection], Awaitable[None]]): Runs the hot statements on a connection.
+    """
+    if size < 1:
+        return
+
+    # Every connection stays checked out until all are open, so none is handed out twice.
+    opened = await asyncio.gather(*(engine.connect() for _ in range(size)), return_exceptions=True)
+    connections = [result for result in opened if not isinstance(result, BaseException)]
+    try:
+        prepared = await asyncio.gather(*(prepare(connection) for connection in connections), return_exceptions=True)
+    finally:
+        await asyncio.gather(*(connection.close() for connection in connections), return_exceptions=True)
+
+    errors = [result for result in (*opened, *prepared) if isinstance(result, BaseException)]
+    if errors:
+        logging.error(f"Warmed up {size - len(errors)} of {size} connections: {errors[0]}")
@@ -0,0 +1,187 @@
+import contextvars
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.db.slow_queries import slow_query_log
+
+
+class QueryRecord:
+    __slots__ = ("statement", "duration", "rows")
+
+    def __init__(self, statement: str, duration: float, rows: Optional[int]):
+        self.statement = statement
+        self.duration = duration
+        self.rows = rows
+
+
+class QueryProfile:
+    """
+    The statements run on behalf of one request, or one block of a test.
+
+    Statements are grouped by their SQL text, which holds placeholders instead of
+    values: the same text run many times in one request is usually a query in a
+    loop, one per row of an earlier result (the N+1 pattern).
+    """
+
+    def __init__(self):
+        self.queries: list[QueryRecord] = []
+
+    def __len__(self) -> int:
+        return len(self.queries)
+
+    @property
+    def total_time(self) -> float:
+        return sum(query.duration for query in self.queries)
+
+    def repeated(self, threshold: int = settings.N_PLUS_ONE_THRESHOLD) -> list[tuple[str, int]]:
+        """
+        Lists the statement shapes run at least ``threshold`` times.
+
+        Args:
+            threshold (int): The number of runs from which a shape is reported.
+
+        Returns:
+            list[tuple[str, int]]: Statements with their run counts, most frequent first.
+        """
+        counts = Counter(query.statement for query in self.queries)
+        return [(statement, count) for statement, count in counts.most_common() if count >= threshold]
+
+
+# The profile of the request being served, set by SQLProfilerMiddleware.
+current_profile: contextvars.ContextVar[Optional[QueryProfile]] = contextvars.ContextVar(
+    "current_profile", default=None
+)
+
+
+def record_query(statement: str, duration: float, rows: Optional[int] = None):
+    """Adds a statement to the current profile, if there is one."""
+    profile = current_profile.get()
+    if profile is not None:
+        profile.queries.append(QueryRecord(statement, duration, rows))
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_started"].pop()
+    if current_profile.get() is not None:
+        # Drivers report -1 when they do not know the row count.
+        rows = cursor.rowcount if cursor.rowcount >= 0 else None
+        record_query(statement, duration, rows)
+    slow_query_log.observe(conn, statement, parameters, duration)
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute.
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def instrument(engine: Engine):
+    """Records every statement an engine runs into the current profile and the slow query log."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+@contextmanager
+def profile_queries():
+    """
+    Collects the statements run inside the block, on this task and the ones it starts.
+
+    Yields:
+        QueryProfile: The profile, filled as statements run.
+    """
+    profile = QueryProfile()
+    token = current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        current_profile.reset(token)
+
+
+@contextmanager
+def assert_max_queries(limit: int):
+    """
+    Fails if the block runs more than ``limit`` statements.
+
+    Example::
+
+        with assert_max_queries(2):
+            client.get("/black_list/")
+
+    Args:
+        limit (int): The largest acceptable number of statements.
+
+    Yields:
+        QueryProfile: The profile of the block.
+
+    Raises:
+        AssertionError: If more statements ran, listing them.
+    """
+    with profile_queries() as profile:
+        yield profile
+    if len(profile) > limit:
+        statements = "\n".join(f"  {query.statement}" for query in profile.queries)
+        raise AssertionError(f"{len(profile)} queries ran, expected at most {limit}:\n{statements}")
+
+
+class SQLProfilerMiddleware:
+    """
+    Profiles the SQL of every HTTP request.
+
+    Requests that repeat one statement shape ``threshold`` times or more are
+    logged as likely N+1 queries. In debug mode, responses carry the number of
+    statements in ``X-DB-Queries`` and their total time in milliseconds in
+    ``X-DB-Time``.
+
+    Args:
+        app: The ASGI application.
+        debug (bool): Whether to add the headers.
+        threshold (int): The number of runs of one statement that is reported.
+    """
+
+    def __init__(self, app, debug: bool = settings.DEBUG, threshold: int = settings.N_PLUS_ONE_THRESHOLD):
+        self.app = app
+        self.debug = debug
+        self.threshold = threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile()
+        token = current_profile.set(profile)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                self._report(scope, profile)
+                if self.debug:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-db-queries", str(len(profile)).encode()))
+                    headers.append((b"x-db-time", f"{profile.total_time * 1000:.2f}".encode()))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            current_profile.reset(token)
+
+    def _report(self, scope, profile: QueryProfile):
+        for statement, count in profile.repeated(self.threshold):
+            logging.warning(
+                f"Likely N+1 in {scope['method']} {scope['path']}: "
+                f"{count} runs of {' '.join(statement.split())[:200]}"
+            )
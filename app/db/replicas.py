@@ -0,0 +1,232 @@
+import asyncio
+import contextvars
+import itertools
+import logging
+import time
+from http.cookies import SimpleCookie
+from typing import Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import async_session, make_engine
+
+# The user the current request acts for, set once the token has been checked.
+current_user_id: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar("current_user_id", default=None)
+
+# Name of the cookie that keeps a client on the primary after it wrote, on any worker.
+PIN_COOKIE = "primary_until"
+
+
+class RequestPin:
+    """The wall-clock time until which the current client reads from the primary; 0 if it does not."""
+
+    __slots__ = ("until", "renewed")
+
+    def __init__(self, until: float = 0.0):
+        self.until = until
+        self.renewed = False
+
+
+# The pin of the request being served, kept by ReadYourWritesMiddleware.
+current_pin: contextvars.ContextVar[Optional[RequestPin]] = contextvars.ContextVar("current_pin", default=None)
+
+# Key in ``Session.info`` of sessions on a replica, whose reads may lag behind the primary.
+REPLICA = "replica"
+
+# Key in ``Session.info`` set once the session's transaction has written anything.
+WROTE = "wrote"
+
+# Time since the last replayed transaction only measures lag while WAL is waiting to be
+# replayed; once the replica has replayed all it received, it is caught up however idle
+# the primary is.
+_REPLICATION_LAG = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE coalesce(extract(epoch FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class Replica:
+    def __init__(self, url: str):
+        self.engine = make_engine(url)
+        self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False, info={REPLICA: True})
+        self.name = self.engine.url.render_as_string(hide_password=True)
+        self.healthy = True
+        self.lag = 0.0
+
+
+class ReplicaRouter:
+    """
+    Picks the database that read-only units of work use.
+
+    Healthy replicas are used in turn; a replica that fails its health check or
+    falls too far behind the primary is skipped until it recovers. Clients who
+    wrote in the last ``pin_window`` seconds are kept on the primary, so they
+    see their own writes: the worker that served the write remembers the user,
+    and :class:`ReadYourWritesMiddleware` hands the client a cookie that every
+    worker honours. Without healthy replicas, everything goes to the primary.
+
+    Args:
+        urls (list[str]): The SQLAlchemy URLs of the replicas.
+        pin_window (float): How long a writer stays on the primary, in seconds.
+        max_lag (float): The replication lag in seconds above which a replica is skipped.
+    """
+
+    def __init__(
+        self,
+        urls: list[str] = settings.DATABASE_REPLICA_URLS,
+        pin_window: float = settings.READ_YOUR_WRITES_WINDOW,
+        max_lag: float = settings.REPLICA_MAX_LAG,
+    ):
+        self.replicas = [Replica(url) for url in urls]
+        self.pin_window = pin_window
+        self.max_lag = max_lag
+        self._turns = itertools.cycle(range(len(self.replicas))) if self.replicas else None
+        self._pinned: dict[int, float] = {}
+        self._pruned = time.monotonic()
+
+    def pin(self, user_id: Optional[int]):
+        """Keeps the current client's and user's reads on the primary for the next ``pin_window`` seconds."""
+        if not self.replicas:
+            return
+        pin = current_pin.get()
+        if pin is not None:
+            pin.until = time.time() + self.pin_window
+            pin.renewed = True
+        if user_id is not None:
+            now = time.monotonic()
+            self._pinned[user_id] = now + self.pin_window
+            if now - self._pruned > self.pin_window:
+                self.prune(now)
+
+    def prune(self, now: Optional[float] = None):
+        """Forgets the users whose pin has expired."""
+        now = time.monotonic() if now is None else now
+        self._pinned = {user_id: until for user_id, until in self._pinned.items() if until >= now}
+        self._pruned = now
+
+    def is_pinned(self, user_id: Optional[int]) -> bool:
+        pin = current_pin.get()
+        if pin is not None and pin.until > time.time():
+            return True
+        if user_id is None:
+            return False
+        until = self._pinned.get(user_id)
+        if until is None:
+            return False
+        if until < time.monotonic():
+            del self._pinned[user_id]
+            return False
+        return True
+
+    def session_factory(self, user_id: Optional[int] = None) -> async_sessionmaker:
+        """
+        Returns the session factory for a read-only unit of work.
+
+        Args:
+            user_id (Optional[int]): The user the reads are for, if known.
+
+        Returns:
+            async_sessionmaker: A healthy replica's factory, or the primary's.
+        """
+        if self._turns is None or self.is_pinned(user_id):
+            return async_session
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[next(self._turns)]
+            if replica.healthy:
+                return replica.session_factory
+        return async_session
+
+    async def check(self, replica: Replica):
+        """Probes one replica and updates its health."""
+        try:
+            async with replica.engine.connect() as connection:
+                replica.lag = float((await connection.execute(_REPLICATION_LAG)).scalar_one())
+            healthy = replica.lag <= self.max_lag
+        except Exception as e:
+            logging.error(f"Replica {replica.name} failed its health check: {e}")
+            healthy = False
+        if healthy != replica.healthy:
+            logging.warning(f"Replica {replica.name} is now {'healthy' if healthy else 'unhealthy'}")
+        replica.healthy = healthy
+
+    async def run_health_checks(self, interval: float = settings.REPLICA_HEALTH_INTERVAL):
+        """Probes all replicas every ``interval`` seconds, until cancelled."""
+        while self.replicas:
+            await asyncio.gather(*(self.check(replica) for replica in self.replicas))
+            await asyncio.sleep(interval)
+
+    def stats(self) -> list[dict]:
+        return [
+            {"replica": replica.name, "healthy": replica.healthy, "lag": replica.lag}
+            for replica in self.replicas
+        ]
+
+
+class ReadYourWritesMiddleware:
+    """
+    Carries the read-your-writes pin between requests, whichever worker serves them.
+
+    The pin arrives in the ``primary_until`` cookie as a Unix time. A request
+    that writes renews it, and the response sets the cookie to expire with it.
+
+    Args:
+        app: The ASGI application.
+        router (ReplicaRouter): The router whose pin window applies.
+    """
+
+    def __init__(self, app, router: ReplicaRouter):
+        self.app = app
+        self.router = router
+
+    @staticmethod
+    def _read(scope) -> float:
+        for name, value in scope.get("headers", ()):
+            if name == b"cookie":
+                morsel = SimpleCookie(value.decode("latin-1")).get(PIN_COOKIE)
+                if morsel is not None:
+                    try:
+                        return float(morsel.value)
+                    except ValueError:
+                        return 0.0
+        return 0.0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.router.replicas:
+            await self.app(scope, receive, send)
+            return
+
+        pin = RequestPin(self._read(scope))
+        token = current_pin.set(pin)
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and pin.renewed:
+                cookie = (
+                    f"{PIN_COOKIE}={pin.until:.3f}; Max-Age={max(int(self.router.pin_window), 1)}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message = {**message, "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode())]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            current_pin.reset(token)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_statement_write(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[WROTE] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flush_write(session: Session, flush_context):
+    if session.new or session.dirty or session.deleted:
+        session.info[WROTE] = True
+
+
+replica_router = ReplicaRouter()
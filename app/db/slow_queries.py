@@ -0,0 +1,170 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import random
+from logging.handlers import RotatingFileHandler
+from typing import Any, Optional
+
+import asyncpg
+
+from app.core.config import settings
+from app.db.listener import asyncpg_dsn
+
+# The repository method running the current statement, e.g. "UsersRepository.find_one".
+current_caller: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_caller", default=None)
+
+
+def traced(method):
+    """Marks the statements a repository coroutine runs with its class and name."""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        token = current_caller.set(f"{type(self).__name__}.{method.__name__}")
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            current_caller.reset(token)
+
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def trace_methods(cls):
+    """Applies :func:`traced` to the public coroutine methods a class defines."""
+    for name, method in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.iscoroutinefunction(method) and not hasattr(method, "__traced__"):
+            setattr(cls, name, traced(method))
+    return cls
+
+
+def redact(parameters: Any) -> Any:
+    """
+    Replaces bound values with their type names, so logs never hold user data.
+
+    Args:
+        parameters (Any): The parameters as passed to the driver.
+
+    Returns:
+        Any: The same structure with ``<type>`` in place of every value.
+    """
+    if isinstance(parameters, dict):
+        return {key: f"<{type(value).__name__}>" for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return f"<{len(parameters)} parameter sets>"
+        return [f"<{type(value).__name__}>" for value in parameters]
+    return parameters
+
+
+class SlowQueryLog:
+    """
+    Logs statements slower than a threshold and samples their plans.
+
+    Every slow statement is logged with its parameters redacted and the
+    repository method that ran it. A share of the slow ``SELECT`` statements on
+    Postgres is run once more under ``EXPLAIN (ANALYZE, BUFFERS)``, on a separate
+    connection in a read-only transaction, and the plan is appended to a rotating
+    file. Only one plan is captured at a time; slow statements that arrive
+    meanwhile are not explained. Other statements are never replayed, since
+    ``ANALYZE`` executes them.
+
+    Args:
+        threshold (float): The duration in seconds from which a statement is slow.
+        explain_rate (float): The share of slow statements explained, from 0 to 1.
+        path (str): The file plans are written to.
+        max_bytes (int): The size at which the file is rotated.
+        backups (int): The number of rotated files kept.
+    """
+
+    def __init__(
+        self,
+        threshold: float = settings.SLOW_QUERY_THRESHOLD,
+        explain_rate: float = settings.SLOW_QUERY_EXPLAIN_RATE,
+        path: str = settings.SLOW_QUERY_PLAN_FILE,
+        max_bytes: int = settings.SLOW_QUERY_PLAN_FILE_SIZE,
+        backups: int = settings.SLOW_QUERY_PLAN_FILE_BACKUPS,
+    ):
+        self.threshold = threshold
+        self.explain_rate = explain_rate
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._plans: Optional[logging.Logger] = None
+        self._explaining = False
+        self.slow = 0
+        self.explained = 0
+
+    def _plan_logger(self) -> logging.Logger:
+        if self._plans is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            handler = RotatingFileHandler(self.path, maxBytes=self.max_bytes, backupCount=self.backups)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            plans = logging.getLogger("app.slow_query_plans")
+            plans.addHandler(handler)
+            plans.setLevel(logging.INFO)
+            plans.propagate = False
+            self._plans = plans
+        return self._plans
+
+    def should_explain(self, statement: str, dialect: str) -> bool:
+        if self._explaining or dialect != "postgresql":
+            return False
+        if not statement.lstrip().upper().startswith("SELECT"):
+            return False
+        return random.random() < self.explain_rate
+
+    def observe(self, conn, statement: str, parameters: Any, duration: float):
+        """
+        Checks a statement that has just run; called for every statement.
+
+        Args:
+            conn: The SQLAlchemy connection it ran on.
+            statement (str): The SQL text as sent to the driver.
+            parameters (Any): The parameters as sent to the driver.
+            duration (float): How long it took, in seconds.
+        """
+        if duration < self.threshold:
+            return
+        self.slow += 1
+        caller = current_caller.get() or "unknown caller"
+        logging.warning(
+            f"Slow query ({duration * 1000:.0f} ms) from {caller}: "
+            f"{' '.join(statement.split())} parameters={redact(parameters)}"
+        )
+        if self.should_explain(statement, conn.dialect.name):
+            self._explaining = True
+            url = conn.engine.url.set(query={}).render_as_string(hide_password=False)
+            asyncio.get_running_loop().create_task(self.explain(url, statement, parameters, caller, duration))
+
+    async def explain(self, url: str, statement: str, parameters: Any, caller: str, duration: float):
+        """Runs a statement under ``EXPLAIN (ANALYZE, BUFFERS)`` and writes the plan."""
+        try:
+            connection = await asyncpg.connect(
+                asyncpg_dsn(url),
+                server_settings={"statement_timeout": str(int(settings.SLOW_QUERY_EXPLAIN_TIMEOUT * 1000))},
+            )
+            try:
+                async with connection.transaction(readonly=True):
+                    rows = await connection.fetch(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", *(parameters or ()))
+            finally:
+                await connection.close()
+            plan = "\n".join(row[0] for row in rows)
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                self._plan_logger().info,
+                f"{caller} took {duration * 1000:.0f} ms\n{' '.join(statement.split())}\n{plan}\n",
+            )
+            self.explained += 1
+        except Exception as e:
+            logging.error(f"Error explaining a slow query from {caller}: {e}")
+        finally:
+            self._explaining = False
+
+    def stats(self) -> dict:
+        return {"threshold": self.threshold, "slow": self.slow, "explained": self.explained}
+
+
+slow_query_log = SlowQueryLog()
@@ -1,9 +1,134 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 
+from app.core.config import settings
+from app.db.database import engine
+from app.db.fastpath import fastpath
+from app.db.listener import pg_listener
+from app.db.pool import warm_up
+from app.db.profiler import SQLProfilerMiddleware
+from app.db.replicas import ReadYourWritesMiddleware, replica_router
 from app.routers.all import all_routers
+from app.services.comments import CommentService
+from app.services.auth import auth_service
+from app.services.parking import PARKING_SESSIONS_CHANNEL, ParkingService, active_sessions
+from app.utils.frame_store import frame_store
+from app.utils.invalidation import INVALIDATION_CHANNEL, invalidation_bus
+from app.utils.metrics import MetricsMiddleware, metrics
+from app.utils.occupancy import OCCUPANCY_CHANNEL, occupancy
+from app.utils.plate_index import PLATES_CHANNEL, plate_index
+from app.utils.unitofwork import UnitOfWork, prepare_hot_statements
+from app.utils.watchdog import WatchdogMiddleware, loop_watchdog
+
+
+async def reconcile_occupancy():
+    while True:
+        try:
+            await ParkingService.reconcile_occupancy(UnitOfWork())
+        except Exception as e:
+            logging.error(f"Error reconciling parking occupancy: {e}")
+        await asyncio.sleep(settings.OCCUPANCY_RECONCILE_INTERVAL)
+
+
+# Notifications missed while the listener was disconnected are recovered from the database.
+async def reconcile_occupancy_on_reconnect():
+    await ParkingService.reconcile_occupancy(UnitOfWork())
+
+
+async def rebuild_session_index_on_reconnect():
+    await ParkingService.rebuild_index(UnitOfWork())
+
+
+async def rebuild_plate_index_on_reconnect():
+    await CommentService.rebuild_plate_index(UnitOfWork())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.WATCHDOG_ENABLED:
+        loop_watchdog.start()
+    if settings.DB_POOL_WARMUP:
+        for pool_engine in (engine, *(replica.engine for replica in replica_router.replicas)):
+            await warm_up(pool_engine, settings.DB_POOL_SIZE, prepare_hot_statements)
+    if settings.FASTPATH_ENABLED:
+        try:
+            await fastpath.start()
+        except Exception as e:
+            logging.error(f"Error starting the fast path pool, falling back to the ORM: {e}")
+
+    try:
+        await CommentService.rebuild_plate_index(UnitOfWork())
+    except Exception as e:
+        logging.error(f"Error building the license plate index: {e}")
+    try:
+        await ParkingService.rebuild_index(UnitOfWork())
+    except Exception as e:
+        logging.error(f"Error building the parking session index: {e}")
+
+    if settings.MODEL_WARMUP:
+        from app.data_science.character_recogniser import character_recognizer
+        from app.data_science.detector import detector
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, detector.warmup)
+        await loop.run_in_executor(None, character_recognizer.warmup)
+
+    pg_listener.listen(OCCUPANCY_CHANNEL, occupancy.handle_notification)
+    pg_listener.listen(PARKING_SESSIONS_CHANNEL, active_sessions.handle_notification)
+    pg_listener.listen(PLATES_CHANNEL, plate_index.handle_notification)
+    pg_listener.listen(INVALIDATION_CHANNEL, invalidation_bus.handle_notification)
+    pg_listener.on_reconnect(invalidation_bus.on_reconnect)
+    pg_listener.on_reconnect(reconcile_occupancy_on_reconnect)
+    pg_listener.on_reconnect(rebuild_session_index_on_reconnect)
+    pg_listener.on_reconnect(rebuild_plate_index_on_reconnect)
+    pg_listener.start()
+    reconciler = asyncio.create_task(reconcile_occupancy())
+    replica_checks = asyncio.create_task(replica_router.run_health_checks())
+    metrics_snapshots = asyncio.create_task(metrics.run())
+    yield
+    metrics_snapshots.cancel()
+    replica_checks.cancel()
+    reconciler.cancel()
+    await pg_listener.stop()
+    await fastpath.close()
+    frame_store.close()
+    loop_watchdog.stop()
+
+
+def pools() -> dict:
+    pool_engines = {"primary": engine, **{replica.name: replica.engine for replica in replica_router.replicas}}
+    return {name: pool_engine.sync_engine.pool for name, pool_engine in pool_engines.items()}
+
+
+metrics.gauge("db_pool_size", "Connections kept open by the pool.", lambda: {
+    name: pool.size() for name, pool in pools().items()}, label="pool")
+metrics.gauge("db_pool_checked_out", "Connections in use.", lambda: {
+    name: pool.checkedout() for name, pool in pools().items()}, label="pool")
+metrics.gauge("db_pool_overflow", "Connections open beyond the pool size.", lambda: {
+    name: pool.overflow() for name, pool in pools().items()}, label="pool")
+metrics.counter("db_pool_checkouts_total", "Connections handed out.", lambda: {
+    name: pool.checkouts for name, pool in pools().items()}, label="pool")
+metrics.counter("db_pool_timeouts_total", "Checkouts that gave up waiting.", lambda: {
+    name: pool.timeouts for name, pool in pools().items()}, label="pool")
+metrics.counter("db_pool_wait_seconds_total", "Time spent waiting for connections.", lambda: {
+    name: pool.total_wait for name, pool in pools().items()}, label="pool")
+metrics.gauge("event_loop_lag_seconds", "How late the event loop woke up a timer, in the slowest worker.",
+              lambda: loop_watchdog.lag, aggregate=max)
+metrics.counter("event_loop_blocks_total", "Times the event loop was blocked past the watchdog threshold.",
+                lambda: loop_watchdog.blocks)
+metrics.gauge("bcrypt_queue_depth", "Password checks waiting for or running on the bcrypt threads.",
+              lambda: auth_service.bcrypt_queue)
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(SQLProfilerMiddleware)
+app.add_middleware(ReadYourWritesMiddleware, router=replica_router)
+app.add_middleware(MetricsMiddleware, metrics=metrics)
+app.add_middleware(WatchdogMiddleware, watchdog=loop_watchdog)
 
 
 for router in all_routers:
@@ -3,6 +3,8 @@ from .users import User
 from .comments import Comment
 from .posts import Post
 from .black_list import BlackList
+from .parking import ParkingSession
+from .ledger import LedgerEntry, UserBalance
 
 __all__ = [
     "Base",
@@ -10,5 +12,8 @@ __all__ = [
     "Comment",
     "Post",
     "BlackList",
-    
+    "ParkingSession",
+    "LedgerEntry",
+    "UserBalance",
+
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import String, ForeignKey, Enum
+from sqlalchemy import String, ForeignKey, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 from enum import Enum as PyEnum
@@ -10,10 +10,17 @@ class CommentStatus(PyEnum):
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # Indexes behind the list filters of CommentsRepository.filterable.
+        Index("ix_comments_owner_id_created_at", "owner_id", "created_at"),
+        Index("ix_comments_status_created_at", "status", "created_at"),
+        Index("ix_comments_created_at", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     owner_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
     description: Mapped[str] = mapped_column(String(255), nullable=True)
+    license_plate: Mapped[str] = mapped_column(String(20), nullable=True, index=True)
     created_at: Mapped[datetime.datetime] = mapped_column(default=datetime.datetime.utcnow)
     status: Mapped[CommentStatus] = mapped_column(Enum(CommentStatus), default=CommentStatus.CREATED)
 
@@ -0,0 +1,40 @@
+import datetime
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, ForeignKey, Index, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class LedgerEntry(Base):
+    """
+    One money movement of a user. Rows are only ever inserted: payments are
+    positive, parking charges are negative, and corrections are new entries.
+    """
+    __tablename__ = "ledger_entries"
+    __table_args__ = (
+        # Keyset pagination of a user's history, newest first.
+        Index("ix_ledger_entries_user_id_id", "user_id", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    amount: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    kind: Mapped[str] = mapped_column(String(20), nullable=False)
+    # A session is charged at most once, however often settlement runs.
+    parking_session_id: Mapped[int] = mapped_column(
+        ForeignKey("parking_sessions.id"), nullable=True, unique=True
+    )
+    created_at: Mapped[datetime.datetime] = mapped_column(default=datetime.datetime.utcnow)
+
+
+class UserBalance(Base):
+    """
+    The running sum of a user's ledger entries, kept in step with every insert.
+    """
+    __tablename__ = "user_balances"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    balance: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False, default=0)
+    updated_at: Mapped[datetime.datetime] = mapped_column(default=datetime.datetime.utcnow)
@@ -0,0 +1,29 @@
+import datetime
+
+from sqlalchemy import ForeignKey, Index, String, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base
+
+
+class ParkingSession(Base):
+    __tablename__ = "parking_sessions"
+    __table_args__ = (
+        # At most one open session per plate; also serves "open session by plate" lookups.
+        Index(
+            "uq_parking_sessions_open_plate",
+            "license_plate",
+            unique=True,
+            postgresql_where=text("ended_at IS NULL"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    license_plate: Mapped[str] = mapped_column(String(20), nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=True)
+    started_at: Mapped[datetime.datetime] = mapped_column(default=datetime.datetime.utcnow)
+    ended_at: Mapped[datetime.datetime] = mapped_column(nullable=True)
+    entry_evidence: Mapped[str] = mapped_column(String(64), nullable=True)
+    exit_evidence: Mapped[str] = mapped_column(String(64), nullable=True)
+
+    user = relationship("User")
@@ -10,6 +10,8 @@ class CommentsRepository(SQLAlchemyRepository):
         SQLAlchemyRepository: Base repository class providing common database operations.
     """
     model = Comment
+    cache_entities = True
+    filterable = frozenset({"id", "owner_id", "license_plate", "status", "created_at"})
 
     async def find_by_owner_id(self, owner_id: int) -> list[Comment]:
         """Finds all comments associated with a specific owner ID.
@@ -23,3 +25,26 @@ class CommentsRepository(SQLAlchemyRepository):
         stmt = select(self.model).where(self.model.owner_id == owner_id)
         result = await self.session.execute(stmt)
         return result.scalars().all()
+
+    async def find_owner_id_by_license_plate(self, license_plate: str):
+        """Finds the owner of the car with the given license plate.
+
+        Args:
+            license_plate (str): The normalized license plate.
+
+        Returns:
+            Optional[int]: The ID of the owner, or None if the plate is unknown.
+        """
+        stmt = select(self.model.owner_id).where(self.model.license_plate == license_plate).limit(1)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_license_plates(self) -> list[str]:
+        """Retrieves all license plates known to the system.
+
+        Returns:
+            list[str]: The license plates.
+        """
+        stmt = select(self.model.license_plate).where(self.model.license_plate.is_not(None))
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
@@ -0,0 +1,137 @@
+import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import DateTime, Numeric, exists, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.ledger import LedgerEntry, UserBalance
+from app.models.parking import ParkingSession
+from app.utils.repositories import SQLAlchemyRepository
+
+
+class LedgerRepository(SQLAlchemyRepository):
+    """Repository class for the append-only ledger and the materialized balances.
+
+    Every statement that inserts ledger entries also folds their amounts into
+    ``user_balances`` within the same statement, so a balance never disagrees
+    with the history it summarizes. Timestamps are naive UTC from the
+    application clock, like those of parking sessions, never the database's
+    ``now()``, which follows the session time zone.
+
+    Inherits from:
+        SQLAlchemyRepository: Base repository class providing common database operations.
+    """
+    model = LedgerEntry
+
+    @staticmethod
+    def _apply_to_balances(entries, now: datetime.datetime):
+        """Builds the upsert that adds the amounts of an entries CTE to the balances."""
+        totals = select(
+            entries.c.user_id, func.sum(entries.c.amount), literal(now, DateTime)
+        ).group_by(entries.c.user_id)
+        stmt = pg_insert(UserBalance).from_select(["user_id", "balance", "updated_at"], totals)
+        return stmt.on_conflict_do_update(
+            index_elements=[UserBalance.user_id],
+            set_={
+                "balance": UserBalance.balance + stmt.excluded.balance,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(UserBalance.user_id, UserBalance.balance)
+
+    async def append(self, user_id: int, amount: Decimal, kind: str) -> Decimal:
+        """Appends one entry and updates the balance of its user.
+
+        Args:
+            user_id (int): The ID of the user.
+            amount (Decimal): The amount, positive for credit and negative for charges.
+            kind (str): The kind of the entry, e.g. ``payment``.
+
+        Returns:
+            Decimal: The balance of the user after the entry.
+        """
+        now = datetime.datetime.utcnow()
+        entries = (
+            insert(LedgerEntry)
+            .values(user_id=user_id, amount=amount, kind=kind, created_at=now)
+            .returning(LedgerEntry.user_id, LedgerEntry.amount)
+            .cte("entries")
+        )
+        result = await self.session.execute(self._apply_to_balances(entries, now))
+        return result.one().balance
+
+    async def settle_sessions(self, rate: Decimal, session_ids: Optional[list[int]] = None) -> list:
+        """Charges closed parking sessions that have not been charged yet, in one statement.
+
+        Each session costs ``rate`` per started hour. Sessions without a known
+        user are left for later.
+
+        Args:
+            rate (Decimal): The price of an hour.
+            session_ids (list[int], optional): The sessions to settle; all pending ones if omitted.
+
+        Returns:
+            list[Row]: The user ID and the new balance of every charged user.
+        """
+        now = datetime.datetime.utcnow()
+        hours = func.greatest(
+            1, func.ceil(func.extract("epoch", ParkingSession.ended_at - ParkingSession.started_at) / 3600)
+        )
+        pending = select(
+            ParkingSession.user_id,
+            -hours * literal(rate, Numeric(12, 2)),
+            literal("parking"),
+            ParkingSession.id,
+            literal(now, DateTime),
+        ).where(
+            ParkingSession.ended_at.is_not(None),
+            ParkingSession.user_id.is_not(None),
+            ~exists().where(LedgerEntry.parking_session_id == ParkingSession.id),
+        )
+        if session_ids is not None:
+            pending = pending.where(ParkingSession.id.in_(session_ids))
+
+        entries = (
+            pg_insert(LedgerEntry)
+            .from_select(["user_id", "amount", "kind", "parking_session_id", "created_at"], pending)
+            # A concurrent settlement may have charged the same session meanwhile.
+            .on_conflict_do_nothing(index_elements=[LedgerEntry.parking_session_id])
+            .returning(LedgerEntry.user_id, LedgerEntry.amount)
+            .cte("entries")
+        )
+        result = await self.session.execute(self._apply_to_balances(entries, now))
+        return result.all()
+
+    async def get_balance(self, user_id: int) -> Decimal:
+        """Reads the materialized balance of a user.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            Decimal: The balance, zero for users without entries.
+        """
+        stmt = select(UserBalance.balance).where(UserBalance.user_id == user_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() or Decimal("0.00")
+
+    async def find_history(self, user_id: int, limit: int, before_id: Optional[int] = None) -> list:
+        """Reads a page of a user's entries, newest first.
+
+        Pages are addressed by the last seen entry ID rather than an offset, so
+        every page is a short index range scan on ``(user_id, id)``.
+
+        Args:
+            user_id (int): The ID of the user.
+            limit (int): The page size.
+            before_id (int, optional): Only entries older than this ID are returned.
+
+        Returns:
+            list[LedgerEntry]: Up to ``limit`` entries.
+        """
+        stmt = select(self.model).where(self.model.user_id == user_id)
+        if before_id is not None:
+            stmt = stmt.where(self.model.id < before_id)
+        stmt = stmt.order_by(self.model.id.desc()).limit(limit)
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
@@ -0,0 +1,73 @@
+import datetime
+from typing import Optional
+
+from sqlalchemy import func, select, update
+
+from app.models.parking import ParkingSession
+from app.utils.repositories import SQLAlchemyRepository
+
+
+class ParkingRepository(SQLAlchemyRepository):
+    """Repository class for managing ParkingSession objects in the database.
+
+    Inherits from:
+        SQLAlchemyRepository: Base repository class providing common database operations.
+    """
+    model = ParkingSession
+
+    async def find_open(self) -> list:
+        """Finds all open parking sessions.
+
+        Returns:
+            list[Row]: Rows with the id, license plate, start time and user of each open session.
+        """
+        stmt = select(
+            self.model.id, self.model.license_plate, self.model.started_at, self.model.user_id
+        ).where(self.model.ended_at.is_(None))
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def find_open_by_plate(self, license_plate: str):
+        """Finds the open parking session of a plate, from the partial unique index on open sessions.
+
+        Args:
+            license_plate (str): The normalized license plate.
+
+        Returns:
+            Optional[ParkingSession]: The open session, or None if there is none.
+        """
+        stmt = select(self.model).where(
+            self.model.license_plate == license_plate, self.model.ended_at.is_(None)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def count_open(self) -> int:
+        """Counts open parking sessions, from the partial index on open sessions.
+
+        Returns:
+            int: The number of open sessions.
+        """
+        stmt = select(func.count()).select_from(self.model).where(self.model.ended_at.is_(None))
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def close_session(self, id: int, ended_at: datetime.datetime, evidence: Optional[str] = None):
+        """Closes a parking session if it is still open.
+
+        Args:
+            id (int): The ID of the session.
+            ended_at (datetime.datetime): The exit time.
+            evidence (str, optional): The digest of the exit frame.
+
+        Returns:
+            Optional[ParkingSession]: The closed session, or None if it was not open.
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.id == id, self.model.ended_at.is_(None))
+            .values(ended_at=ended_at, exit_evidence=evidence)
+            .returning(self.model)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
@@ -9,3 +9,5 @@ class UsersRepository(SQLAlchemyRepository):
         SQLAlchemyRepository: Base repository class providing common database operations.
     """
     model = User
+    cache_entities = True
+    filterable = frozenset({"id", "email"})
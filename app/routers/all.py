@@ -4,6 +4,9 @@ from app.routers.users import router as router_users
 from app.routers.comments import router as router_comments
 from app.routers.posts import router as router_posts
 from app.routers.black_list import router as router_black_list
+from app.routers.evidence import router as router_evidence
+from app.routers.parking import router as router_parking
+from app.routers.payments import router as router_payments
 
 all_routers = [
     router_auth,
@@ -12,4 +15,7 @@ all_routers = [
     router_posts,
     router_checkers,
     router_black_list,
+    router_evidence,
+    router_parking,
+    router_payments,
 ]
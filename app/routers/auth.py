@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 
 from app.schemas.auth import TokenResponse, UserSchemaLogin
 from app.schemas.users import UserSchema, UserSchemaAdd
-from app.services.auth import AuthService
+from app.services.auth import AuthService, auth_service as default_auth_service
 from app.services.users import UsersService
 from app.utils.dependencies import UOWDep
 
@@ -42,7 +42,7 @@ async def signup(
 async def login(
     user: UserSchemaLogin,
     uow: UOWDep,
-    auth_service: AuthService = Depends(),
+    auth_service: AuthService = Depends(lambda: default_auth_service),
 ):
     """Authenticate a user and generate a token.
 
@@ -51,7 +51,8 @@ async def login(
     Args:
         user (UserSchemaLogin): The user's credentials including email and password.
         uow (UOWDep): Dependency for unit of work management.
-        auth_service (AuthService): Service for managing authentication operations.
+        auth_service (AuthService): Service for managing authentication operations; the shared
+            instance, whose bcrypt threads bound the password checks of the whole worker.
 
     Returns:
         TokenResponse: Contains the access token and the token type.
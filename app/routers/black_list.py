@@ -2,15 +2,16 @@ from fastapi import APIRouter, Depends, status
 from app.models.users import User
 from app.schemas.black_list import BlackListSchemaAdd, BlackListResponse
 from app.services.black_list import BlackListService
-from app.utils.dependencies import UOWDep
+from app.utils.dependencies import ReadUOWDep, UOWDep
 from app.utils.guard import guard
+from app.utils.responses import json_list_response
 
 router = APIRouter(prefix="/black_list", tags=["Black List"])
 
 
 @router.get("/", response_model=list[BlackListResponse])
 async def get_black_list(
-        uow: UOWDep,
+        uow: ReadUOWDep,
         black_list_service: BlackListService = Depends(),
         current_user: User = Depends(guard.is_admin),
 ):
@@ -19,7 +20,7 @@ async def get_black_list(
     This endpoint returns a list of all entries in the blacklist. Access is restricted to admin users only.
 
     Args:
-        uow (UOWDep): Dependency for unit of work management.
+        uow (ReadUOWDep): Dependency for a read-only unit of work, served by a replica when available.
         black_list_service (BlackListService): Service for managing blacklist-related operations.
         current_user (User): The currently authenticated user, required to be an admin.
 
@@ -27,7 +28,7 @@ async def get_black_list(
         list[BlackListResponse]: A list of blacklist entries.
     """
     black_list = await black_list_service.get_black_list(uow)
-    return black_list
+    return json_list_response(BlackListResponse, black_list)
 
 
 @router.post("/", response_model=BlackListResponse, status_code=status.HTTP_200_OK)
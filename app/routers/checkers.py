@@ -1,10 +1,19 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_database
+from app.db.database import engine, get_database
+from app.db.pool import pool_stats
+from app.db.replicas import replica_router
+from app.db.slow_queries import slow_query_log
+from app.utils.entity_cache import entity_cache
+from app.utils.invalidation import invalidation_bus
+from app.utils.metrics import metrics
+from app.utils.statement_cache import statement_cache
+from app.utils.watchdog import loop_watchdog
 
 router = APIRouter(prefix="", tags=["checkers"])
 
@@ -51,3 +60,82 @@ async def healthchecker(db: AsyncSession = Depends(get_database)):
     except Exception as e:
         logging.error(f"Error connecting to the database: {e}")
         raise HTTPException(status_code=500, detail="Error connecting to the database")
+
+
+@router.get("/healthchecker/cache")
+def cache_stats():
+    """Cache health endpoint.
+
+    This endpoint reports how well this worker's entity cache performs and how quickly invalidations from other workers reach it.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - `entities` (dict): The size, hits and misses of the entity cache.
+            - `invalidation` (dict): Received messages, flushes and propagation lag in milliseconds.
+            - `statements` (dict): The size, hits and misses of the repository statement cache.
+    """
+    return {
+        "entities": {"size": len(entity_cache), "hits": entity_cache.hits, "misses": entity_cache.misses},
+        "invalidation": invalidation_bus.stats(),
+        "statements": statement_cache.stats(),
+    }
+
+
+@router.get("/healthchecker/replicas")
+def replica_health():
+    """Read replica health endpoint.
+
+    This endpoint reports the replicas that read-only requests are routed to, as seen by the last health check of this worker.
+
+    Returns:
+        dict: A dictionary with the following key:
+            - `replicas` (list[dict]): The name, health and replication lag in seconds of every replica.
+    """
+    return {"replicas": replica_router.stats()}
+
+
+@router.get("/healthchecker/pool")
+def pool_health():
+    """Connection pool statistics endpoint.
+
+    This endpoint reports the live state of this worker's connection pools, to tell whether requests queue for connections.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - `primary` (dict): Size, checked in and out connections, overflow, checkouts, timeouts and checkout wait times in milliseconds.
+            - `replicas` (dict): The same statistics for every replica.
+            - `slow_queries` (dict): The slow query threshold in seconds, and how many statements exceeded it or were explained.
+    """
+    return {
+        "primary": pool_stats(engine),
+        "replicas": {replica.name: pool_stats(replica.engine) for replica in replica_router.replicas},
+        "slow_queries": slow_query_log.stats(),
+    }
+
+
+@router.get("/healthchecker/loop")
+def loop_health():
+    """Event loop health endpoint.
+
+    This endpoint reports how late this worker's event loop runs its timers, and how often it was blocked past the watchdog threshold.
+
+    Returns:
+        dict: A dictionary with the following keys:
+            - `lag_ms` (float): The lag of the latest heartbeat.
+            - `max_lag_ms` (float): The largest lag since the worker started.
+            - `blocks` (int): How many times the loop was blocked past the threshold.
+            - `threshold_ms` (float): The threshold.
+    """
+    return loop_watchdog.stats()
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint():
+    """Prometheus metrics endpoint.
+
+    This endpoint exposes request latency histograms by route and status, requests in flight, connection pool gauges, the bcrypt queue depth and event loop lag, added up over all workers.
+
+    Returns:
+        PlainTextResponse: The metrics in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
@@ -1,12 +1,16 @@
 from fastapi import APIRouter, Depends, status, BackgroundTasks
 import asyncio
+from typing import Optional
 from app.models.users import User
 from app.models.comments import Comment, CommentStatus, CommentStatus
+from app.repositories.comments import CommentsRepository
 from app.schemas.comments import CommentSchemaAdd, CommentSchemaUpdate, CommentResponse,  CommentDailyBreakdown
 from app.services.comments import CommentService
 from app.services.auth import auth_service
-from app.utils.dependencies import UOWDep
+from app.utils.dependencies import ReadUOWDep, UOWDep, list_query, sparse_fields
+from app.utils.filters import ListQuery
 from app.utils.guard import guard
+from app.utils.responses import json_list_response, json_response
 from datetime import date
 import time
 
@@ -15,24 +19,29 @@ router = APIRouter(prefix="/comments", tags=["Comments"])
 
 @router.get("/", response_model=list[CommentResponse])
 async def get_comment(
-        uow: UOWDep,
+        uow: ReadUOWDep,
         comment_service: CommentService = Depends(),
         current_user: User = Depends(guard.is_admin),
+        fields: Optional[tuple[str, ...]] = Depends(sparse_fields(CommentResponse)),
+        query: Optional[ListQuery] = Depends(list_query(CommentsRepository)),
 ):
     """Retrieve a list of all comments.
 
     This endpoint returns a list of all comments from the database. Access is restricted to admin users only.
 
     Args:
-        uow (UOWDep): Dependency for unit of work management.
+        uow (ReadUOWDep): Dependency for a read-only unit of work, served by a replica when available.
         comment_service (CommentService): Service for managing comment-related operations.
         current_user (User): The currently authenticated user, required to be an admin.
+        fields (Optional[tuple[str, ...]]): The fields to return, from ``?fields=``.
+        query (Optional[ListQuery]): Filters such as ``owner_id=`` or ``created_at[gte]=`` and ``sort=``,
+            over indexed columns only.
 
     Returns:
-        list[CommentResponse]: A list of comment objects with details.
+        list[CommentResponse]: A list of comment objects, limited to the selected fields.
     """
-    comments = await comment_service.get_comments(uow)
-    return comments
+    comments = await comment_service.get_comments(uow, fields, query)
+    return json_list_response(CommentResponse, comments, fields)
 
 
 @router.get("/{comment_id}", response_model=CommentResponse, status_code=status.HTTP_200_OK)
@@ -41,6 +50,7 @@ async def get_comment(
         uow: UOWDep,
         comments_service: CommentService = Depends(),
         current_user: User = Depends(guard.is_admin),
+        fields: Optional[tuple[str, ...]] = Depends(sparse_fields(CommentResponse)),
 ):
     """Retrieve a specific comment by its ID.
 
@@ -51,11 +61,13 @@ async def get_comment(
         uow (UOWDep): Dependency for unit of work management.
         comments_service (CommentService): Service for managing comment-related operations.
         current_user (User): The currently authenticated user, required to be an admin.
+        fields (Optional[tuple[str, ...]]): The fields to return, from ``?fields=``.
 
     Returns:
-        CommentResponse: Details of the comment with the specified ID.
+        CommentResponse: Details of the comment with the specified ID, limited to the selected fields.
     """
-    return await comments_service.get_comment_by_id(uow, comment_id)
+    comment = await comments_service.get_comment_by_id(uow, comment_id, fields)
+    return json_response(CommentResponse, comment, fields)
 
 
 @router.post("/", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
@@ -135,7 +147,7 @@ async def delete_comment(
 async def get_comments_daily_breakdown(
     date_from: date,
     date_to: date,
-    uow: UOWDep,
+    uow: ReadUOWDep,
     comment_service: CommentService = Depends(),
 ):
     """
@@ -147,13 +159,14 @@ async def get_comments_daily_breakdown(
     Args:
         date_from (date): The starting date for analysis.
         date_to (date): The ending date for analysis.
-        uow (UOWDep): Dependency for unit of work management.
+        uow (ReadUOWDep): Dependency for a read-only unit of work, served by a replica when available.
         comment_service (CommentService): Service for managing comment-related operations.
 
     Returns:
         list[CommentDailyBreakdown]: A list of objects containing the count of created and blocked comments by day.
     """
-    return await comment_service.get_comments_daily_breakdown(uow, date_from, date_to)
+    breakdown = await comment_service.get_comments_daily_breakdown(uow, date_from, date_to)
+    return json_list_response(CommentDailyBreakdown, breakdown)
 
 @router.post("/", response_model=CommentResponse, status_code=status.HTTP_201_CREATED)
 async def add_comment_with_autoreply(
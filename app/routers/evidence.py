@@ -0,0 +1,81 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from starlette.background import BackgroundTask
+from starlette.types import Receive, Scope, Send
+
+from app.models.users import User
+from app.utils.frame_store import frame_store
+from app.utils.guard import guard
+
+router = APIRouter(prefix="/evidence", tags=["Evidence"])
+
+
+class MemoryViewResponse(Response):
+    """Response that sends a memory-mapped blob without copying it into bytes.
+
+    The rendered ``body`` stays empty; the view is kept in ``body_view`` and
+    handed to the server as the body message.
+    """
+
+    def __init__(self, content: memoryview, status_code: int = 200, headers: Optional[dict] = None,
+                 media_type: Optional[str] = None, background: Optional[BackgroundTask] = None):
+        self.body_view = memoryview(content)
+        headers = {**(headers or {}), "content-length": str(self.body_view.nbytes)}
+        super().__init__(None, status_code, headers, media_type, background)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        await send({"type": "http.response.body", "body": self.body_view})
+        if self.background is not None:
+            await self.background()
+
+
+@router.get("/{digest}", response_class=MemoryViewResponse)
+async def get_evidence(
+        digest: str,
+        current_user: User = Depends(guard.is_admin),
+):
+    """Retrieve an evidence frame by its content digest.
+
+    This endpoint returns the stored image straight from the memory-mapped frame store. Access is restricted to admin users only.
+
+    Args:
+        digest (str): The hex SHA-256 digest of the frame.
+        current_user (User): The currently authenticated user, required to be an admin.
+
+    Returns:
+        MemoryViewResponse: The JPEG image.
+
+    Raises:
+        HTTPException: If the frame is not found.
+    """
+    frame = frame_store.get(digest)
+    if frame is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Frame not found")
+    return MemoryViewResponse(frame, media_type="image/jpeg")
+
+
+@router.get("/{digest}/thumbnail", response_class=MemoryViewResponse)
+async def get_evidence_thumbnail(
+        digest: str,
+        current_user: User = Depends(guard.is_admin),
+):
+    """Retrieve the thumbnail of an evidence frame.
+
+    Thumbnails are generated in the background shortly after a frame is stored. Access is restricted to admin users only.
+
+    Args:
+        digest (str): The hex SHA-256 digest of the frame.
+        current_user (User): The currently authenticated user, required to be an admin.
+
+    Returns:
+        MemoryViewResponse: The JPEG thumbnail.
+
+    Raises:
+        HTTPException: If the thumbnail is not available yet.
+    """
+    thumbnail = frame_store.thumbnail(digest)
+    if thumbnail is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Thumbnail not found")
+    return MemoryViewResponse(thumbnail, media_type="image/jpeg")
@@ -0,0 +1,125 @@
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
+
+from app.models.users import User
+from app.schemas.parking import OccupancySnapshot, ParkingEvent, ParkingSessionResponse
+from app.services.parking import ParkingService
+from app.utils.dependencies import UOWDep
+from app.utils.guard import guard
+from app.utils.occupancy import occupancy
+
+router = APIRouter(prefix="/parking", tags=["Parking"])
+
+
+@router.post("/entry", response_model=ParkingSessionResponse, status_code=status.HTTP_201_CREATED)
+async def parking_entry(
+        uow: UOWDep,
+        event: ParkingEvent,
+        parking_service: ParkingService = Depends(),
+        current_user: User = Depends(guard.is_admin),
+):
+    """Start a parking session for a plate detected at the entry gate.
+
+    Access is restricted to admin users only.
+
+    Args:
+        uow (UOWDep): Dependency for unit of work management.
+        event (ParkingEvent): The detected license plate and the evidence frame or its digest.
+        parking_service (ParkingService): Service for managing parking sessions.
+        current_user (User): The currently authenticated user, required to be an admin.
+
+    Returns:
+        ParkingSessionResponse: The new parking session.
+    """
+    return await parking_service.start_session(uow, event)
+
+
+@router.post("/exit", response_model=ParkingSessionResponse, status_code=status.HTTP_200_OK)
+async def parking_exit(
+        uow: UOWDep,
+        event: ParkingEvent,
+        parking_service: ParkingService = Depends(),
+        current_user: User = Depends(guard.is_admin),
+):
+    """Stop the parking session of a plate detected at the exit gate.
+
+    Access is restricted to admin users only.
+
+    Args:
+        uow (UOWDep): Dependency for unit of work management.
+        event (ParkingEvent): The detected license plate and the evidence frame or its digest.
+        parking_service (ParkingService): Service for managing parking sessions.
+        current_user (User): The currently authenticated user, required to be an admin.
+
+    Returns:
+        ParkingSessionResponse: The closed parking session.
+    """
+    return await parking_service.stop_session(uow, event)
+
+
+@router.get("/sessions/{license_plate}", response_model=ParkingSessionResponse)
+async def get_open_session(
+        uow: UOWDep,
+        license_plate: str,
+        parking_service: ParkingService = Depends(),
+        current_user: User = Depends(guard.is_admin),
+):
+    """Retrieve the open parking session of a plate.
+
+    Access is restricted to admin users only.
+
+    Args:
+        uow (UOWDep): Dependency for unit of work management.
+        license_plate (str): The license plate.
+        parking_service (ParkingService): Service for managing parking sessions.
+        current_user (User): The currently authenticated user, required to be an admin.
+
+    Returns:
+        ParkingSessionResponse: The open parking session.
+    """
+    return await parking_service.get_open_session(uow, license_plate)
+
+
+@router.get("/occupancy", response_model=OccupancySnapshot)
+async def get_occupancy(
+        current_user: User = Depends(guard.is_admin),
+):
+    """Retrieve the current lot occupancy.
+
+    The numbers are kept in memory by every worker, so this endpoint does not query the database. Access is restricted to admin users only.
+
+    Args:
+        current_user (User): The currently authenticated user, required to be an admin.
+
+    Returns:
+        OccupancySnapshot: The occupied and available spaces.
+    """
+    return occupancy.snapshot()
+
+
+@router.get("/occupancy/stream")
+async def stream_occupancy(
+        current_user: User = Depends(guard.is_admin),
+):
+    """Stream lot occupancy changes as server-sent events.
+
+    The current state is sent first, then one ``occupancy`` event per change. Comment lines keep idle connections open. Access is restricted to admin users only.
+
+    Args:
+        current_user (User): The currently authenticated user, required to be an admin.
+
+    Returns:
+        StreamingResponse: A ``text/event-stream`` of occupancy snapshots.
+    """
+    async def events():
+        async for snapshot in occupancy.subscribe():
+            if snapshot is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: occupancy\ndata: {OccupancySnapshot(**snapshot).model_dump_json()}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
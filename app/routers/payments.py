@@ -0,0 +1,101 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, status
+
+from app.core.config import settings
+from app.models.users import User
+from app.schemas.ledger import BalanceResponse, LedgerPage, PaymentAdd, SettlementResponse, SettlementSchema
+from app.services.auth import auth_service
+from app.services.ledger import LedgerService
+from app.utils.dependencies import ReadUOWDep, UOWDep
+from app.utils.guard import guard
+
+router = APIRouter(prefix="/payments", tags=["Payments"])
+
+
+@router.post("/", response_model=BalanceResponse, status_code=status.HTTP_201_CREATED)
+async def add_payment(
+        uow: UOWDep,
+        payment: PaymentAdd,
+        ledger_service: LedgerService = Depends(),
+        current_user: User = Depends(auth_service.get_current_user),
+):
+    """Credit a payment to the current user.
+
+    Args:
+        uow (UOWDep): Dependency for unit of work management.
+        payment (PaymentAdd): The amount paid.
+        ledger_service (LedgerService): Service for managing payments and balances.
+        current_user (User): The currently authenticated user.
+
+    Returns:
+        BalanceResponse: The balance after the payment.
+    """
+    return await ledger_service.add_payment(uow, current_user.id, payment)
+
+
+@router.get("/balance", response_model=BalanceResponse)
+async def get_balance(
+        uow: UOWDep,
+        ledger_service: LedgerService = Depends(),
+        current_user: User = Depends(auth_service.get_current_user),
+):
+    """Retrieve the balance of the current user.
+
+    Args:
+        uow (UOWDep): Dependency for unit of work management.
+        ledger_service (LedgerService): Service for managing payments and balances.
+        current_user (User): The currently authenticated user.
+
+    Returns:
+        BalanceResponse: The current balance.
+    """
+    return await ledger_service.get_balance(uow, current_user.id)
+
+
+@router.get("/history", response_model=LedgerPage)
+async def get_history(
+        uow: ReadUOWDep,
+        limit: int = Query(settings.LEDGER_PAGE_SIZE, ge=1, le=500),
+        cursor: Optional[int] = None,
+        ledger_service: LedgerService = Depends(),
+        current_user: User = Depends(auth_service.get_current_user),
+):
+    """Retrieve the payment history of the current user, newest first.
+
+    Pass the ``next_cursor`` of a page as ``cursor`` to get the following page.
+
+    Args:
+        uow (ReadUOWDep): Dependency for a read-only unit of work, served by a replica when available.
+        limit (int): The page size.
+        cursor (int, optional): The cursor returned with the previous page.
+        ledger_service (LedgerService): Service for managing payments and balances.
+        current_user (User): The currently authenticated user.
+
+    Returns:
+        LedgerPage: The entries and the cursor of the next page.
+    """
+    return await ledger_service.get_history(uow, current_user.id, limit, cursor)
+
+
+@router.post("/settle", response_model=SettlementResponse)
+async def settle_sessions(
+        uow: UOWDep,
+        settlement: SettlementSchema,
+        ledger_service: LedgerService = Depends(),
+        current_user: User = Depends(guard.is_admin),
+):
+    """Charge closed parking sessions that have not been charged yet.
+
+    Access is restricted to admin users only.
+
+    Args:
+        uow (UOWDep): Dependency for unit of work management.
+        settlement (SettlementSchema): The sessions to settle; all pending ones if omitted.
+        ledger_service (LedgerService): Service for managing payments and balances.
+        current_user (User): The currently authenticated user, required to be an admin.
+
+    Returns:
+        SettlementResponse: The new balances of the charged users.
+    """
+    return await ledger_service.settle(uow, settlement.session_ids)
@@ -3,15 +3,16 @@ from app.models.users import User
 from app.schemas.posts import PostSchemaAdd, PostResponse, PostLiteResponse
 from app.services.posts import PostService
 from app.services.auth import auth_service
-from app.utils.dependencies import UOWDep
+from app.utils.dependencies import ReadUOWDep, UOWDep
 from app.utils.guard import guard
+from app.utils.responses import json_list_response
 
 router = APIRouter(prefix="/posts", tags=["Posts"])
 
 
 @router.get("/", response_model=list[PostLiteResponse])
 async def get_posts(
-        uow: UOWDep,
+        uow: ReadUOWDep,
         post_service: PostService = Depends(),
         current_user: User = Depends(guard.is_admin),
 ):
@@ -21,7 +22,7 @@ async def get_posts(
     This endpoint returns a list of all posts from the database. Access is restricted to admin users only.
 
     Args:
-        uow (UOWDep): Dependency for unit of work management.
+        uow (ReadUOWDep): Dependency for a read-only unit of work, served by a replica when available.
         post_service (PostService): Service for managing post-related operations.
         current_user (User): The currently authenticated user, required to be an admin.
 
@@ -29,7 +30,7 @@ async def get_posts(
         list[PostLiteResponse]: A list of post objects with brief details.
     """
     posts = await post_service.get_posts(uow)
-    return posts
+    return json_list_response(PostLiteResponse, posts)
 
 
 @router.get("/{post_id}", response_model=PostResponse, status_code=status.HTTP_200_OK)
@@ -1,33 +1,42 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, status
 
 from app.models import User
+from app.repositories.users import UsersRepository
 from app.schemas.users import UserResponse, UserSchemaUpdate
 from app.services.auth import auth_service
 from app.services.users import UsersService
-from app.utils.dependencies import UOWDep
+from app.utils.dependencies import ReadUOWDep, UOWDep, list_query, sparse_fields
+from app.utils.filters import ListQuery
 from app.utils.guard import guard
+from app.utils.responses import json_list_response, json_response
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.get("/", response_model=list[UserResponse])
 async def get_users(
-    uow: UOWDep,
+    uow: ReadUOWDep,
     user_service: UsersService = Depends(),
     current_user: User = Depends(guard.is_admin),
+    fields: Optional[tuple[str, ...]] = Depends(sparse_fields(UserResponse)),
+    query: Optional[ListQuery] = Depends(list_query(UsersRepository)),
 ):
     """Retrieve all users.
 
     Args:
-        uow (UOWDep): Dependency for the unit of work.
+        uow (ReadUOWDep): Dependency for a read-only unit of work, served by a replica when available.
         user_service (UsersService): Service for managing users.
         current_user (User): The current user, must be an admin.
+        fields (Optional[tuple[str, ...]]): The fields to return, from ``?fields=``.
+        query (Optional[ListQuery]): Filters such as ``email=`` or ``id[gte]=`` and ``sort=``, over indexed columns only.
 
     Returns:
-        list[UserResponse]: List of users.
+        list[UserResponse]: List of users, limited to the selected fields.
     """
-    users = await user_service.get_users(uow)
-    return users
+    users = await user_service.get_users(uow, fields, query)
+    return json_list_response(UserResponse, users, fields)
 
 
 @router.get("/{user_id}", response_model=UserResponse, status_code=status.HTTP_200_OK)
@@ -36,6 +45,7 @@ async def get_user(
     uow: UOWDep,
     user_service: UsersService = Depends(),
     current_user: User = Depends(guard.is_admin),
+    fields: Optional[tuple[str, ...]] = Depends(sparse_fields(UserResponse)),
 ):
     """Retrieve a user by their ID.
 
@@ -44,11 +54,13 @@ async def get_user(
         uow (UOWDep): Dependency for the unit of work.
         user_service (UsersService): Service for managing users.
         current_user (User): The current user, must be an admin.
+        fields (Optional[tuple[str, ...]]): The fields to return, from ``?fields=``.
 
     Returns:
-        UserResponse: Response containing user data.
+        UserResponse: Response containing user data, limited to the selected fields.
     """
-    return await user_service.get_user_by_id(uow, user_id)
+    user = await user_service.get_user_by_id(uow, user_id, fields)
+    return json_response(UserResponse, user, fields)
 
 
 @router.put("/{user_id}", response_model=UserResponse, status_code=status.HTTP_200_OK)
@@ -4,6 +4,7 @@ from datetime import date
 
 class CommentSchemaAdd(BaseModel):
     owner_id: conint(ge=1)
+    license_plate: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -17,6 +18,7 @@ class CommentSchemaUpdate(BaseModel):
 class CommentResponse(BaseModel):
     id: conint(ge=1)
     owner_id: int
+    license_plate: Optional[str] = None
 
     class Config:
         from_attributes = True
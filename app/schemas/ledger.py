@@ -0,0 +1,38 @@
+import datetime
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import BaseModel, condecimal, conint
+
+
+class PaymentAdd(BaseModel):
+    amount: condecimal(gt=0, max_digits=12, decimal_places=2)
+
+
+class BalanceResponse(BaseModel):
+    user_id: int
+    balance: Decimal
+
+
+class LedgerEntryResponse(BaseModel):
+    id: conint(ge=1)
+    amount: Decimal
+    kind: str
+    parking_session_id: Optional[int] = None
+    created_at: datetime.datetime
+
+    class Config:
+        from_attributes = True
+
+
+class LedgerPage(BaseModel):
+    items: list[LedgerEntryResponse]
+    next_cursor: Optional[int] = None
+
+
+class SettlementSchema(BaseModel):
+    session_ids: Optional[list[conint(ge=1)]] = None
+
+
+class SettlementResponse(BaseModel):
+    balances: list[BalanceResponse]
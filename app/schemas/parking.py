@@ -0,0 +1,30 @@
+import datetime
+from typing import Optional
+
+from pydantic import Base64Bytes, BaseModel, conint
+
+
+class ParkingEvent(BaseModel):
+    license_plate: str
+    # The digest of a frame already in the frame store.
+    evidence: Optional[str] = None
+    # The encoded gate frame, base64-encoded; stored, and its digest used as evidence.
+    frame: Optional[Base64Bytes] = None
+
+
+class ParkingSessionResponse(BaseModel):
+    id: conint(ge=1)
+    license_plate: str
+    user_id: Optional[int] = None
+    started_at: datetime.datetime
+    ended_at: Optional[datetime.datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class OccupancySnapshot(BaseModel):
+    occupied: int
+    capacity: Optional[int] = None
+    available: Optional[int] = None
+    updated_at: datetime.datetime
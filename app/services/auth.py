@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -8,7 +10,10 @@ from passlib.context import CryptContext
 from sqlalchemy.exc import IntegrityError
 
 from app.core.config import settings
+from app.db.fastpath import fastpath
+from app.db.replicas import current_user_id
 from app.models.users import User
+from app.utils.dependencies import get_uow
 from app.utils.unitofwork import IUnitOfWork, UnitOfWork
 
 
@@ -19,6 +24,12 @@ class AuthService:
 
     token_auth_scheme = HTTPBearer()
 
+    def __init__(self):
+        # bcrypt is slow on purpose; it runs on its own threads instead of blocking the event loop.
+        self.bcrypt_executor = ThreadPoolExecutor(max_workers=settings.BCRYPT_WORKERS, thread_name_prefix="bcrypt")
+        # Checks submitted to the executor and not finished yet, including the running ones.
+        self.bcrypt_queue = 0
+
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
         Verify if the plain password matches the hashed password.
@@ -32,6 +43,25 @@ class AuthService:
         """
         return self.pwd_context.verify(plain_password, hashed_password)
 
+    async def check_password(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify a password on the bcrypt threads.
+
+        Args:
+            plain_password (str): The plain text password.
+            hashed_password (str): The hashed password to compare against.
+
+        Returns:
+            bool: True if the password matches, False otherwise.
+        """
+        self.bcrypt_queue += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.bcrypt_executor, self.verify_password, plain_password, hashed_password
+            )
+        finally:
+            self.bcrypt_queue -= 1
+
     def get_password_hash(self, password: str) -> str:
         """
         Generate a hashed version of the password.
@@ -89,7 +119,7 @@ class AuthService:
         """
         async with uow:
             user = await uow.users.find_one_or_none(email=email)
-            if user is None or not self.verify_password(password, user.hashed_password):
+            if user is None or not await self.check_password(password, user.hashed_password):
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Invalid credentials",
@@ -125,7 +155,7 @@ class AuthService:
     async def get_current_user(
         self,
         token: str = Depends(token_auth_scheme),
-        uow: UnitOfWork = Depends(UnitOfWork),
+        uow: UnitOfWork = Depends(get_uow),
     ) -> User:
         """
         Retrieve the current user based on the provided JWT token.
@@ -135,7 +165,8 @@ class AuthService:
             uow (UnitOfWork): The unit of work instance for database transactions.
 
         Returns:
-            User: The currently authenticated user.
+            User: The currently authenticated user. On the fast path this is a
+            read-only ``UserRecord`` with the same attributes.
 
         Raises:
             HTTPException: If the token is invalid or the user is not found.
@@ -159,11 +190,15 @@ class AuthService:
         except JWTError:
             raise credentials_exception
 
-        async with uow:
-            user = await uow.users.find_one_or_none(email=email)
-            if user is None:
-                raise credentials_exception
-            return user
+        if fastpath.available:
+            user = await fastpath.fetch_one("user_by_email", email)
+        else:
+            async with uow:
+                user = await uow.users.find_one_or_none(email=email)
+        if user is None:
+            raise credentials_exception
+        current_user_id.set(user.id)
+        return user
 
     async def decode_token(self, token: str) -> dict:
         """
@@ -1,6 +1,8 @@
 from fastapi import HTTPException, status
 
+from app.core.config import settings
 from app.models import BlackList, Comment
+from app.utils.plate_index import AmbiguousPlateError, normalize_plate, plate_index
 from app.utils.unitofwork import UnitOfWork
 from app.schemas.black_list import BlackListResponse, BlackListSchemaAdd, BlackListSchema
 
@@ -24,6 +26,34 @@ class BlackListService:
         async with uow:
             return await uow.black_list.get_blacklisted_words()
 
+    @staticmethod
+    def match_license_plate(license_plate: str) -> str:
+        """
+        Resolves a license plate, possibly misread by OCR, to a known one.
+
+        The index is only a hint: when it knows no plate close enough, e.g. because
+        it could not be built, the plate is looked up exactly in the database.
+
+        Args:
+            license_plate (str): The license plate to look for.
+
+        Returns:
+            str: The closest known license plate, or the normalized plate itself.
+
+        Raises:
+            HTTPException: If several known plates are equally close, so the car cannot be told.
+        """
+        try:
+            match = plate_index.best_match(license_plate, settings.PLATE_MATCH_DISTANCE)
+        except AmbiguousPlateError as e:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"License plate is ambiguous, matching {', '.join(e.candidates)}",
+            )
+        if match is None:
+            return normalize_plate(license_plate)
+        return match
+
     @staticmethod
     async def add_black_list(uow: UnitOfWork, black_list_data: BlackListSchemaAdd) -> BlackListResponse:
         """
@@ -47,7 +77,8 @@ class BlackListService:
             if any(word in black_list_data.reason for word in blacklisted_words):
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Comment contains blacklisted words")
 
-            comment = await uow.comments.find_one_or_none(license_plate=black_list_data.license_plate)
+            license_plate = BlackListService.match_license_plate(black_list_data.license_plate)
+            comment = await uow.comments.find_one_or_none(license_plate=license_plate)
             if comment is None:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
 
@@ -63,7 +94,7 @@ class BlackListService:
             black_response = BlackListResponse(
                 id=black_data.id,
                 car_id=black_data.car_id,
-                license_plate=black_list_data.license_plate,
+                license_plate=license_plate,
                 reason=black_data.reason,
             )
 
@@ -105,6 +136,7 @@ class BlackListService:
         Raises:
             HTTPException: If the car is not found or is not blacklisted.
         """
+        license_plate = BlackListService.match_license_plate(license_plate)
         async with uow:
             comment = await uow.comments.find_one_or_none(license_plate=license_plate)
             if comment is None:
@@ -1,7 +1,11 @@
 from fastapi import HTTPException, status
 from datetime import date
+from typing import Optional
 
+from app.db.listener import notify
 from app.models import Comment
+from app.utils.filters import ListQuery
+from app.utils.plate_index import PLATES_CHANNEL, normalize_plate, plate_index
 from app.utils.unitofwork import UnitOfWork
 from app.schemas.comments import CommentSchemaAdd, CommentSchemaUpdate, CommentResponse, CommentDailyBreakdown
 
@@ -32,44 +36,66 @@ class CommentService:
                 raise HTTPException(status_code=404, detail="Owner not found")
             
             comment_dict = comment_data.model_dump()
+            if comment_dict.get("license_plate"):
+                comment_dict["license_plate"] = normalize_plate(comment_dict["license_plate"])
 
             comment_id = await uow.comments.add_one(comment_dict)
-            return comment_id
+            if comment_dict.get("license_plate"):
+                await notify(
+                    uow.session, PLATES_CHANNEL, plate_index.message(added=[comment_dict["license_plate"]])
+                )
+
+        if comment_dict.get("license_plate"):
+            plate_index.add(comment_dict["license_plate"])
+        return comment_id
 
-    async def get_comments(self, uow: UnitOfWork):
+    async def get_comments(
+            self, uow: UnitOfWork, fields: Optional[tuple[str, ...]] = None, query: Optional[ListQuery] = None
+    ):
         """
         Retrieves a list of all comments.
 
         Args:
             uow (UnitOfWork): The unit of work instance for database transactions.
+            fields (Optional[tuple[str, ...]]): Only load these columns; all of them by default.
+            query (Optional[ListQuery]): Filters and sort order; all comments in table order by default.
 
         Returns:
-            list[Comment]: A list of all comments.
+            list[Comment]: A list of all comments, or of rows with the selected columns.
         """
         async with uow:
-            comments = await uow.comments.find_all()
+            comments = await uow.comments.find_all(fields, query)
             return comments
 
-    async def get_comment_by_id(self, uow: UnitOfWork, comment_id: int) -> CommentResponse:
+    async def get_comment_by_id(
+            self, uow: UnitOfWork, comment_id: int, fields: Optional[tuple[str, ...]] = None
+    ) -> CommentResponse:
         """
         Retrieves a comment by its ID.
 
         Args:
             uow (UnitOfWork): The unit of work instance for database transactions.
             comment_id (int): The ID of the comment to retrieve.
+            fields (Optional[tuple[str, ...]]): Only load these columns; all of them by default.
 
         Returns:
-            CommentResponse: The response object containing comment details.
+            CommentResponse: The response object containing comment details,
+                or a row with the selected columns.
 
         Raises:
             HTTPException: If the comment is not found.
         """
         async with uow:
-            comment = await uow.comments.find_one_or_none(id=comment_id)
+            if fields is None:
+                comment = await uow.comments.find_one_or_none(id=comment_id)
+            else:
+                comment = await uow.comments.find_fields(fields, id=comment_id)
             if comment is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
                 )
+            if fields is not None:
+                return comment
             return CommentResponse.from_orm(comment)
 
     async def update_comment(
@@ -123,7 +149,28 @@ class CommentService:
                     status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found"
                 )
             await uow.comments.delete_one(id=comment_id)
-            return CommentResponse.from_orm(comment)
+            if comment.license_plate:
+                await notify(uow.session, PLATES_CHANNEL, plate_index.message(removed=[comment.license_plate]))
+
+        if comment.license_plate:
+            plate_index.remove(comment.license_plate)
+        return CommentResponse.from_orm(comment)
+
+    @staticmethod
+    async def rebuild_plate_index(uow: UnitOfWork) -> int:
+        """
+        Loads all known license plates into the in-memory plate index.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance for database transactions.
+
+        Returns:
+            int: The number of indexed plates.
+        """
+        async with uow:
+            plates = await uow.comments.get_license_plates()
+        plate_index.rebuild(plates)
+        return len(plate_index)
 
     async def get_comments_by_owner_id(self, uow: UnitOfWork, owner_id: int) -> list[Comment]:
         """
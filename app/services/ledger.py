@@ -0,0 +1,95 @@
+from decimal import Decimal
+from typing import Optional
+
+from app.core.config import settings
+from app.schemas.ledger import (
+    BalanceResponse,
+    LedgerEntryResponse,
+    LedgerPage,
+    PaymentAdd,
+    SettlementResponse,
+)
+from app.utils.unitofwork import UnitOfWork
+
+
+class LedgerService:
+    """
+    Service class for payments, parking charges and balances.
+    """
+
+    @staticmethod
+    async def add_payment(uow: UnitOfWork, user_id: int, payment: PaymentAdd) -> BalanceResponse:
+        """
+        Credits a payment to a user.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance for database transactions.
+            user_id (int): The ID of the paying user.
+            payment (PaymentAdd): The amount paid.
+
+        Returns:
+            BalanceResponse: The balance after the payment.
+        """
+        async with uow:
+            balance = await uow.ledger.append(user_id, payment.amount, "payment")
+        return BalanceResponse(user_id=user_id, balance=balance)
+
+    @staticmethod
+    async def get_balance(uow: UnitOfWork, user_id: int) -> BalanceResponse:
+        """
+        Retrieves the balance of a user.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance for database transactions.
+            user_id (int): The ID of the user.
+
+        Returns:
+            BalanceResponse: The current balance.
+        """
+        async with uow:
+            balance = await uow.ledger.get_balance(user_id)
+        return BalanceResponse(user_id=user_id, balance=balance)
+
+    @staticmethod
+    async def get_history(
+        uow: UnitOfWork, user_id: int, limit: int = settings.LEDGER_PAGE_SIZE, cursor: Optional[int] = None
+    ) -> LedgerPage:
+        """
+        Retrieves a page of the payment history of a user, newest first.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance for database transactions.
+            user_id (int): The ID of the user.
+            limit (int): The page size.
+            cursor (int, optional): The ``next_cursor`` of the previous page.
+
+        Returns:
+            LedgerPage: The entries and the cursor of the next page, if any.
+        """
+        async with uow:
+            entries = await uow.ledger.find_history(user_id, limit, cursor)
+        return LedgerPage(
+            items=[LedgerEntryResponse.model_validate(entry) for entry in entries],
+            next_cursor=entries[-1].id if len(entries) == limit else None,
+        )
+
+    @staticmethod
+    async def settle(
+        uow: UnitOfWork, session_ids: Optional[list[int]] = None, rate: Decimal = settings.PARKING_HOURLY_RATE
+    ) -> SettlementResponse:
+        """
+        Charges closed parking sessions in one statement.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance for database transactions.
+            session_ids (list[int], optional): The sessions to settle; all pending ones if omitted.
+            rate (Decimal): The price of an hour.
+
+        Returns:
+            SettlementResponse: The new balances of the charged users.
+        """
+        async with uow:
+            balances = await uow.ledger.settle_sessions(rate, session_ids)
+        return SettlementResponse(
+            balances=[BalanceResponse(user_id=row.user_id, balance=row.balance) for row in balances]
+        )
@@ -0,0 +1,286 @@
+import asyncio
+import datetime
+import json
+import logging
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.db.listener import WORKER_ID, notify
+from app.schemas.parking import ParkingEvent, ParkingSessionResponse
+from app.utils.frame_store import frame_store
+from app.utils.occupancy import OCCUPANCY_CHANNEL, occupancy
+from app.utils.plate_index import normalize_plate
+from app.utils.unitofwork import UnitOfWork
+
+PARKING_SESSIONS_CHANNEL = "parking_sessions"
+
+
+class ActiveSession:
+    __slots__ = ("id", "started_at", "user_id")
+
+    def __init__(self, id: int, started_at: datetime.datetime, user_id: Optional[int] = None):
+        self.id = id
+        self.started_at = started_at
+        self.user_id = user_id
+
+    @classmethod
+    def of(cls, session) -> "ActiveSession":
+        return cls(session.id, session.started_at, session.user_id)
+
+
+class ActiveSessionIndex:
+    """
+    In-memory map of open parking sessions by normalized license plate.
+
+    The partial unique index on open sessions in Postgres remains the source of
+    truth; this map answers the gate's decisions without a database round trip.
+    Workers announce the sessions they open and close through a Postgres
+    notification, so every worker's map follows; only a plate missing from the
+    map, or a write the database rejects, falls back to the database.
+    """
+
+    def __init__(self):
+        self._sessions: dict[str, ActiveSession] = {}
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, license_plate: str) -> Optional[ActiveSession]:
+        return self._sessions.get(normalize_plate(license_plate))
+
+    def add(self, license_plate: str, session: ActiveSession):
+        self._sessions[normalize_plate(license_plate)] = session
+
+    def remove(self, license_plate: str) -> Optional[ActiveSession]:
+        return self._sessions.pop(normalize_plate(license_plate), None)
+
+    def rebuild(self, sessions: list):
+        self._sessions = {
+            normalize_plate(row.license_plate): ActiveSession.of(row)
+            for row in sessions
+        }
+
+    @staticmethod
+    def message(license_plate: str, session, closed: bool = False) -> str:
+        """Builds the notification payload for a session this worker opened or closed."""
+        return json.dumps({
+            "worker": WORKER_ID,
+            "plate": normalize_plate(license_plate),
+            "id": session.id,
+            "started_at": session.started_at.isoformat(),
+            "user_id": session.user_id,
+            "closed": closed,
+        })
+
+    def handle_notification(self, payload: str):
+        """Applies a session opened or closed by another worker."""
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logging.error(f"Malformed parking session notification: {payload!r}")
+            return
+        if message.get("worker") == WORKER_ID:
+            return
+        if message["closed"]:
+            current = self._sessions.get(message["plate"])
+            # A later session of the same plate may already be known.
+            if current is not None and current.id == message["id"]:
+                del self._sessions[message["plate"]]
+        else:
+            self._sessions[message["plate"]] = ActiveSession(
+                message["id"], datetime.datetime.fromisoformat(message["started_at"]), message.get("user_id")
+            )
+
+
+active_sessions = ActiveSessionIndex()
+
+
+class ParkingService:
+    """
+    Service class for starting and stopping parking sessions on plate detection.
+    """
+
+    @staticmethod
+    async def store_evidence(event: ParkingEvent) -> Optional[str]:
+        """
+        Stores the frame sent with a gate event in the frame store.
+
+        Args:
+            event (ParkingEvent): The detected license plate and the evidence frame or its digest.
+
+        Returns:
+            Optional[str]: The digest of the evidence frame, if there is one.
+        """
+        if event.frame is None:
+            return event.evidence
+        # Hashing and writing the frame would otherwise hold up the event loop.
+        return await asyncio.get_running_loop().run_in_executor(None, frame_store.put, event.frame)
+
+    @staticmethod
+    async def get_open_session(uow: UnitOfWork, license_plate: str) -> ParkingSessionResponse:
+        """
+        Retrieves the open parking session of a plate.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance for database transactions.
+            license_plate (str): The license plate.
+
+        Returns:
+            ParkingSessionResponse: The open session.
+
+        Raises:
+            HTTPException: If the plate has no open session.
+        """
+        license_plate = normalize_plate(license_plate)
+        active = await ParkingService._find_open(uow, license_plate)
+        if active is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="No open parking session"
+            )
+        return ParkingSessionResponse(
+            id=active.id, license_plate=license_plate, user_id=active.user_id, started_at=active.started_at
+        )
+
+    @staticmethod
+    async def _find_open(uow: UnitOfWork, license_plate: str) -> Optional[ActiveSession]:
+        """Answers from the index, and from the partial unique index on open sessions on a miss."""
+        active = active_sessions.get(license_plate)
+        if active is not None:
+            return active
+        async with uow:
+            session = await uow.parking.find_open_by_plate(license_plate)
+        if session is None:
+            return None
+        # Opened by another worker whose notification we have not seen yet.
+        active = ActiveSession.of(session)
+        active_sessions.add(license_plate, active)
+        return active
+
+    @staticmethod
+    async def rebuild_index(uow: UnitOfWork) -> int:
+        """
+        Loads all open sessions into the in-memory index.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance for database transactions.
+
+        Returns:
+            int: The number of open sessions.
+        """
+        async with uow:
+            sessions = await uow.parking.find_open()
+        active_sessions.rebuild(sessions)
+        return len(active_sessions)
+
+    @staticmethod
+    async def reconcile_occupancy(uow: UnitOfWork) -> int:
+        """
+        Corrects the in-memory occupancy with the number of open sessions in the database.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance for database transactions.
+
+        Returns:
+            int: The number of occupied spaces.
+        """
+        async with uow:
+            occupied = await uow.parking.count_open()
+        occupancy.reconcile(occupied)
+        return occupied
+
+    @staticmethod
+    async def start_session(uow: UnitOfWork, event: ParkingEvent) -> ParkingSessionResponse:
+        """
+        Opens a parking session when a plate enters.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance for database transactions.
+            event (ParkingEvent): The detected license plate and the evidence frame or its digest.
+
+        Returns:
+            ParkingSessionResponse: The new session.
+
+        Raises:
+            HTTPException: If the plate already has an open session.
+        """
+        license_plate = normalize_plate(event.license_plate)
+        if active_sessions.get(license_plate) is not None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Parking session already open"
+            )
+
+        evidence = await ParkingService.store_evidence(event)
+        try:
+            async with uow:
+                user_id = await uow.comments.find_owner_id_by_license_plate(license_plate)
+                session_id = await uow.parking.add_one({
+                    "license_plate": license_plate,
+                    "user_id": user_id,
+                    "started_at": datetime.datetime.utcnow(),
+                    "entry_evidence": evidence,
+                })
+                session = await uow.parking.find_one(id=session_id)
+                await notify(uow.session, OCCUPANCY_CHANNEL, occupancy.message(1))
+                await notify(uow.session, PARKING_SESSIONS_CHANNEL, active_sessions.message(license_plate, session))
+        except IntegrityError:
+            # Opened by another worker whose notification we have not seen yet.
+            await ParkingService._find_open(uow, license_plate)
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Parking session already open"
+            )
+
+        active_sessions.add(license_plate, ActiveSession.of(session))
+        occupancy.apply(1)
+        return ParkingSessionResponse.model_validate(session)
+
+    @staticmethod
+    async def stop_session(uow: UnitOfWork, event: ParkingEvent) -> ParkingSessionResponse:
+        """
+        Closes the open parking session of a plate when it exits and charges
+        its owner in the same transaction.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance for database transactions.
+            event (ParkingEvent): The detected license plate and the evidence frame or its digest.
+
+        Returns:
+            ParkingSessionResponse: The closed session.
+
+        Raises:
+            HTTPException: If the plate has no open session.
+        """
+        license_plate = normalize_plate(event.license_plate)
+        active = await ParkingService._find_open(uow, license_plate)
+        if active is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="No open parking session"
+            )
+
+        evidence = await ParkingService.store_evidence(event)
+        ended_at = datetime.datetime.utcnow()
+        async with uow:
+            session = await uow.parking.close_session(active.id, ended_at, evidence)
+            if session is None:
+                # Closed, and possibly reopened, by another worker whose notification we have not seen yet.
+                open_session = await uow.parking.find_open_by_plate(license_plate)
+                if open_session is not None:
+                    session = await uow.parking.close_session(open_session.id, ended_at, evidence)
+            if session is not None and session.user_id is not None:
+                await uow.ledger.settle_sessions(settings.PARKING_HOURLY_RATE, [session.id])
+            if session is not None:
+                await notify(uow.session, OCCUPANCY_CHANNEL, occupancy.message(-1))
+                await notify(
+                    uow.session, PARKING_SESSIONS_CHANNEL,
+                    active_sessions.message(license_plate, session, closed=True),
+                )
+
+        active_sessions.remove(license_plate)
+        if session is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="No open parking session"
+            )
+        occupancy.apply(-1)
+        return ParkingSessionResponse.model_validate(session)
@@ -1,4 +1,5 @@
 from fastapi import HTTPException, status
+from app.utils.responses import validate_list
 from app.utils.unitofwork import UnitOfWork
 from app.models import Post
 from app.schemas.posts import PostResponse, PostLiteResponse, PostPeriod
@@ -42,7 +43,7 @@ class PostService:
         """
         async with uow:
             posts = await uow.posts.find_all()
-            return [PostLiteResponse.from_orm(post) for post in posts]
+            return validate_list(PostLiteResponse, posts)
 
     async def get_post_by_id(self, uow: UnitOfWork, post_id: int) -> PostResponse:
         """
@@ -130,6 +131,6 @@ class PostService:
         """
         async with uow:
             posts = await uow.posts.find_by_period(period)
-            return [PostLiteResponse.from_orm(post) for post in posts]
+            return validate_list(PostLiteResponse, posts)
         
         
@@ -1,5 +1,8 @@
+from typing import Optional
+
 from fastapi import HTTPException, status
 from sqlalchemy import func, select
+from app.utils.filters import ListQuery
 from app.schemas.users import UserResponse, UserSchemaAdd, UserSchemaUpdate
 from app.utils.unitofwork import UnitOfWork
 
@@ -25,8 +28,7 @@ class UsersService:
         """
         user_dict = user.model_dump()
         async with uow:
-            count = await uow.users.count()
-            if count == 0:
+            if not await uow.users.exists():
                 user_dict["is_admin"] = True
 
             if await uow.users.find_one_or_none(email=user_dict["email"]):
@@ -37,37 +39,47 @@ class UsersService:
             user_id = await uow.users.add_one(user_dict)
             return user_id
 
-    async def get_users(self, uow: UnitOfWork):
+    async def get_users(
+        self, uow: UnitOfWork, fields: Optional[tuple[str, ...]] = None, query: Optional[ListQuery] = None
+    ):
         """
         Retrieves all users from the database.
 
         Args:
             uow (UnitOfWork): The unit of work instance for database transactions.
+            fields (Optional[tuple[str, ...]]): Only load these columns; all of them by default.
+            query (Optional[ListQuery]): Filters and sort order; all users in table order by default.
 
         Returns:
-            list: A list of all users.
+            list: A list of all users, or of rows with the selected columns.
 
         """
         async with uow:
-            users = await uow.users.find_all()
+            users = await uow.users.find_all(fields, query)
             return users
 
-    async def get_user_by_id(self, uow: UnitOfWork, user_id: int) -> UserResponse:
+    async def get_user_by_id(
+        self, uow: UnitOfWork, user_id: int, fields: Optional[tuple[str, ...]] = None
+    ) -> UserResponse:
         """
         Retrieves a user by their ID.
 
         Args:
             uow (UnitOfWork): The unit of work instance for database transactions.
             user_id (int): The ID of the user to be retrieved.
+            fields (Optional[tuple[str, ...]]): Only load these columns; all of them by default.
 
         Returns:
-            UserResponse: The user data.
+            UserResponse: The user data, or a row with the selected columns.
 
         Raises:
             HTTPException: If the user with the specified ID is not found.
         """
         async with uow:
-            user = await uow.users.find_one_or_none(id=user_id)
+            if fields is None:
+                user = await uow.users.find_one_or_none(id=user_id)
+            else:
+                user = await uow.users.find_fields(fields, id=user_id)
             if user is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -1,7 +1,10 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import Depends
+from fastapi import Depends, Query, Request
+from pydantic import BaseModel
 
+from app.utils.filters import ListQuery, parse_query
+from app.utils.responses import parse_fields
 from app.utils.unitofwork import IUnitOfWork, UnitOfWork
 
 
@@ -10,3 +13,31 @@ def get_uow() -> IUnitOfWork:
 
 
 UOWDep = Annotated[IUnitOfWork, Depends(get_uow)]
+
+
+def get_read_uow() -> IUnitOfWork:
+    return UnitOfWork(read_only=True)
+
+
+# For endpoints that only read: served by a replica when one is configured.
+ReadUOWDep = Annotated[IUnitOfWork, Depends(get_read_uow)]
+
+
+def sparse_fields(schema: type[BaseModel]):
+    """Builds a dependency that reads ``?fields=`` and checks it against ``schema``."""
+
+    def get_fields(
+        fields: Optional[str] = Query(None, description="Comma-separated fields to return; all by default."),
+    ) -> Optional[tuple[str, ...]]:
+        return parse_fields(schema, fields)
+
+    return get_fields
+
+
+def list_query(repository):
+    """Builds a dependency that reads filter and ``sort`` query parameters for ``repository``."""
+
+    def get_query(request: Request) -> Optional[ListQuery]:
+        return parse_query(repository, request.query_params.multi_items())
+
+    return get_query
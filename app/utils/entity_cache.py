@@ -0,0 +1,150 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.session import make_transient_to_detached
+
+from app.core.config import settings
+
+# Key in ``Session.info`` under which the entities changed by a transaction are collected.
+PENDING_INVALIDATIONS = "entity_cache_invalidations"
+
+EntityKey = tuple[str, Hashable]
+
+
+def entity_key(model, pk) -> EntityKey:
+    """The cache key of a row: its table name and primary key."""
+    return model.__tablename__, pk
+
+
+class EntityCache:
+    """
+    Process-wide LRU cache of rows, keyed by table and primary key.
+
+    Entries are immutable tuples of column values, never ORM instances, so a
+    cached row cannot be changed by the request that read it. Each read builds a
+    fresh instance from the snapshot. Entries live for ``ttl`` seconds at most, and
+    the least recently used ones are evicted past ``maxsize``. All methods must be
+    called on the event loop.
+
+    Every invalidation bumps the generation of its keys. A reader takes the
+    generation before its query and hands it to :meth:`put`, which drops the
+    snapshot if an invalidation ran while the query was awaited.
+
+    Args:
+        maxsize (int): The maximum number of cached rows.
+        ttl (float): The lifetime of an entry in seconds.
+    """
+
+    def __init__(self, maxsize: int = settings.ENTITY_CACHE_SIZE, ttl: float = settings.ENTITY_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[EntityKey, tuple[tuple, float]] = OrderedDict()
+        self._generations: dict[EntityKey, int] = {}
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, model, pk) -> Optional[Any]:
+        """
+        Returns a new detached instance of a cached row.
+
+        Args:
+            model: The mapped class.
+            pk: The primary key value.
+
+        Returns:
+            Optional[Any]: The instance, or None on a miss.
+        """
+        key = entity_key(model, pk)
+        entry = self._entries.get(key)
+        if entry is None or entry[1] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        mapper = inspect(model)
+        instance = mapper.class_manager.new_instance()
+        for attr, value in zip(mapper.column_attrs, entry[0]):
+            set_committed_value(instance, attr.key, value)
+        make_transient_to_detached(instance)
+        return instance
+
+    def generation(self, key: EntityKey) -> tuple[int, int]:
+        """The invalidation generation of a key, to be passed to :meth:`put` after the read."""
+        return self._epoch, self._generations.get(key, 0)
+
+    def put(self, instance, generation: Optional[tuple[int, int]] = None):
+        """
+        Stores a snapshot of a persistent instance.
+
+        Args:
+            instance: The loaded instance.
+            generation (Optional[tuple[int, int]]): The generation of the row's key taken
+                before it was read; the snapshot is dropped if the key has been invalidated since.
+        """
+        mapper = inspect(instance).mapper
+        key = entity_key(mapper.class_, inspect(instance).identity[0])
+        if generation is not None and generation != self.generation(key):
+            return
+        snapshot = tuple(getattr(instance, attr.key) for attr in mapper.column_attrs)
+        self._entries[key] = (snapshot, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, keys: Iterable[EntityKey]):
+        for key in keys:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+        # Forgetting the counters invalidates every read in flight, which is safe.
+        if len(self._generations) > self.maxsize:
+            self._generations.clear()
+            self._epoch += 1
+
+    def clear(self):
+        self._entries.clear()
+        self._generations.clear()
+        self._epoch += 1
+
+    @staticmethod
+    def record(session, key: EntityKey):
+        """Notes that a transaction changed a row; its entry is dropped again on commit."""
+        session.info.setdefault(PENDING_INVALIDATIONS, set()).add(key)
+
+    @staticmethod
+    def is_pending(session, key: EntityKey) -> bool:
+        """Tells whether the session's own transaction changed a row, so the cache must be bypassed."""
+        return key in session.info.get(PENDING_INVALIDATIONS, ())
+
+    def apply(self, session) -> set[EntityKey]:
+        """Drops the entries of rows changed by a session that has just committed."""
+        keys = session.info.pop(PENDING_INVALIDATIONS, set())
+        self.invalidate(keys)
+        return keys
+
+    @staticmethod
+    def discard(session):
+        session.info.pop(PENDING_INVALIDATIONS, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flushed_changes(session: Session, flush_context):
+    # ``AsyncSession.info`` is the ``info`` of its sync session, so these keys
+    # reach ``UnitOfWork.commit``.
+    for instance in (*session.dirty, *session.deleted):
+        state = inspect(instance)
+        if state.identity is not None:
+            EntityCache.record(session, entity_key(state.mapper.class_, state.identity[0]))
+
+
+entity_cache = EntityCache()
@@ -0,0 +1,197 @@
+import datetime
+from typing import Any, NamedTuple, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import Column, Table, UniqueConstraint, bindparam
+
+# Query parameters that are not filters.
+RESERVED = {"fields", "sort"}
+
+OPERATORS = {
+    "eq": lambda column, param: column == param,
+    "gt": lambda column, param: column > param,
+    "gte": lambda column, param: column >= param,
+    "lt": lambda column, param: column < param,
+    "lte": lambda column, param: column <= param,
+    "in": lambda column, param: column.in_(param),
+}
+
+
+class Filter(NamedTuple):
+    column: str
+    op: str
+    value: Any
+
+    @property
+    def param(self) -> str:
+        return f"f_{self.column}_{self.op}"
+
+
+class ListQuery(NamedTuple):
+    """
+    A parsed filter and sort request for a list endpoint.
+
+    Attributes:
+        filters (tuple[Filter, ...]): Filters, all of which must match.
+        sort (tuple[tuple[str, bool], ...]): Columns to order by, with True for descending.
+    """
+    filters: tuple[Filter, ...] = ()
+    sort: tuple[tuple[str, bool], ...] = ()
+
+    @property
+    def signature(self) -> tuple:
+        # The shape of the statement: which column is compared how, never the values.
+        return tuple((item.column, item.op) for item in self.filters), self.sort
+
+    @property
+    def params(self) -> dict:
+        return {item.param: item.value for item in self.filters}
+
+    def criteria(self, model) -> list:
+        return [
+            OPERATORS[item.op](
+                getattr(model, item.column), bindparam(item.param, expanding=item.op == "in")
+            )
+            for item in self.filters
+        ]
+
+    def order_by(self, model) -> list:
+        return [
+            getattr(model, name).desc() if descending else getattr(model, name).asc()
+            for name, descending in self.sort
+        ]
+
+
+def table_indexes(table: Table) -> list[tuple[str, ...]]:
+    """
+    Lists the column sequences a table has B-tree indexes on.
+
+    Args:
+        table (Table): The table.
+
+    Returns:
+        list[tuple[str, ...]]: The primary key, unique constraints and indexes, as column names in index order.
+    """
+    indexes = [tuple(column.name for column in table.primary_key.columns)]
+    indexes += [
+        tuple(column.name for column in constraint.columns)
+        for constraint in table.constraints
+        if isinstance(constraint, UniqueConstraint)
+    ]
+    indexes += [tuple(column.name for column in index.columns) for index in table.indexes]
+    return [columns for columns in indexes if columns]
+
+
+def uses_index(indexes: list[tuple[str, ...]], query: ListQuery) -> bool:
+    """
+    Tells whether an index can drive a query instead of a sequential scan.
+
+    Filters qualify when they constrain the leading column of an index. With no
+    filters, the first sort column must lead an index, so rows come out of the
+    index already in order.
+
+    Args:
+        indexes (list[tuple[str, ...]]): From :func:`table_indexes`.
+        query (ListQuery): The parsed query.
+
+    Returns:
+        bool: True if some index can serve the query.
+    """
+    if not query.filters:
+        return not query.sort or any(columns[0] == query.sort[0][0] for columns in indexes)
+    filtered = {item.column for item in query.filters}
+    return any(columns[0] in filtered for columns in indexes)
+
+
+def coerce(column: Column, raw: str, op: str):
+    """
+    Converts a query parameter to the Python type of a column.
+
+    Args:
+        column (Column): The filtered column.
+        raw (str): The value from the query string; comma-separated for ``in``.
+        op (str): The operator.
+
+    Returns:
+        Any: The converted value, a list for ``in``.
+
+    Raises:
+        ValueError: If the value does not fit the column.
+    """
+    if op == "in":
+        return [coerce(column, value, "eq") for value in raw.split(",") if value]
+
+    enum_class = getattr(column.type, "enum_class", None)
+    if enum_class is not None:
+        try:
+            return enum_class(raw)
+        except ValueError:
+            return enum_class[raw.upper()]
+    python_type = column.type.python_type
+    if python_type is bool:
+        if raw.lower() not in ("true", "false", "1", "0"):
+            raise ValueError(raw)
+        return raw.lower() in ("true", "1")
+    if python_type is datetime.datetime:
+        return datetime.datetime.fromisoformat(raw)
+    if python_type is datetime.date:
+        return datetime.date.fromisoformat(raw)
+    return python_type(raw)
+
+
+def parse_query(repository, params: list[tuple[str, str]]) -> Optional[ListQuery]:
+    """
+    Parses ``column=``, ``column[op]=`` and ``sort=`` query parameters for a repository.
+
+    Only columns in the repository's ``filterable`` whitelist are accepted, and
+    only in combinations one of the table's indexes can serve.
+
+    Args:
+        repository (type[SQLAlchemyRepository]): The repository the endpoint lists from.
+        params (list[tuple[str, str]]): The query parameters, in order.
+
+    Returns:
+        Optional[ListQuery]: The parsed query, or None if nothing was asked for.
+
+    Raises:
+        HTTPException: If a column, operator or value is invalid, or no index can serve the query.
+    """
+    table = repository.model.__table__
+    filters = []
+    sort = ()
+    for key, raw in params:
+        if key == "sort":
+            sort = tuple(
+                (name.lstrip("-"), name.startswith("-")) for name in raw.split(",") if name.lstrip("-")
+            )
+            for name, _ in sort:
+                if name not in repository.filterable:
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Cannot sort by {name}")
+            continue
+        if key in RESERVED:
+            continue
+
+        name, _, op = key.partition("[")
+        op = op.rstrip("]") or "eq"
+        if name not in repository.filterable:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Cannot filter by {name}")
+        if op not in OPERATORS:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown operator {op}")
+        if any(item.column == name and item.op == op for item in filters):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{key} is given twice")
+        try:
+            value = coerce(table.c[name], raw, op)
+        except (KeyError, ValueError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid value for {key}")
+        filters.append(Filter(name, op, value))
+
+    if not filters and not sort:
+        return None
+    # Sorted by column and operator, so the same filters in any order share one statement.
+    query = ListQuery(tuple(sorted(filters, key=lambda item: (item.column, item.op))), sort)
+    if not uses_index(table_indexes(table), query):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="This combination of filters and sort cannot use an index",
+        )
+    return query
@@ -0,0 +1,241 @@
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+from typing import Optional
+
+from app.core.config import settings
+
+FRAME = 0
+THUMBNAIL = 1
+
+# digest, kind, segment number, offset, length
+_RECORD = struct.Struct("<32sBIQI")
+
+
+class FrameStore:
+    """
+    Content-addressed store for evidence images on local disk.
+
+    Blobs are keyed by the SHA-256 of their bytes, so storing the same frame twice
+    keeps one copy. They are appended to large preallocated segment files, and an
+    append-only index file maps every key to its segment, offset and length.
+    Segments are memory-mapped once, and reads return ``memoryview`` slices of the
+    mapping without copying. Thumbnails are produced by a background thread.
+
+    Several workers may share the directory. Appends hold an exclusive
+    ``flock`` on the index file and first read the records other workers have
+    added, so every blob goes after the last one written by anyone; a read that
+    misses catches up with the index the same way.
+
+    Args:
+        directory (str): Where segments and the index are kept.
+        segment_size (int): The size of a segment file in bytes.
+        thumbnail_size (int): The longest side of a thumbnail in pixels.
+    """
+
+    def __init__(
+        self,
+        directory: str = settings.FRAME_STORE_DIR,
+        segment_size: int = settings.FRAME_STORE_SEGMENT_SIZE,
+        thumbnail_size: int = settings.FRAME_STORE_THUMBNAIL_SIZE,
+    ):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.thumbnail_size = thumbnail_size
+        self._index: dict[tuple[bytes, int], tuple[int, int, int]] = {}
+        self._maps: dict[int, mmap.mmap] = {}
+        self._files: dict[int, int] = {}
+        self._segment = 0
+        self._position = 0
+        # Bytes of the index file already loaded into ``_index``.
+        self._indexed = 0
+        self._index_file = None
+        self._lock = threading.Lock()
+        self._thumbnails: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"segment-{segment:06d}.dat")
+
+    def _open_segment(self, segment: int) -> mmap.mmap:
+        if segment not in self._maps:
+            fd = os.open(self._segment_path(segment), os.O_RDWR | os.O_CREAT, 0o644)
+            if os.fstat(fd).st_size < self.segment_size:
+                os.ftruncate(fd, self.segment_size)
+            self._files[segment] = fd
+            self._maps[segment] = mmap.mmap(fd, self.segment_size)
+        return self._maps[segment]
+
+    def open(self):
+        """Loads the index and starts the thumbnail worker, once."""
+        if self._index_file is not None:
+            return
+        with self._lock:
+            if self._index_file is not None:
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            self._index_file = open(os.path.join(self.directory, "index.log"), "a+b")
+            fcntl.flock(self._index_file, fcntl.LOCK_EX)
+            try:
+                self._catch_up()
+                # A record cut short by a crash is dropped; no writer can be mid-append while we hold the lock.
+                os.ftruncate(self._index_file.fileno(), self._indexed)
+            finally:
+                fcntl.flock(self._index_file, fcntl.LOCK_UN)
+
+        self._worker = threading.Thread(target=self._make_thumbnails, name="frame-thumbnails", daemon=True)
+        self._worker.start()
+
+    def close(self):
+        """Stops the thumbnail worker and releases the files."""
+        if self._worker is not None:
+            self._thumbnails.put(None)
+            self._worker.join()
+            self._worker = None
+        with self._lock:
+            if self._index_file is not None:
+                self._index_file.close()
+                self._index_file = None
+            for segment_map in self._maps.values():
+                try:
+                    segment_map.close()
+                except BufferError:
+                    pass
+            for fd in self._files.values():
+                os.close(fd)
+            self._maps.clear()
+            self._files.clear()
+            self._index.clear()
+            self._segment = self._position = self._indexed = 0
+
+    def _catch_up(self):
+        # Loads the records appended since the last call, by this worker or others. Hold ``_lock``.
+        fd = self._index_file.fileno()
+        data = os.pread(fd, os.fstat(fd).st_size - self._indexed, self._indexed)
+        valid = len(data) - len(data) % _RECORD.size
+        for digest, kind, segment, offset, length in _RECORD.iter_unpack(data[:valid]):
+            self._index[(digest, kind)] = (segment, offset, length)
+            if (segment, offset + length) > (self._segment, self._position):
+                self._segment, self._position = segment, offset + length
+        self._indexed += valid
+
+    def _append(self, digest: bytes, kind: int, data: bytes):
+        if len(data) > self.segment_size:
+            raise ValueError("Blob is larger than a segment")
+        with self._lock:
+            fcntl.flock(self._index_file, fcntl.LOCK_EX)
+            try:
+                self._catch_up()
+                if (digest, kind) in self._index:
+                    return
+                if self._position + len(data) > self.segment_size:
+                    self._segment += 1
+                    self._position = 0
+                self._open_segment(self._segment)
+                os.pwrite(self._files[self._segment], data, self._position)
+                record = (self._segment, self._position, len(data))
+                # The file is opened for appending, so the record always goes at its end.
+                self._index_file.write(_RECORD.pack(digest, kind, *record))
+                self._index_file.flush()
+                self._index[(digest, kind)] = record
+                self._position += len(data)
+                self._indexed += _RECORD.size
+            finally:
+                fcntl.flock(self._index_file, fcntl.LOCK_UN)
+
+    def put(self, data: bytes) -> str:
+        """
+        Stores an encoded frame and schedules its thumbnail.
+
+        Args:
+            data (bytes): The encoded image, e.g. JPEG.
+
+        Returns:
+            str: The hex SHA-256 digest that addresses the frame.
+        """
+        self.open()
+        digest = hashlib.sha256(data).digest()
+        if (digest, FRAME) not in self._index:
+            self._append(digest, FRAME, data)
+            self._thumbnails.put(digest)
+        return digest.hex()
+
+    def _read(self, digest: str, kind: int) -> Optional[memoryview]:
+        self.open()
+        try:
+            key = (bytes.fromhex(digest), kind)
+        except ValueError:
+            return None
+        record = self._index.get(key)
+        with self._lock:
+            if record is None:
+                # Possibly written by another worker since we last looked.
+                fcntl.flock(self._index_file, fcntl.LOCK_SH)
+                try:
+                    self._catch_up()
+                finally:
+                    fcntl.flock(self._index_file, fcntl.LOCK_UN)
+                record = self._index.get(key)
+                if record is None:
+                    return None
+            segment, offset, length = record
+            segment_map = self._open_segment(segment)
+        return memoryview(segment_map)[offset:offset + length]
+
+    def get(self, digest: str) -> Optional[memoryview]:
+        """
+        Returns a zero-copy view of a stored frame.
+
+        Args:
+            digest (str): The hex digest returned by :meth:`put`.
+
+        Returns:
+            Optional[memoryview]: The frame bytes, or None if unknown.
+        """
+        return self._read(digest, FRAME)
+
+    def thumbnail(self, digest: str) -> Optional[memoryview]:
+        """
+        Returns a zero-copy view of the JPEG thumbnail of a stored frame.
+
+        Args:
+            digest (str): The hex digest of the frame.
+
+        Returns:
+            Optional[memoryview]: The thumbnail bytes, or None if not generated yet.
+        """
+        return self._read(digest, THUMBNAIL)
+
+    def _make_thumbnails(self):
+        import cv2
+        import numpy as np
+
+        while True:
+            digest = self._thumbnails.get()
+            if digest is None:
+                return
+            try:
+                frame = self.get(digest.hex())
+                image = cv2.imdecode(np.frombuffer(frame, dtype=np.uint8), cv2.IMREAD_COLOR)
+                if image is None:
+                    continue
+                height, width = image.shape[:2]
+                scale = self.thumbnail_size / max(height, width)
+                if scale < 1:
+                    image = cv2.resize(
+                        image, (max(1, round(width * scale)), max(1, round(height * scale))),
+                        interpolation=cv2.INTER_AREA,
+                    )
+                ok, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, 80])
+                if ok:
+                    self._append(digest, THUMBNAIL, encoded.tobytes())
+            except Exception as e:
+                logging.error(f"Error generating thumbnail for {digest.hex()}: {e}")
+
+
+frame_store = FrameStore()
@@ -1,9 +1,9 @@
 from fastapi import Depends, HTTPException, status
 
+from app.db.fastpath import fastpath
 from app.models import User, BlackList
 from app.models.comments import Comment
 from app.services.auth import auth_service
-# from app.services.parking import ParkingService
 from app.utils.unitofwork import UnitOfWork
 from app.core.config import settings
 
@@ -30,12 +30,20 @@ class Guard:
             )
         return True
     @staticmethod
-    async def blacklisted(uow: UnitOfWork, comment_id: int) -> bool:
+    async def find_comment(uow: UnitOfWork, comment_id: int):
+        # Guards only read the comment, so the fast path spares them the ORM.
+        if fastpath.available:
+            return await fastpath.fetch_one("comment_by_id", comment_id)
         async with uow:
-            car = await uow.comments.find_one_or_none(id=comment_id)
-            if car is None:
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
+            return await uow.comments.find_one_or_none(id=comment_id)
 
+    @staticmethod
+    async def blacklisted(uow: UnitOfWork, comment_id: int) -> bool:
+        car = await Guard.find_comment(uow, comment_id)
+        if car is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
+
+        async with uow:
             comments_in_blacklist = await uow.black_list.find_one_or_none(car_id=car.id)
             if comments_in_blacklist:
                 raise HTTPException(
@@ -46,13 +54,12 @@ class Guard:
 
     @staticmethod
     async def comments_exists(uow: UnitOfWork, comment_id: int):
-        async with uow:
-            car = await uow.comments.find_one_or_none(id=comment_id)
-            if not car:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Comment not found."
-                )
+        car = await Guard.find_comment(uow, comment_id)
+        if not car:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Comment not found."
+            )
         return True
 
 
@@ -0,0 +1,105 @@
+import json
+import logging
+import time
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.listener import WORKER_ID, notify
+from app.utils.entity_cache import PENDING_INVALIDATIONS, entity_cache
+from app.utils.row_counts import PENDING_DELTAS, row_counts
+
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+# Postgres rejects payloads of 8000 bytes or more.
+MAX_PAYLOAD = 7900
+
+
+class InvalidationBus:
+    """
+    Keeps the in-process caches of all workers in step with committed writes.
+
+    Before a unit of work commits, the rows and row counts it changed are sent
+    with ``pg_notify`` in the same transaction, so Postgres delivers them only if
+    the commit succeeds. Every worker applies the messages of the others to its
+    own caches. A transaction that changed too much to describe in one payload
+    asks everyone to flush instead. The delay between sending and applying is
+    tracked, and caches are flushed after the listener reconnects, since
+    messages sent in between are lost.
+    """
+
+    def __init__(self):
+        self.received = 0
+        self.flushes = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._total_lag = 0.0
+
+    @staticmethod
+    def message(session: AsyncSession) -> str:
+        """Builds the payload describing a session's pending changes, or an empty string."""
+        keys = session.info.get(PENDING_INVALIDATIONS)
+        deltas = session.info.get(PENDING_DELTAS)
+        if not keys and not deltas:
+            return ""
+        payload = json.dumps({
+            "worker": WORKER_ID,
+            "sent": time.time(),
+            "keys": sorted(keys or ()),
+            "deltas": {table: delta for table, delta in (deltas or {}).items() if delta},
+        })
+        if len(payload) > MAX_PAYLOAD:
+            payload = json.dumps({"worker": WORKER_ID, "sent": time.time(), "flush": True})
+        return payload
+
+    async def publish(self, session: AsyncSession):
+        """Queues the notification for a session that is about to commit."""
+        payload = self.message(session)
+        if payload:
+            await notify(session, INVALIDATION_CHANNEL, payload)
+
+    def flush(self):
+        """Empties all local caches."""
+        entity_cache.clear()
+        row_counts.invalidate()
+        self.flushes += 1
+
+    async def on_reconnect(self):
+        self.flush()
+
+    def handle_notification(self, payload: str):
+        """Applies the changes committed by another worker."""
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logging.error(f"Malformed invalidation notification: {payload!r}")
+            return
+        if message.get("worker") == WORKER_ID:
+            return
+
+        if message.get("flush"):
+            self.flush()
+        else:
+            entity_cache.invalidate((table, pk) for table, pk in message["keys"])
+            row_counts.apply_deltas(message["deltas"])
+
+        lag = max(time.time() - message["sent"], 0.0)
+        self.received += 1
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+        self._total_lag += lag
+        if lag > settings.INVALIDATION_LAG_WARNING:
+            logging.warning(f"Cache invalidation arrived {lag * 1000:.0f} ms after commit")
+
+    def stats(self) -> dict:
+        """Returns the message counts and propagation lag, in milliseconds."""
+        return {
+            "received": self.received,
+            "flushes": self.flushes,
+            "last_lag_ms": self.last_lag * 1000,
+            "max_lag_ms": self.max_lag * 1000,
+            "mean_lag_ms": self._total_lag / self.received * 1000 if self.received else 0.0,
+        }
+
+
+invalidation_bus = InvalidationBus()
@@ -0,0 +1,238 @@
+import asyncio
+import glob
+import json
+import logging
+import operator
+import os
+import time
+from typing import Callable, Optional, Union
+
+from app.core.config import settings
+
+# Upper bounds of the latency buckets, in seconds.
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Sample = Union[float, dict[str, float]]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items()) + "}"
+
+
+class Metrics:
+    """
+    Request latency and resource metrics of the whole service, in Prometheus text format.
+
+    Every worker counts on its own, in plain dicts touched only from its event
+    loop, so recording needs no locks. Once per ``interval`` each worker writes a
+    snapshot to ``directory``, and :meth:`render` adds up the snapshots of all
+    workers: counters and histograms are summed over every worker that ever
+    wrote one, so they never go backwards when a worker restarts, while gauges
+    only count workers whose snapshot is fresh. The directory should be emptied
+    when the service is deployed, as with Prometheus' own multiprocess mode.
+
+    Args:
+        directory (Optional[str]): Where workers share snapshots; None for a single worker.
+        interval (float): How often snapshots are written, in seconds.
+        buckets (tuple[float, ...]): The latency bucket bounds, in seconds.
+        worker (str): The name of this worker's snapshot.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = settings.METRICS_DIR,
+        interval: float = settings.METRICS_INTERVAL,
+        buckets: tuple[float, ...] = BUCKETS,
+        worker: Optional[str] = None,
+    ):
+        self.directory = directory
+        self.interval = interval
+        self.buckets = buckets
+        self.worker = worker or str(os.getpid())
+        # (route, method, status) -> counts per bucket, then the +Inf count, then the sum of durations.
+        self.latency: dict[tuple[str, str, str], list] = {}
+        self.in_flight = 0
+        self._collectors: dict[str, tuple] = {}
+        self.gauge("http_requests_in_flight", "Requests being served.", lambda: self.in_flight)
+
+    def observe(self, route: str, method: str, status: int, duration: float):
+        """Counts a finished request."""
+        key = (route, method, str(status))
+        counts = self.latency.get(key)
+        if counts is None:
+            counts = self.latency[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        for index, bound in enumerate(self.buckets):
+            if duration <= bound:
+                counts[index] += 1
+                break
+        else:
+            counts[len(self.buckets)] += 1
+        counts[-1] += duration
+
+    def gauge(
+        self,
+        name: str,
+        help: str,
+        collect: Callable[[], Sample],
+        label: Optional[str] = None,
+        aggregate: Callable[[float, float], float] = operator.add,
+    ):
+        """
+        Registers a value read when metrics are collected.
+
+        Args:
+            name (str): The metric name.
+            help (str): Its description.
+            collect (Callable[[], Sample]): Returns the value, or a value per label value.
+            label (Optional[str]): The label name when ``collect`` returns a dict.
+            aggregate (Callable[[float, float], float]): Combines the values of two workers; they are added by default.
+        """
+        self._collectors[name] = ("gauge", help, label, collect, aggregate)
+
+    def counter(self, name: str, help: str, collect: Callable[[], Sample], label: Optional[str] = None):
+        """Registers a total that only grows, read when metrics are collected; see :meth:`gauge`."""
+        self._collectors[name] = ("counter", help, label, collect, operator.add)
+
+    def snapshot(self) -> dict:
+        """Returns this worker's metrics as JSON-compatible data."""
+        values = {}
+        for name, (_, _, _, collect, _) in self._collectors.items():
+            try:
+                sample = collect()
+            except Exception as e:
+                logging.error(f"Error collecting metric {name}: {e}")
+                continue
+            values[name] = sample if isinstance(sample, dict) else {"": sample}
+        return {
+            "time": time.time(),
+            "latency": [[*key, counts] for key, counts in self.latency.items()],
+            "values": values,
+        }
+
+    def dump(self):
+        """Writes this worker's snapshot, replacing the previous one at once."""
+        if self.directory is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{self.worker}.json")
+        with open(f"{path}.tmp", "w") as file:
+            json.dump(self.snapshot(), file)
+        os.replace(f"{path}.tmp", path)
+
+    def _snapshots(self) -> list[dict]:
+        snapshots = [self.snapshot()]
+        if self.directory is None:
+            return snapshots
+        own = os.path.join(self.directory, f"{self.worker}.json")
+        for path in glob.glob(os.path.join(self.directory, "*.json")):
+            if path == own:
+                continue
+            try:
+                with open(path) as file:
+                    snapshots.append(json.load(file))
+            except (OSError, ValueError):
+                # Written by a worker that died mid-write, or removed meanwhile.
+                continue
+        return snapshots
+
+    def render(self) -> str:
+        """
+        Renders the metrics of all workers in the Prometheus text exposition format.
+
+        Returns:
+            str: The exposition, ending with a newline.
+        """
+        snapshots = self._snapshots()
+        fresh_after = time.time() - 3 * self.interval
+
+        latency: dict[tuple, list] = {}
+        for snapshot in snapshots:
+            for route, method, status, counts in snapshot["latency"]:
+                total = latency.setdefault((route, method, status), [0] * len(counts))
+                for index, count in enumerate(counts):
+                    total[index] += count
+
+        lines = [
+            "# HELP http_request_duration_seconds Time to serve a request, by route and status.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (route, method, status), counts in sorted(latency.items()):
+            cumulative = 0
+            for bound, count in zip((*map(str, self.buckets), "+Inf"), counts):
+                cumulative += count
+                labels = _labels(route=route, method=method, status=status, le=bound)
+                lines.append(f"http_request_duration_seconds_bucket{labels} {cumulative}")
+            labels = _labels(route=route, method=method, status=status)
+            lines.append(f"http_request_duration_seconds_sum{labels} {counts[-1]}")
+            lines.append(f"http_request_duration_seconds_count{labels} {cumulative}")
+
+        for name, (kind, help, label, _, aggregate) in sorted(self._collectors.items()):
+            totals: dict[str, float] = {}
+            for snapshot in snapshots:
+                if kind == "gauge" and snapshot["time"] < fresh_after:
+                    continue
+                for key, value in snapshot["values"].get(name, {}).items():
+                    totals[key] = aggregate(totals[key], value) if key in totals else value
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in sorted(totals.items()):
+                lines.append(f"{name}{_labels(**{label: key}) if label else ''} {value}")
+        return "\n".join(lines) + "\n"
+
+    async def run(self):
+        """Writes snapshots, until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.dump()
+            except OSError as e:
+                logging.error(f"Error writing metrics snapshot: {e}")
+
+
+class MetricsMiddleware:
+    """
+    Times every HTTP request and counts the ones in flight.
+
+    Requests are labelled with the path template of their route, e.g.
+    ``/users/{user_id}``, so label values stay few; requests that match no
+    route share the ``unmatched`` label.
+
+    Args:
+        app: The ASGI application.
+        metrics (Metrics): Where to count.
+    """
+
+    def __init__(self, app, metrics: Metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.metrics.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.metrics.in_flight -= 1
+            route = scope.get("route")
+            self.metrics.observe(
+                getattr(route, "path", "unmatched"), scope["method"], status, time.perf_counter() - started
+            )
+
+
+metrics = Metrics()
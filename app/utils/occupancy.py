@@ -0,0 +1,97 @@
+import asyncio
+import datetime
+import json
+import logging
+from typing import AsyncIterator, Optional
+
+from app.core.config import settings
+from app.db.listener import WORKER_ID
+
+OCCUPANCY_CHANNEL = "parking_occupancy"
+
+
+class OccupancyTracker:
+    """
+    In-process count of occupied parking spaces.
+
+    Each worker changes its count locally on session start and stop and tells the
+    other workers through a Postgres notification; a periodic reconciliation
+    with the database corrects any drift. Readers and subscribers never touch
+    the database. All methods must be called on the event loop.
+
+    Args:
+        capacity (Optional[int]): The number of spaces in the lot, if known.
+    """
+
+    def __init__(self, capacity: Optional[int] = settings.PARKING_CAPACITY):
+        self.capacity = capacity
+        self.occupied = 0
+        self.updated_at = datetime.datetime.utcnow()
+        self._subscribers: set[asyncio.Queue] = set()
+
+    def snapshot(self) -> dict:
+        """Returns the current occupancy as a plain dict."""
+        available = None if self.capacity is None else max(self.capacity - self.occupied, 0)
+        return {
+            "occupied": self.occupied,
+            "capacity": self.capacity,
+            "available": available,
+            "updated_at": self.updated_at,
+        }
+
+    def _set(self, occupied: int):
+        if occupied == self.occupied:
+            return
+        self.occupied = occupied
+        self.updated_at = datetime.datetime.utcnow()
+        snapshot = self.snapshot()
+        for queue in self._subscribers:
+            # Slow subscribers only ever get the latest state.
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(snapshot)
+
+    def apply(self, delta: int):
+        """Applies a local change, e.g. +1 on entry and -1 on exit."""
+        self._set(max(self.occupied + delta, 0))
+
+    def reconcile(self, occupied: int):
+        """Replaces the count with the value counted in the database."""
+        self._set(occupied)
+
+    @staticmethod
+    def message(delta: int) -> str:
+        """Builds the notification payload for a change made by this worker."""
+        return json.dumps({"worker": WORKER_ID, "delta": delta})
+
+    def handle_notification(self, payload: str):
+        """Applies a change announced by another worker."""
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logging.error(f"Malformed occupancy notification: {payload!r}")
+            return
+        if message.get("worker") != WORKER_ID:
+            self.apply(int(message["delta"]))
+
+    async def subscribe(self, keepalive: float = settings.OCCUPANCY_KEEPALIVE) -> AsyncIterator[Optional[dict]]:
+        """
+        Yields the current snapshot, then every change.
+
+        Yields None when nothing changed for ``keepalive`` seconds, so that
+        streaming responses can keep idle connections open.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers.add(queue)
+        try:
+            yield self.snapshot()
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            self._subscribers.discard(queue)
+
+
+occupancy = OccupancyTracker()
@@ -0,0 +1,263 @@
+import gc
+import json
+import logging
+import re
+from typing import Iterable, Optional
+
+from app.core.config import settings
+from app.db.listener import WORKER_ID
+
+PLATES_CHANNEL = "license_plates"
+
+# Characters that OCR mixes up are mapped to one representative, so that
+# "AB0123" and "A80I23" share a key and match at distance 0.
+CONFUSABLE = str.maketrans({
+    "O": "0",
+    "Q": "0",
+    "B": "8",
+    "I": "1",
+    "L": "1",
+    "S": "5",
+    "Z": "2",
+    "G": "6",
+})
+
+_NON_ALPHANUMERIC = re.compile(r"[^0-9A-Z]")
+
+
+def normalize_plate(plate: str) -> str:
+    """
+    Brings a license plate to the stored form: upper case, letters and digits only.
+
+    Args:
+        plate (str): The plate as typed or read by OCR.
+
+    Returns:
+        str: The normalized plate.
+    """
+    return _NON_ALPHANUMERIC.sub("", plate.upper())
+
+
+def plate_key(plate: str) -> str:
+    """
+    Returns the confusion-insensitive key of a plate.
+
+    Args:
+        plate (str): The plate as typed or read by OCR.
+
+    Returns:
+        str: The normalized plate with confusable characters collapsed.
+    """
+    return normalize_plate(plate).translate(CONFUSABLE)
+
+
+def edit_distance(first: str, second: str, limit: int) -> int:
+    """
+    Levenshtein distance that gives up once it exceeds ``limit``.
+
+    Returns:
+        int: The distance, or ``limit + 1`` if it is larger than ``limit``.
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    previous = list(range(len(second) + 1))
+    for i, first_char in enumerate(first, 1):
+        current = [i]
+        for j, second_char in enumerate(second, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (first_char != second_char),
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], limit + 1)
+
+
+class AmbiguousPlateError(ValueError):
+    """Raised when several known plates are equally close to a read."""
+
+    def __init__(self, plate: str, candidates: list[str]):
+        super().__init__(f"{plate} is equally close to {', '.join(candidates)}")
+        self.candidates = candidates
+
+
+class PlateIndex:
+    """
+    In-memory index for OCR-tolerant license plate lookups.
+
+    Plates are keyed by :func:`plate_key`, so common OCR confusions cost nothing.
+    Other typos are found with the symmetric deletion method: every key is stored
+    under all its variants with up to ``max_distance`` characters removed, and a
+    query only has to look up its own deletion variants. A lookup is a handful of
+    dictionary hits regardless of the number of plates, and plates can be added
+    and removed one by one. Plates are not unique, so each is counted and only
+    leaves the index with its last reference. Workers announce the plates they add and remove
+    through a Postgres notification, so every worker's index follows.
+
+    Args:
+        max_distance (int): The largest edit distance a search may ask for.
+    """
+
+    def __init__(self, max_distance: int = settings.PLATE_INDEX_MAX_DISTANCE):
+        self.max_distance = max_distance
+        # Key -> plate -> number of references to the plate.
+        self._plates: dict[str, dict[str, int]] = {}
+        self._variants: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(plates) for plates in self._plates.values())
+
+    def __contains__(self, plate: str) -> bool:
+        return normalize_plate(plate) in self._plates.get(plate_key(plate), ())
+
+    def _deletes(self, key: str, distance: int) -> set[str]:
+        variants = {key}
+        frontier = {key}
+        for _ in range(distance):
+            frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+            variants |= frontier
+        return variants
+
+    def add(self, plate: str):
+        """
+        Adds a reference to a plate.
+
+        Args:
+            plate (str): The plate to add.
+        """
+        key = plate_key(plate)
+        if key not in self._plates:
+            self._plates[key] = {}
+            for variant in self._deletes(key, self.max_distance):
+                keys = self._variants.get(variant)
+                if keys is None:
+                    self._variants[variant] = {key}
+                else:
+                    keys.add(key)
+        plates = self._plates[key]
+        plate = normalize_plate(plate)
+        plates[plate] = plates.get(plate, 0) + 1
+
+    def remove(self, plate: str):
+        """
+        Removes a reference to a plate, and the plate with its last reference.
+
+        Args:
+            plate (str): The plate to remove.
+        """
+        key = plate_key(plate)
+        plates = self._plates.get(key)
+        plate = normalize_plate(plate)
+        if plates is None or plate not in plates:
+            return
+        plates[plate] -= 1
+        if plates[plate] > 0:
+            return
+        del plates[plate]
+        if plates:
+            return
+        del self._plates[key]
+        for variant in self._deletes(key, self.max_distance):
+            keys = self._variants.get(variant)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._variants[variant]
+
+    def rebuild(self, plates: Iterable[str]):
+        """
+        Replaces the content of the index.
+
+        Args:
+            plates (Iterable[str]): All known plates, once per reference.
+        """
+        self._plates.clear()
+        self._variants.clear()
+        # Millions of small sets would otherwise trigger repeated full collections.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for plate in plates:
+                self.add(plate)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def search(self, plate: str, distance: Optional[int] = None) -> list[tuple[str, int]]:
+        """
+        Finds the known plates within an edit distance of the given one.
+
+        Args:
+            plate (str): The plate to look for, usually an OCR read.
+            distance (Optional[int]): The maximum distance, ``max_distance`` if omitted.
+
+        Returns:
+            list[tuple[str, int]]: Matching plates with their distance, closest first.
+
+        Raises:
+            ValueError: If the distance is larger than the index was built for.
+        """
+        if distance is None:
+            distance = self.max_distance
+        if distance > self.max_distance:
+            raise ValueError(f"The index supports distances up to {self.max_distance}")
+
+        query = plate_key(plate)
+        candidates = set()
+        for variant in self._deletes(query, distance):
+            candidates.update(self._variants.get(variant, ()))
+
+        matches = []
+        for key in candidates:
+            key_distance = edit_distance(query, key, distance)
+            if key_distance <= distance:
+                matches.extend((match, key_distance) for match in self._plates[key])
+        return sorted(matches, key=lambda match: (match[1], match[0]))
+
+    def best_match(self, plate: str, distance: Optional[int] = None) -> Optional[str]:
+        """
+        Returns the closest known plate, preferring an exact match.
+
+        Args:
+            plate (str): The plate to look for.
+            distance (Optional[int]): The maximum distance, ``max_distance`` if omitted.
+
+        Returns:
+            Optional[str]: The closest plate, or None if nothing is close enough.
+
+        Raises:
+            AmbiguousPlateError: If several plates are closest, e.g. two that differ only in confusable characters.
+        """
+        if plate in self:
+            return normalize_plate(plate)
+        matches = self.search(plate, distance)
+        if not matches:
+            return None
+        best = [match for match, match_distance in matches if match_distance == matches[0][1]]
+        if len(best) > 1:
+            raise AmbiguousPlateError(normalize_plate(plate), best)
+        return best[0]
+
+    @staticmethod
+    def message(added: Iterable[str] = (), removed: Iterable[str] = ()) -> str:
+        """Builds the notification payload for plates this worker added or removed."""
+        return json.dumps({"worker": WORKER_ID, "added": list(added), "removed": list(removed)})
+
+    def handle_notification(self, payload: str):
+        """Applies the plates added or removed by another worker."""
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logging.error(f"Malformed license plate notification: {payload!r}")
+            return
+        if message.get("worker") == WORKER_ID:
+            return
+        for plate in message.get("added", ()):
+            self.add(plate)
+        for plate in message.get("removed", ()):
+            self.remove(plate)
+
+
+plate_index = PlateIndex()
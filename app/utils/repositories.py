@@ -1,9 +1,47 @@
 from abc import ABC, abstractmethod
+from enum import Enum
 from typing import List, Optional
 
-from sqlalchemy import RowMapping, delete, insert, select, update, func
+from sqlalchemy import RowMapping, bindparam, delete, insert, select, update, func, text
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.sql import ClauseElement
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.replicas import REPLICA
+from app.db.slow_queries import trace_methods
+from app.utils.entity_cache import entity_cache, entity_key
+from app.utils.filters import ListQuery
+from app.utils.row_counts import row_counts
+from app.utils.statement_cache import statement_cache
+
+
+class CountMode(str, Enum):
+    """How :meth:`SQLAlchemyRepository.count` counts rows.
+
+    Attributes:
+        EXACT: ``SELECT count(*)``; reads every matching row.
+        ESTIMATE: The planner's estimate from ``pg_class`` statistics, scaled to the current table size.
+        EXISTS: 1 if any row matches, else 0; stops at the first row.
+        CACHED: A per-worker count kept current by repository inserts and deletes.
+    """
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    EXISTS = "exists"
+    CACHED = "cached"
+
+
+# The same arithmetic the planner uses: tuples per page at the last ANALYZE,
+# times the number of pages the table has now.
+_ESTIMATE = text("""
+    SELECT CASE WHEN c.reltuples < 0 OR c.relpages = 0 THEN NULL
+                ELSE c.reltuples / c.relpages
+                     * (pg_relation_size(c.oid) / current_setting('block_size')::int)
+           END
+    FROM pg_class c
+    WHERE c.oid = to_regclass(:table)
+""")
+
 
 class AbstractRepository(ABC):
     @abstractmethod
@@ -43,42 +81,228 @@ class AbstractRepository(ABC):
 
 class SQLAlchemyRepository(AbstractRepository):
     model = None
+    # Serve ``find_one``/``find_one_or_none(id=...)`` from the process-wide entity cache.
+    cache_entities = False
+    # Indexed columns that list endpoints may filter and sort by, see app.utils.filters.
+    filterable: frozenset[str] = frozenset()
 
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Slow statements are logged with the repository method that ran them.
+        trace_methods(cls)
+
+    def _cache_key(self, filter_by: dict):
+        if not self.cache_entities or len(filter_by) != 1 or "id" not in filter_by:
+            return None
+        key = entity_key(self.model, filter_by["id"])
+        # Rows this transaction changed are read from the database until it commits.
+        if entity_cache.is_pending(self.session, key):
+            return None
+        return key
+
+    def _generation(self, filter_by: dict):
+        key = self._cache_key(filter_by)
+        return None if key is None else entity_cache.generation(key)
+
+    def _remember(self, instance, filter_by: dict, generation):
+        # Replica reads may predate an invalidation already applied here.
+        if generation is not None and self._cache_key(filter_by) is not None and not self.session.info.get(REPLICA):
+            entity_cache.put(instance, generation)
+
+    async def _from_cache(self, filter_by: dict):
+        if self._cache_key(filter_by) is None:
+            return None
+        instance = entity_cache.get(self.model, filter_by["id"])
+        if instance is None:
+            return None
+        return await self.session.merge(instance, load=False)
+
+    def _where(self, filter_by: dict):
+        # None filters compile to IS NULL, so nullness is part of the signature.
+        signature = tuple(sorted((key, value is None) for key, value in filter_by.items()))
+        params = {f"p_{key}": value for key, value in filter_by.items() if value is not None}
+        return signature, params
+
+    def _criteria(self, signature: tuple) -> list:
+        return [
+            getattr(self.model, key).is_(None) if is_null else getattr(self.model, key) == bindparam(f"p_{key}")
+            for key, is_null in signature
+        ]
+
+    def _select_by(self, filter_by: dict):
+        signature, params = self._where(filter_by)
+        stmt = statement_cache.get(
+            (self.model, "select", signature),
+            lambda: select(self.model).where(*self._criteria(signature)),
+        )
+        return stmt, params
+
+    def _invalidate(self, id):
+        if self.cache_entities:
+            key = entity_key(self.model, id)
+            entity_cache.record(self.session, key)
+            entity_cache.invalidate([key])
+
+    @staticmethod
+    def _values(data: dict):
+        # SQL expressions among the values cannot become bound parameters.
+        if any(isinstance(value, ClauseElement) for value in data.values()):
+            return None, None
+        return tuple(sorted(data)), {f"v_{key}": value for key, value in data.items()}
+
     async def add_one(self, data: dict) -> int:
-        stmt = insert(self.model).values(**data).returning(self.model.id)
-        res = await self.session.execute(stmt)
+        columns, params = self._values(data)
+        if columns is None:
+            stmt, params = insert(self.model).values(**data).returning(self.model.id), None
+        else:
+            stmt = statement_cache.get(
+                (self.model, "insert", columns),
+                lambda: insert(self.model)
+                .values({key: bindparam(f"v_{key}") for key in columns})
+                .returning(self.model.id),
+            )
+        res = await self.session.execute(stmt, params)
+        row_counts.record(self.session, self.model.__tablename__, 1)
         return res.scalar_one()
 
-    async def edit_one(self, id: int, data: dict) -> int:
-        stmt = (
-            update(self.model).values(**data).filter_by(id=id).returning(self.model.id)
+    def _update_by_id(self, columns: tuple[str, ...]):
+        # The ORM cannot read bound values, so neither "evaluate" nor "fetch" can update
+        # loaded objects; _sync_loaded does it.
+        return statement_cache.get(
+            (self.model, "update", columns),
+            lambda: update(self.model)
+            .where(self.model.id == bindparam("p_id"))
+            .values({key: bindparam(f"v_{key}") for key in columns})
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False),
         )
-        res = await self.session.execute(stmt)
+
+    def _sync_loaded(self, id: int, data: dict):
+        # Sets the new values on the object if the session has it loaded, without a reload.
+        instance = self.session.identity_map.get(identity_key(self.model, id))
+        if instance is not None:
+            for key, value in data.items():
+                set_committed_value(instance, key, value)
+
+    def _delete_by_id(self):
+        # "fetch" finds the deleted objects from the RETURNING rows and removes them from the session.
+        return statement_cache.get(
+            (self.model, "delete"),
+            lambda: delete(self.model)
+            .where(self.model.id == bindparam("p_id"))
+            .returning(self.model)
+            .execution_options(synchronize_session="fetch"),
+        )
+
+    async def edit_one(self, id: int, data: dict) -> int:
+        columns, params = self._values(data)
+        if columns is None:
+            stmt = update(self.model).values(**data).filter_by(id=id).returning(self.model.id)
+            params = None
+        else:
+            stmt = self._update_by_id(columns)
+            params["p_id"] = id
+        res = await self.session.execute(stmt, params)
+        if columns is not None:
+            self._sync_loaded(id, data)
+        self._invalidate(id)
         return res.scalar_one()
 
-    async def find_all(self):
-        stmt = select(self.model)
-        res = await self.session.execute(stmt)
-        return res.scalars().all()
+    def _columns(self, fields: tuple[str, ...]) -> list:
+        return [getattr(self.model, name) for name in fields]
+
+    async def find_all(self, fields: Optional[tuple[str, ...]] = None, query: Optional[ListQuery] = None):
+        def build():
+            # Only the selected columns leave Postgres; rows are returned instead of entities.
+            stmt = select(self.model) if fields is None else select(*self._columns(fields))
+            if query is not None:
+                stmt = stmt.where(*query.criteria(self.model)).order_by(*query.order_by(self.model))
+            return stmt
+
+        signature = query.signature if query is not None else None
+        stmt = statement_cache.get((self.model, "all", fields, signature), build)
+        res = await self.session.execute(stmt, query.params if query is not None else None)
+        return res.scalars().all() if fields is None else res.all()
+
+    async def find_fields(self, fields: tuple[str, ...], **filter_by):
+        signature, params = self._where(filter_by)
+        stmt = statement_cache.get(
+            (self.model, "select", signature, fields),
+            lambda: select(*self._columns(fields)).where(*self._criteria(signature)),
+        )
+        res = await self.session.execute(stmt, params)
+        return res.one_or_none()
 
     async def find_one(self, **filter_by):
-        stmt = select(self.model).filter_by(**filter_by)
-        res = await self.session.execute(stmt)
-        return res.scalar_one()
+        cached = await self._from_cache(filter_by)
+        if cached is not None:
+            return cached
+        generation = self._generation(filter_by)
+        stmt, params = self._select_by(filter_by)
+        res = await self.session.execute(stmt, params)
+        instance = res.scalar_one()
+        self._remember(instance, filter_by, generation)
+        return instance
 
     async def find_one_or_none(self, **filter_by):
-        stmt = select(self.model).filter_by(**filter_by)
-        res = await self.session.execute(stmt)
-        return res.scalar_one_or_none()
+        cached = await self._from_cache(filter_by)
+        if cached is not None:
+            return cached
+        generation = self._generation(filter_by)
+        stmt, params = self._select_by(filter_by)
+        res = await self.session.execute(stmt, params)
+        instance = res.scalar_one_or_none()
+        if instance is not None:
+            self._remember(instance, filter_by, generation)
+        return instance
 
     async def delete_one(self, id: int) -> RowMapping:
-        stmt = delete(self.model).filter_by(id=id).returning(self.model)
-        res = await self.session.execute(stmt)
+        res = await self.session.execute(self._delete_by_id(), {"p_id": id})
+        deleted = res.scalar_one()
+        row_counts.record(self.session, self.model.__tablename__, -1)
+        self._invalidate(id)
+        return deleted
+
+    async def exists(self, **filter_by) -> bool:
+        signature, params = self._where(filter_by)
+        stmt = statement_cache.get(
+            (self.model, "exists", signature),
+            lambda: select(select(self.model).where(*self._criteria(signature)).exists()),
+        )
+        res = await self.session.execute(stmt, params)
         return res.scalar_one()
 
-    async def count(self) -> int:
-        result = await self.session.execute(select(func.count()).select_from(self.model))
-        return result.scalar_one()
+    async def count(self, mode: CountMode = CountMode.EXACT, **filter_by) -> int:
+        if mode == CountMode.EXISTS:
+            return int(await self.exists(**filter_by))
+        if filter_by and mode != CountMode.EXACT:
+            raise ValueError(f"{mode.value} counts cover the whole table and take no filters")
+
+        table = self.model.__tablename__
+        if mode == CountMode.ESTIMATE:
+            res = await self.session.execute(_ESTIMATE, {"table": table})
+            estimate = res.scalar_one_or_none()
+            if estimate is not None:
+                return int(estimate)
+            # Never analyzed: nothing to estimate from.
+        elif mode == CountMode.CACHED:
+            cached = row_counts.get(table)
+            if cached is not None:
+                return cached
+
+        signature, params = self._where(filter_by)
+        stmt = statement_cache.get(
+            (self.model, "count", signature),
+            lambda: select(func.count()).select_from(self.model).where(*self._criteria(signature)),
+        )
+        res = await self.session.execute(stmt, params)
+        count = res.scalar_one()
+        if mode == CountMode.CACHED:
+            row_counts.set(table, count)
+        return count
+
+
+trace_methods(SQLAlchemyRepository)
@@ -0,0 +1,132 @@
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    """Returns the one ``TypeAdapter`` for lists of a schema, built on first use."""
+    return TypeAdapter(list[schema])
+
+
+def validate_list(schema: type[BaseModel], rows: Sequence[Any]) -> list:
+    """
+    Validates a whole list of ORM objects or rows in a single pydantic-core call.
+
+    Args:
+        schema (type[BaseModel]): The item schema.
+        rows (Sequence[Any]): Objects with the schema's attributes.
+
+    Returns:
+        list: The validated models.
+    """
+    return list_adapter(schema).validate_python(rows, from_attributes=True)
+
+
+class PydanticJSONResponse(Response):
+    """JSON response whose body was already serialized to bytes by pydantic-core."""
+
+    media_type = "application/json"
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+def parse_fields(schema: type[BaseModel], fields: Optional[str]) -> Optional[tuple[str, ...]]:
+    """
+    Checks a ``?fields=`` value against a response schema.
+
+    Args:
+        schema (type[BaseModel]): The response schema.
+        fields (Optional[str]): Comma-separated field names, or None for all of them.
+
+    Returns:
+        Optional[tuple[str, ...]]: The selected fields in schema order, or None for all of them.
+
+    Raises:
+        HTTPException: If a field is not part of the schema, or none is given.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - schema.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    if not requested:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No fields selected")
+    # Schema order keeps one trimmed schema and one statement per selection.
+    return tuple(name for name in schema.model_fields if name in requested)
+
+
+@lru_cache(maxsize=None)
+def partial_schema(schema: type[BaseModel], fields: Optional[tuple[str, ...]]) -> type[BaseModel]:
+    """
+    Returns a copy of a schema that keeps only the selected fields, built on first use.
+
+    Args:
+        schema (type[BaseModel]): The full schema.
+        fields (Optional[tuple[str, ...]]): Fields from :func:`parse_fields`, or None for the full schema.
+
+    Returns:
+        type[BaseModel]: The trimmed schema, with the original types and constraints.
+    """
+    if fields is None:
+        return schema
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in fields},
+    )
+
+
+def json_response(
+    schema: type[BaseModel], item: Any, fields: Optional[tuple[str, ...]] = None
+) -> PydanticJSONResponse:
+    """
+    Serializes one object for a detail endpoint, limited to the selected fields.
+
+    Args:
+        schema (type[BaseModel]): The response schema.
+        item (Any): A model, or an object to validate into one.
+        fields (Optional[tuple[str, ...]]): Fields from :func:`parse_fields`, or None for all of them.
+
+    Returns:
+        PydanticJSONResponse: The JSON object.
+    """
+    if fields is not None and isinstance(item, BaseModel):
+        item = item.model_dump(include=set(fields))
+    partial = partial_schema(schema, fields)
+    if not isinstance(item, partial):
+        item = partial.model_validate(item, from_attributes=True)
+    return PydanticJSONResponse(item.model_dump_json())
+
+
+def json_list_response(
+    schema: type[BaseModel], items: Sequence[Any], fields: Optional[tuple[str, ...]] = None
+) -> PydanticJSONResponse:
+    """
+    Serializes a list for an endpoint in one pass.
+
+    Items that are not yet instances of the schema are validated first, as one
+    list; models a service has already validated are dumped as they are.
+    Returning a ``Response`` makes FastAPI skip its own validation and encoding,
+    so ``response_model`` only documents the endpoint.
+
+    Args:
+        schema (type[BaseModel]): The item schema.
+        items (Sequence[Any]): Models, or objects to validate into models.
+        fields (Optional[tuple[str, ...]]): Fields from :func:`parse_fields`; the items are
+            serialized with a schema trimmed to them.
+
+    Returns:
+        PydanticJSONResponse: The JSON array.
+    """
+    schema = partial_schema(schema, fields)
+    if items and not isinstance(items[0], schema):
+        items = validate_list(schema, items)
+    return PydanticJSONResponse(list_adapter(schema).dump_json(items))
@@ -0,0 +1,68 @@
+import time
+from collections import Counter
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+# Key in ``Session.info`` under which uncommitted row count changes are collected.
+PENDING_DELTAS = "row_count_deltas"
+
+
+class RowCountCache:
+    """
+    Per-worker row counts of whole tables, kept current by repository writes.
+
+    A count is seeded by one exact ``count(*)``. After that, inserts and deletes
+    made through the repositories adjust it when their transaction commits.
+    Writes from other workers, or from statements that bypass ``add_one`` and
+    ``delete_one``, are not seen, so every count is recounted after ``ttl`` seconds.
+
+    Args:
+        ttl (float): The lifetime of a count in seconds.
+    """
+
+    def __init__(self, ttl: float = settings.ROW_COUNT_CACHE_TTL):
+        self.ttl = ttl
+        self._counts: dict[str, tuple[int, float]] = {}
+
+    def get(self, table: str) -> Optional[int]:
+        """Returns the cached count of a table, or None if missing or expired."""
+        entry = self._counts.get(table)
+        if entry is None or time.monotonic() - entry[1] > self.ttl:
+            return None
+        return entry[0]
+
+    def set(self, table: str, count: int):
+        self._counts[table] = (count, time.monotonic())
+
+    def invalidate(self, table: Optional[str] = None):
+        if table is None:
+            self._counts.clear()
+        else:
+            self._counts.pop(table, None)
+
+    @staticmethod
+    def record(session: AsyncSession, table: str, delta: int):
+        """Notes a change on the session, to be applied if it commits."""
+        session.info.setdefault(PENDING_DELTAS, Counter())[table] += delta
+
+    def apply_deltas(self, deltas: dict[str, int]):
+        """Adjusts the cached counts by committed changes, e.g. from another worker."""
+        for table, delta in deltas.items():
+            entry = self._counts.get(table)
+            if entry is not None:
+                self._counts[table] = (max(entry[0] + delta, 0), entry[1])
+
+    def apply(self, session: AsyncSession):
+        """Applies the changes noted on a session that has just committed."""
+        self.apply_deltas(session.info.pop(PENDING_DELTAS, {}))
+
+    @staticmethod
+    def discard(session: AsyncSession):
+        """Forgets the changes noted on a session that rolled back."""
+        session.info.pop(PENDING_DELTAS, None)
+
+
+row_counts = RowCountCache()
@@ -0,0 +1,46 @@
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from app.core.config import settings
+
+
+class StatementCache:
+    """
+    Process-wide store of pre-built statements, keyed by model, operation and
+    the shape of the arguments (which columns are filtered or set), never by
+    their values, which are passed as bound parameters at execution.
+
+    Reusing the same statement object spares building the construct on every
+    call and lets SQLAlchemy find its compiled form at once.
+
+    Args:
+        maxsize (int): The number of statements kept; the least recently used go first.
+    """
+
+    def __init__(self, maxsize: int = settings.STATEMENT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._statements: OrderedDict[Hashable, object] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def get(self, key: Hashable, build: Callable[[], object]):
+        """Returns the statement for a key, building it on first use."""
+        statement = self._statements.get(key)
+        if statement is not None:
+            self._statements.move_to_end(key)
+            self.hits += 1
+            return statement
+        self.misses += 1
+        statement = self._statements[key] = build()
+        if len(self._statements) > self.maxsize:
+            self._statements.popitem(last=False)
+        return statement
+
+    def stats(self) -> dict:
+        return {"size": len(self._statements), "hits": self.hits, "misses": self.misses}
+
+
+statement_cache = StatementCache()
@@ -1,10 +1,18 @@
 from abc import ABC, abstractmethod
 
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
 from app.db.database import async_session
+from app.db.replicas import WROTE, current_user_id, replica_router
+from app.utils.entity_cache import entity_cache
+from app.utils.invalidation import invalidation_bus
+from app.utils.row_counts import row_counts
 from app.repositories.comments import CommentsRepository
 from app.repositories.posts import PostRepository
 from app.repositories.users import UsersRepository
 from app.repositories.black_list import BlackListRepository
+from app.repositories.parking import ParkingRepository
+from app.repositories.ledger import LedgerRepository
 
 
 class AuthRepository:
@@ -16,6 +24,8 @@ class IUnitOfWork(ABC):
     comments: CommentsRepository
     posts: PostRepository
     black_list: BlackListRepository
+    parking: ParkingRepository
+    ledger: LedgerRepository
 
     @abstractmethod
     def __init__(self): ...
@@ -34,16 +44,22 @@ class IUnitOfWork(ABC):
 
 
 class UnitOfWork(IUnitOfWork):
-    def __init__(self):
+    def __init__(self, read_only: bool = False):
+        self.read_only = read_only
         self.session_factory = async_session
 
     async def __aenter__(self):
-        self.session = self.session_factory()
+        if self.read_only:
+            self.session = replica_router.session_factory(current_user_id.get())()
+        else:
+            self.session = self.session_factory()
 
         self.users = UsersRepository(self.session)
         self.comments = CommentsRepository(self.session)
         self.posts = PostRepository(self.session)
         self.black_list = BlackListRepository(self.session)
+        self.parking = ParkingRepository(self.session)
+        self.ledger = LedgerRepository(self.session)
         return self
 
     async def __aexit__(self, exc_type, exc_value, traceback):
@@ -54,7 +70,31 @@ class UnitOfWork(IUnitOfWork):
         await self.session.close()
 
     async def commit(self):
+        # Flush first so that ORM changes are known before the notification is queued.
+        await self.session.flush()
+        await invalidation_bus.publish(self.session)
         await self.session.commit()
+        if self.session.info.pop(WROTE, False):
+            replica_router.pin(current_user_id.get())
+        row_counts.apply(self.session)
+        entity_cache.apply(self.session)
 
     async def rollback(self):
         await self.session.rollback()
+        self.session.info.pop(WROTE, None)
+        row_counts.discard(self.session)
+        entity_cache.discard(self.session)
+
+
+async def prepare_hot_statements(connection: AsyncConnection):
+    """
+    Runs the lookups that nearly every request makes on a connection, so that
+    their prepared statements are cached on it before real traffic arrives.
+    """
+    uow = UnitOfWork()
+    uow.session_factory = lambda: AsyncSession(bind=connection, expire_on_commit=False)
+    async with uow:
+        await uow.users.find_one_or_none(email="")
+        await uow.users.find_one_or_none(id=0)
+        await uow.comments.find_one_or_none(id=0)
+        await uow.black_list.find_one_or_none(user_id=0)
@@ -0,0 +1,146 @@
+import asyncio
+import json
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from app.core.config import settings
+
+
+class LoopWatchdog:
+    """
+    Finds the code that blocks the event loop, in production traffic.
+
+    A heartbeat task on the loop records when it last ran and how late its
+    timer fired. A helper thread checks the heartbeat; once the loop has not
+    run it for ``threshold`` seconds, the thread takes the stack of the loop
+    thread, which is still inside the blocking call, and logs it as one JSON
+    line with the task and the route of the request it serves. A block is
+    reported once, however long it lasts.
+
+    Args:
+        interval (float): How often the heartbeat runs, in seconds.
+        threshold (float): How long the loop may go without running it, in seconds.
+        max_frames (int): How many of the innermost frames are logged.
+    """
+
+    def __init__(
+        self,
+        interval: float = settings.WATCHDOG_INTERVAL,
+        threshold: float = settings.WATCHDOG_THRESHOLD,
+        max_frames: int = 30,
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self.max_frames = max_frames
+        # Task -> ASGI scope of the request it serves; kept by WatchdogMiddleware.
+        self.requests: dict[asyncio.Task, dict] = {}
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.blocks = 0
+        self._beat = time.monotonic()
+        self._reported = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        """Starts the heartbeat on the running loop and the helper thread."""
+        if self._heartbeat is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        self._heartbeat = self._loop.create_task(self._run_heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    async def _run_heartbeat(self):
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self._beat = time.monotonic()
+            self.lag = max(0.0, self._beat - started - self.interval)
+            self.max_lag = max(self.max_lag, self.lag)
+
+    def _watch(self):
+        while not self._stopped.wait(self.interval / 2):
+            beat = self._beat
+            blocked = time.monotonic() - beat
+            if blocked >= self.threshold and beat != self._reported:
+                self._reported = beat
+                self.blocks += 1
+                try:
+                    self.report(blocked)
+                except Exception as e:
+                    logging.error(f"Error reporting a blocked event loop: {e}")
+
+    def report(self, blocked: float):
+        """Logs what the loop thread is running; called from the helper thread."""
+        frame = sys._current_frames().get(self._loop_thread)
+        stack = traceback.extract_stack(frame)[-self.max_frames:] if frame is not None else []
+        # Reading the loop's current task from here is a plain dict lookup.
+        task = asyncio.current_task(self._loop)
+        scope = self.requests.get(task, {}) if task is not None else {}
+        route = scope.get("route")
+        logging.warning(json.dumps({
+            "event": "event_loop_blocked",
+            "blocked_ms": round(blocked * 1000),
+            "task": task.get_name() if task is not None else None,
+            "coroutine": getattr(task.get_coro(), "__qualname__", None) if task is not None else None,
+            "method": scope.get("method"),
+            "route": getattr(route, "path", scope.get("path")),
+            "stack": [f"{entry.filename}:{entry.lineno} in {entry.name}" for entry in stack],
+        }))
+
+    def stats(self) -> dict:
+        return {
+            "lag_ms": self.lag * 1000,
+            "max_lag_ms": self.max_lag * 1000,
+            "blocks": self.blocks,
+            "threshold_ms": self.threshold * 1000,
+        }
+
+
+class WatchdogMiddleware:
+    """
+    Tells the watchdog which request every task serves, so blocks are reported with their route.
+
+    Args:
+        app: The ASGI application.
+        watchdog (LoopWatchdog): The watchdog to inform.
+    """
+
+    def __init__(self, app, watchdog: LoopWatchdog):
+        self.app = app
+        self.watchdog = watchdog
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        task = asyncio.current_task()
+        self.watchdog.requests[task] = scope
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.watchdog.requests.pop(task, None)
+
+
+loop_watchdog = LoopWatchdog()
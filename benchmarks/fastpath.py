@@ -0,0 +1,130 @@
+"""Compare the asyncpg fast path with the ORM on the same hot queries.
+
+Usage::
+
+    python -m benchmarks.fastpath --iterations 5000 --concurrency 1,8 --output bench/fastpath.json
+
+Needs a reachable database with some users and comments. For every query of
+the fast path registry the report holds operations per second and latency
+percentiles, in microseconds, for both paths, as JSON. The ORM path bypasses the
+entity cache so that both paths go to Postgres.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+from sqlalchemy import select
+
+from app.db.database import async_session
+from app.db.fastpath import FastPath
+from app.models import Comment, User
+from app.repositories.comments import CommentsRepository
+from app.repositories.users import UsersRepository
+from benchmarks import git_revision
+
+
+class UncachedUsers(UsersRepository):
+    cache_entities = False
+
+
+class UncachedComments(CommentsRepository):
+    cache_entities = False
+
+
+ORM_QUERIES = {
+    "user_by_email": lambda session, value: UncachedUsers(session).find_one_or_none(email=value),
+    "user_by_id": lambda session, value: UncachedUsers(session).find_one_or_none(id=value),
+    "comment_by_id": lambda session, value: UncachedComments(session).find_one_or_none(id=value),
+}
+
+
+async def sample_arguments(limit: int) -> dict:
+    async with async_session() as session:
+        users = (await session.execute(select(User.id, User.email).limit(limit))).all()
+        comments = (await session.execute(select(Comment.id).limit(limit))).scalars().all()
+    return {
+        "user_by_email": [row.email for row in users],
+        "user_by_id": [row.id for row in users],
+        "comment_by_id": list(comments),
+    }
+
+
+async def measure(call, values: list, iterations: int, concurrency: int) -> dict:
+    latencies = []
+
+    async def worker(offset: int):
+        for index in range(offset, iterations, concurrency):
+            started = time.perf_counter()
+            await call(values[index % len(values)])
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+    wall_time = time.perf_counter() - started
+
+    p50, p95, p99 = np.percentile(np.array(latencies) * 1e6, [50, 95, 99])
+    return {"ops_per_second": iterations / wall_time, "latency_us": {"p50": p50, "p95": p95, "p99": p99}}
+
+
+async def run(iterations: int, concurrency_levels: list[int]) -> list[dict]:
+    arguments = await sample_arguments(1000)
+    results = []
+    for concurrency in concurrency_levels:
+        fastpath = FastPath(min_size=concurrency, max_size=concurrency)
+        await fastpath.start()
+        try:
+            for name, orm_query in ORM_QUERIES.items():
+                values = arguments[name]
+                if not values:
+                    continue
+
+                async def orm(value):
+                    async with async_session() as session:
+                        return await orm_query(session, value)
+
+                async def fast(value):
+                    return await fastpath.fetch_one(name, value)
+
+                results.append({
+                    "query": name,
+                    "concurrency": concurrency,
+                    "orm": await measure(orm, values, iterations, concurrency),
+                    "fastpath": await measure(fast, values, iterations, concurrency),
+                })
+        finally:
+            await fastpath.close()
+    return results
+
+
+def parse_sizes(value: str) -> list[int]:
+    return [int(size) for size in value.split(",") if size]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--concurrency", type=parse_sizes, default=[1, 8])
+    parser.add_argument("--output", help="Write the report to this file instead of stdout")
+    args = parser.parse_args()
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "results": asyncio.run(run(args.iterations, args.concurrency)),
+    }
+
+    content = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(content)
+    else:
+        print(content)
+
+
+if __name__ == "__main__":
+    main()
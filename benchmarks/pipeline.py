@@ -0,0 +1,131 @@
+"""Benchmark the Detector to CharacterRecognizer path on synthetic frames.
+
+Usage::
+
+    python -m benchmarks.pipeline --frames 500 --batch-sizes 1,8,32 --workers 1,2,4 \\
+        --output bench/pipeline.json
+
+Every worker owns its own models and pulls batches from a shared queue. For each
+batch size and worker count the report holds frames per second, per-frame
+latency percentiles (from batch submission to batch completion), plate accuracy
+and the peak resident set size of the process, as JSON.
+"""
+import argparse
+import json
+import platform
+import queue
+import resource
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from app.core.config import settings
+from app.data_science.character_recogniser import CharacterRecognizer
+from app.data_science.detector import Detector
+from app.data_science.pipeline import RecognitionPipeline
+from app.data_science.scheduler import Frame
+from app.data_science.voting import PlateVoter
+from benchmarks import git_revision
+from benchmarks.synthetic import make_scenes
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in megabytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run(scenes, batch_size: int, workers: int) -> dict:
+    pipelines = [
+        RecognitionPipeline(Detector(max_batch=batch_size), CharacterRecognizer(max_batch=batch_size), PlateVoter())
+        for _ in range(workers)
+    ]
+    for pipeline in pipelines:
+        pipeline.detector.warmup()
+        pipeline.recognizer.warmup()
+
+    batches = queue.Queue()
+    for start in range(0, len(scenes), batch_size):
+        batches.put(scenes[start:start + batch_size])
+
+    latencies = []
+    correct = 0
+    lock = threading.Lock()
+
+    def work(pipeline: RecognitionPipeline):
+        nonlocal correct
+        while True:
+            try:
+                batch = batches.get_nowait()
+            except queue.Empty:
+                return
+            submitted = time.perf_counter()
+            results = pipeline.process_batch([Frame("bench", scene.image) for scene in batch])
+            elapsed = time.perf_counter() - submitted
+            with lock:
+                latencies.extend([elapsed] * len(batch))
+                correct += sum(
+                    result is not None and result.text == scene.text
+                    for result, scene in zip(results, batch)
+                )
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=work, args=(pipeline,)) for pipeline in pipelines]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_time = time.perf_counter() - started
+
+    p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+    return {
+        "batch_size": batch_size,
+        "workers": workers,
+        "frames": len(scenes),
+        "frames_per_second": len(scenes) / wall_time,
+        "latency_ms": {"p50": p50, "p95": p95, "p99": p99},
+        "plate_accuracy": correct / len(scenes),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def parse_sizes(value: str) -> list[int]:
+    return [int(size) for size in value.split(",") if size]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-sizes", type=parse_sizes, default=[1, 8, 32])
+    parser.add_argument("--workers", type=parse_sizes, default=[1, 2, 4])
+    parser.add_argument("--output", help="Write the report to this file instead of stdout")
+    args = parser.parse_args()
+
+    scenes = make_scenes(args.frames, args.seed)
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "recognizer_backend": settings.RECOGNIZER_BACKEND,
+        "results": [
+            run(scenes, batch_size, workers)
+            for batch_size in args.batch_sizes
+            for workers in args.workers
+        ],
+    }
+
+    content = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(content)
+    else:
+        print(content)
+
+
+if __name__ == "__main__":
+    main()
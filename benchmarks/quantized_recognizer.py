@@ -0,0 +1,101 @@
+"""Compare the full Keras recognizer with its quantized TFLite versions.
+
+Usage::
+
+    python -m benchmarks.quantized_recognizer --convert int8 --convert float16
+
+Every ``--convert`` mode writes a quantized copy of ``RECOGNIZER_MODEL_PATH`` next
+to it and adds it to the comparison. Extra ``.tflite`` files can be passed with
+``--tflite``. Results are printed as JSON.
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+
+from app.core.config import settings
+from app.data_science.character_recogniser import CharacterRecognizer
+from app.data_science.preprocessing import PlateBatchPreprocessor
+from app.data_science.quantization import quantize_model
+from benchmarks.synthetic import make_dataset
+
+
+def character_accuracy(predictions: list[str], truths: list[str]) -> float:
+    """Share of ground truth characters read correctly at their position."""
+    correct = sum(
+        sum(p == t for p, t in zip(prediction, truth))
+        for prediction, truth in zip(predictions, truths)
+    )
+    return correct / max(1, sum(len(truth) for truth in truths))
+
+
+def calibration_samples(dataset, limit: int = 200):
+    """Segmented characters of synthetic plates, used to calibrate int8 ranges."""
+    preprocessor = PlateBatchPreprocessor(max_batch=1)
+    samples = []
+    for image, _ in dataset:
+        preprocessor.process([image])
+        samples.extend(preprocessor.characters(preprocessor.segment(1)).copy())
+        if len(samples) >= limit:
+            break
+    return samples[:limit]
+
+
+def run(recognizer: CharacterRecognizer, dataset, batch_size: int) -> dict:
+    images = [image for image, _ in dataset]
+    truths = [text for _, text in dataset]
+    recognizer.warmup()
+
+    latencies = []
+    predictions = []
+    started = time.perf_counter()
+    for start in range(0, len(images), batch_size):
+        batch_started = time.perf_counter()
+        predictions.extend(recognizer.recognize_batch(images[start:start + batch_size]))
+        latencies.append(time.perf_counter() - batch_started)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "batch_latency_p50_ms": statistics.median(latencies) * 1000,
+        "batch_latency_max_ms": max(latencies) * 1000,
+        "plates_per_second": len(images) / elapsed,
+        "character_accuracy": character_accuracy(predictions, truths),
+        "plate_accuracy": sum(p == t for p, t in zip(predictions, truths)) / len(truths),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keras", default=settings.RECOGNIZER_MODEL_PATH)
+    parser.add_argument("--convert", action="append", choices=["int8", "float16"], default=[])
+    parser.add_argument("--tflite", action="append", default=[])
+    args = parser.parse_args()
+
+    dataset = make_dataset(args.samples, args.seed)
+    candidates = {"keras": CharacterRecognizer("keras", args.keras, max_batch=args.batch_size)}
+
+    for mode in args.convert:
+        output_path = f"{os.path.splitext(args.keras)[0]}_{mode}.tflite"
+        size = quantize_model(args.keras, output_path, mode, calibration_samples(dataset))
+        print(f"Wrote {output_path} ({size} bytes)")
+        args.tflite.append(output_path)
+
+    for path in args.tflite:
+        candidates[os.path.basename(path)] = CharacterRecognizer(
+            "tflite", path, max_batch=args.batch_size
+        )
+
+    report = {
+        "samples": args.samples,
+        "batch_size": args.batch_size,
+        "results": {name: run(recognizer, dataset, args.batch_size) for name, recognizer in candidates.items()},
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import random
+import string
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+PLATE_CHARS = string.digits + string.ascii_uppercase
+
+FONTS = (
+    cv2.FONT_HERSHEY_SIMPLEX,
+    cv2.FONT_HERSHEY_DUPLEX,
+    cv2.FONT_HERSHEY_COMPLEX,
+    cv2.FONT_HERSHEY_TRIPLEX,
+    cv2.FONT_HERSHEY_PLAIN,
+)
+
+
+@dataclass
+class SyntheticFrame:
+    image: np.ndarray
+    text: str
+    box: tuple[int, int, int, int]
+
+
+def random_plate_text(rng: random.Random, min_length: int = 6, max_length: int = 8) -> str:
+    """Returns a random plate string over the recognizer alphabet."""
+    return "".join(rng.choice(PLATE_CHARS) for _ in range(rng.randint(min_length, max_length)))
+
+
+def render_plate(
+    text: str,
+    height: int = 48,
+    width: int = 200,
+    font: int = cv2.FONT_HERSHEY_SIMPLEX,
+    thickness: int = 2,
+) -> np.ndarray:
+    """
+    Draws a clean plate: dark characters on a white background.
+
+    Every character is centered in its own cell, so characters never touch.
+
+    Args:
+        text (str): The plate text.
+        height (int): The image height in pixels.
+        width (int): The image width in pixels.
+        font (int): The OpenCV Hershey font.
+        thickness (int): The stroke thickness.
+
+    Returns:
+        np.ndarray: A BGR uint8 image.
+    """
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    cell = width / len(text)
+    scale = cv2.getFontScaleFromHeight(font, int(height * 0.6), thickness)
+    widest = max(cv2.getTextSize(char, font, scale, thickness)[0][0] for char in PLATE_CHARS)
+    scale *= min(1.0, cell * 0.8 / widest)
+    for index, char in enumerate(text):
+        (char_width, char_height), _ = cv2.getTextSize(char, font, scale, thickness)
+        origin = (int(cell * index + (cell - char_width) / 2), (height + char_height) // 2)
+        cv2.putText(image, char, origin, font, scale, (0, 0, 0), thickness, cv2.LINE_AA)
+    return image
+
+
+def distort(
+    image: np.ndarray,
+    rng: random.Random,
+    max_blur: int = 2,
+    noise: float = 8.0,
+    max_skew: float = 0.08,
+) -> np.ndarray:
+    """
+    Applies a random perspective warp, Gaussian blur and sensor noise.
+
+    Args:
+        image (np.ndarray): A BGR uint8 plate.
+        rng (random.Random): The random generator.
+        max_blur (int): The largest blur kernel radius.
+        noise (float): The standard deviation of the additive noise.
+        max_skew (float): The largest corner shift, as a share of the plate size.
+
+    Returns:
+        np.ndarray: The distorted BGR uint8 plate.
+    """
+    height, width = image.shape[:2]
+    source = np.float32([[0, 0], [width, 0], [width, height], [0, height]])
+    shift = np.float32([
+        [rng.uniform(-max_skew, max_skew) * width, rng.uniform(-max_skew, max_skew) * height]
+        for _ in range(4)
+    ])
+    matrix = cv2.getPerspectiveTransform(source, source + shift)
+    image = cv2.warpPerspective(image, matrix, (width, height), borderValue=(255, 255, 255))
+
+    radius = rng.randint(0, max_blur)
+    if radius:
+        image = cv2.GaussianBlur(image, (2 * radius + 1, 2 * radius + 1), 0)
+
+    if noise:
+        sample = np.random.default_rng(rng.getrandbits(32)).normal(0, noise, image.shape)
+        image = np.clip(image + sample, 0, 255).astype(np.uint8)
+    return image
+
+
+def render_scene(rng: random.Random, height: int = 480, width: int = 640) -> SyntheticFrame:
+    """
+    Places a random distorted plate on a random camera-like background.
+
+    Args:
+        rng (random.Random): The random generator.
+        height (int): The frame height in pixels.
+        width (int): The frame width in pixels.
+
+    Returns:
+        SyntheticFrame: The frame, the plate text and the plate box.
+    """
+    text = random_plate_text(rng)
+    plate_width = rng.randint(width // 5, width // 3)
+    plate_height = plate_width // 4
+    plate = render_plate(text, plate_height, plate_width, rng.choice(FONTS), rng.choice((1, 2)))
+    plate = distort(plate, rng)
+
+    image = np.random.default_rng(rng.getrandbits(32)).integers(
+        40, 200, (height, width, 3), dtype=np.uint8
+    )
+    image = cv2.GaussianBlur(image, (15, 15), 0)
+    x = rng.randint(0, width - plate_width)
+    y = rng.randint(0, height - plate_height)
+    image[y:y + plate_height, x:x + plate_width] = plate
+    return SyntheticFrame(image, text, (x, y, x + plate_width, y + plate_height))
+
+
+def make_dataset(size: int, seed: int = 0) -> list[tuple[np.ndarray, str]]:
+    """
+    Generates a reproducible set of clean synthetic plates.
+
+    Args:
+        size (int): The number of plates.
+        seed (int): The random seed.
+
+    Returns:
+        list[tuple[np.ndarray, str]]: Plate images with their ground truth text.
+    """
+    rng = random.Random(seed)
+    dataset = []
+    for _ in range(size):
+        text = random_plate_text(rng)
+        dataset.append((render_plate(text), text))
+    return dataset
+
+
+def make_scenes(size: int, seed: int = 0) -> list[SyntheticFrame]:
+    """
+    Generates a reproducible set of synthetic camera frames.
+
+    Args:
+        size (int): The number of frames.
+        seed (int): The random seed.
+
+    Returns:
+        list[SyntheticFrame]: Frames with their ground truth text and plate box.
+    """
+    rng = random.Random(seed)
+    return [render_scene(rng) for _ in range(size)]
@@ -0,0 +1,36 @@
+"""index comment filters
+
+Revision ID: e2a8d4c6b913
+Revises: c61e0b4a7f25
+Create Date: 2026-10-19 16:05:41.207733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a8d4c6b913'
+down_revision: Union[str, None] = 'c61e0b4a7f25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+commentstatus = sa.Enum('CREATED', 'BLOCKED', name='commentstatus')
+
+
+def upgrade() -> None:
+    # The model had these columns before any migration created them.
+    commentstatus.create(op.get_bind(), checkfirst=True)
+    op.execute("ALTER TABLE comments ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now()")
+    op.execute("ALTER TABLE comments ADD COLUMN IF NOT EXISTS status commentstatus NOT NULL DEFAULT 'CREATED'")
+    op.create_index('ix_comments_owner_id_created_at', 'comments', ['owner_id', 'created_at'], unique=False)
+    op.create_index('ix_comments_status_created_at', 'comments', ['status', 'created_at'], unique=False)
+    op.create_index('ix_comments_created_at', 'comments', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_comments_created_at', table_name='comments')
+    op.drop_index('ix_comments_status_created_at', table_name='comments')
+    op.drop_index('ix_comments_owner_id_created_at', table_name='comments')
@@ -0,0 +1,104 @@
+import sys
+import os
+from types import ModuleType
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from app.data_science.backends import KerasBackend, TFLiteBackend, get_backend
+
+
+class StubInterpreter:
+    """Stands in for the TFLite interpreter: the output tensor is the input tensor, as stored."""
+
+    def __init__(self, model_path, num_threads, dtype=np.int8, quantization=(0.05, -3)):
+        self.model_path = model_path
+        self.num_threads = num_threads
+        self.shape = [1, 4]
+        self.dtype = dtype
+        self.quantization = quantization
+        self.tensor = None
+        self.resized = []
+
+    def allocate_tensors(self):
+        pass
+
+    def get_input_details(self):
+        return [{"index": 0, "shape": np.array(self.shape), "dtype": self.dtype, "quantization": self.quantization}]
+
+    def get_output_details(self):
+        return [{"index": 1, "shape": np.array(self.shape), "dtype": self.dtype, "quantization": self.quantization}]
+
+    def resize_tensor_input(self, index, shape):
+        self.resized.append(list(shape))
+        self.shape = list(shape)
+
+    def set_tensor(self, index, value):
+        assert value.dtype == self.dtype
+        self.tensor = value
+
+    def invoke(self):
+        pass
+
+    def get_tensor(self, index):
+        return self.tensor
+
+
+@pytest.fixture
+def runtime(monkeypatch):
+    package = ModuleType("tflite_runtime")
+    package.interpreter = ModuleType("tflite_runtime.interpreter")
+    package.interpreter.Interpreter = StubInterpreter
+    monkeypatch.setitem(sys.modules, "tflite_runtime", package)
+    monkeypatch.setitem(sys.modules, "tflite_runtime.interpreter", package.interpreter)
+    return package.interpreter
+
+
+def test_int8_input_and_output_round_trip(runtime):
+    backend = TFLiteBackend("model.tflite", num_threads=2)
+    backend.load()
+    batch = np.array([[0.0, 0.5, -1.2, 3.0], [1.0, -0.05, 0.26, 6.3]], dtype=np.float32)
+
+    output = backend.predict(batch)
+
+    scale, zero_point = 0.05, -3
+    # Quantized with the model's scale and zero point: 3.0 -> 57, 6.3 -> 123.
+    assert backend._interpreter.tensor[0, 3] == round(3.0 / scale + zero_point)
+    assert backend._interpreter.tensor[1, 3] == round(6.3 / scale + zero_point)
+    assert output.dtype == np.float32
+    np.testing.assert_allclose(output, batch, atol=scale / 2 + 1e-6)
+    # The batch of two did not fit the model's batch size of one.
+    assert backend._interpreter.resized == [[2, 4]]
+
+
+def test_int8_input_saturates_at_the_type_range(runtime):
+    backend = TFLiteBackend("model.tflite")
+    backend.load()
+
+    output = backend.predict(np.array([[100.0, -100.0, 0.0, 0.0]], dtype=np.float32))
+
+    assert backend._interpreter.tensor[0, :2].tolist() == [127, -128]
+    np.testing.assert_allclose(output[0, :2], [(127 + 3) * 0.05, (-128 + 3) * 0.05], rtol=1e-6)
+
+
+def test_float_models_are_not_quantized(runtime, monkeypatch):
+    monkeypatch.setattr(
+        runtime, "Interpreter",
+        lambda model_path, num_threads: StubInterpreter(model_path, num_threads, np.float32, (0.0, 0)),
+    )
+    backend = TFLiteBackend("model.tflite")
+    backend.load()
+    batch = np.array([[0.123, 4.5, -6.7, 8.9]], dtype=np.float32)
+
+    np.testing.assert_array_equal(backend.predict(batch), batch)
+
+
+def test_backend_selection():
+    assert isinstance(get_backend("keras"), KerasBackend)
+    backend = get_backend("tflite", "other.tflite")
+    assert isinstance(backend, TFLiteBackend)
+    assert backend.model_path == "other.tflite"
+    with pytest.raises(ValueError):
+        get_backend("onnx")
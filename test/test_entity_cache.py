@@ -0,0 +1,100 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from app.utils.entity_cache import PENDING_INVALIDATIONS, EntityCache
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Car(Base):
+    __tablename__ = "cars"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    plate: Mapped[str]
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Car(id=1, plate="AB123"), Car(id=2, plate="CD456")])
+        session.commit()
+        yield session
+
+
+def test_hits_return_fresh_instances(session):
+    cache = EntityCache(maxsize=10, ttl=60)
+    cache.put(session.get(Car, 1))
+
+    car = cache.get(Car, 1)
+    car.plate = "CHANGED"
+
+    assert cache.get(Car, 1).plate == "AB123"
+    assert cache.get(Car, 2) is None
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_hits_can_be_merged_without_a_query(session):
+    cache = EntityCache(maxsize=10, ttl=60)
+    cache.put(session.get(Car, 1))
+    session.expunge_all()
+
+    car = session.merge(cache.get(Car, 1), load=False)
+    car.plate = "XY999"
+    session.commit()
+
+    assert session.get(Car, 1).plate == "XY999"
+
+
+def test_evicts_least_recently_used_and_expired(session):
+    cache = EntityCache(maxsize=1, ttl=60)
+    cache.put(session.get(Car, 1))
+    cache.put(session.get(Car, 2))
+    assert cache.get(Car, 1) is None
+    assert cache.get(Car, 2) is not None
+
+    expired = EntityCache(maxsize=10, ttl=-1)
+    expired.put(session.get(Car, 1))
+    assert expired.get(Car, 1) is None
+    assert len(expired) == 0
+
+
+def test_flushed_changes_are_invalidated_on_commit(session):
+    cache = EntityCache(maxsize=10, ttl=60)
+    car = session.get(Car, 1)
+    cache.put(car)
+
+    car.plate = "XY999"
+    session.delete(session.get(Car, 2))
+    session.flush()
+    assert session.info[PENDING_INVALIDATIONS] == {("cars", 1), ("cars", 2)}
+
+    session.commit()
+    assert cache.apply(session) == {("cars", 1), ("cars", 2)}
+    assert cache.get(Car, 1) is None
+
+
+def test_reads_overtaken_by_an_invalidation_are_not_cached(session):
+    cache = EntityCache(maxsize=10, ttl=60)
+    # A reader takes the generation, then awaits its query while another request commits.
+    generation = cache.generation(("cars", 1))
+    cache.invalidate([("cars", 1)])
+    cache.put(session.get(Car, 1), generation)
+    assert cache.get(Car, 1) is None
+
+    cache.put(session.get(Car, 1), cache.generation(("cars", 1)))
+    assert cache.get(Car, 1) is not None
+
+    generation = cache.generation(("cars", 2))
+    cache.clear()
+    cache.put(session.get(Car, 2), generation)
+    assert cache.get(Car, 2) is None
@@ -0,0 +1,25 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from app.routers.evidence import MemoryViewResponse
+
+
+@pytest.mark.asyncio
+async def test_memoryview_body_is_sent_without_a_copy():
+    blob = bytearray(b"\xff\xd8\xff\xe0frame")
+    response = MemoryViewResponse(memoryview(blob)[2:], media_type="image/jpeg")
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await response({"type": "http"}, None, send)
+
+    start, body = messages
+    assert dict(start["headers"]) == {b"content-length": b"7", b"content-type": b"image/jpeg"}
+    assert body["body"].obj is blob
+    assert bytes(body["body"]) == b"\xff\xe0frame"
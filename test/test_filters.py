@@ -0,0 +1,76 @@
+import sys
+import os
+import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Index, create_engine, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from app.utils.filters import parse_query
+from app.utils.repositories import SQLAlchemyRepository
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Visit(Base):
+    __tablename__ = "visits"
+    __table_args__ = (Index("ix_visits_gate_created_at", "gate", "created_at"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    gate: Mapped[str]
+    created_at: Mapped[datetime.datetime]
+    note: Mapped[str] = mapped_column(nullable=True)
+
+
+class VisitRepository(SQLAlchemyRepository):
+    model = Visit
+    filterable = frozenset({"id", "gate", "created_at"})
+
+
+def test_filters_and_sort_compile_to_one_statement():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    start = datetime.datetime(2026, 1, 1)
+    with Session(engine) as session:
+        session.add_all([
+            Visit(id=index, gate="north" if index % 2 else "south", created_at=start + datetime.timedelta(hours=index))
+            for index in range(1, 7)
+        ])
+        session.flush()
+
+        query = parse_query(VisitRepository, [
+            ("gate", "north"), ("created_at[gte]", "2026-01-01T02:00:00"), ("sort", "-created_at"), ("fields", "id"),
+        ])
+        stmt = select(Visit).where(*query.criteria(Visit)).order_by(*query.order_by(Visit))
+        assert [visit.id for visit in session.execute(stmt, query.params).scalars()] == [5, 3]
+
+        query = parse_query(VisitRepository, [("id[in]", "2,4,9")])
+        stmt = select(Visit).where(*query.criteria(Visit))
+        assert [visit.id for visit in session.execute(stmt, query.params).scalars()] == [2, 4]
+
+
+def test_same_filters_in_any_order_share_a_signature():
+    first = parse_query(VisitRepository, [("gate", "a"), ("id[gt]", "1")])
+    second = parse_query(VisitRepository, [("id[gt]", "5"), ("gate", "b")])
+    assert first.signature == second.signature
+    assert parse_query(VisitRepository, [("fields", "id")]) is None
+
+
+@pytest.mark.parametrize("params", [
+    [("note", "x")],
+    [("gate[like]", "n%")],
+    [("id", "one")],
+    [("sort", "note")],
+    # No index leads with created_at: every row would be read.
+    [("created_at[gte]", "2026-01-01T00:00:00")],
+    [("sort", "-created_at")],
+])
+def test_unsupported_queries_are_rejected(params):
+    with pytest.raises(HTTPException) as error:
+        parse_query(VisitRepository, params)
+    assert error.value.status_code == 400
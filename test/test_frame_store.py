@@ -0,0 +1,85 @@
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import numpy as np
+import pytest
+
+from app.utils.frame_store import FrameStore
+
+
+def encode_frame(value):
+    image = np.full((120, 200, 3), value, dtype=np.uint8)
+    return cv2.imencode(".jpg", image)[1].tobytes()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FrameStore(str(tmp_path), segment_size=64 * 1024, thumbnail_size=32)
+    yield store
+    store.close()
+
+
+def test_identical_frames_are_stored_once(store, tmp_path):
+    first = store.put(encode_frame(10))
+    second = store.put(encode_frame(10))
+
+    assert first == second
+    assert os.path.getsize(tmp_path / "index.log") > 0
+    assert bytes(store.get(first)) == encode_frame(10)
+    assert store.get("00" * 32) is None
+    assert store.get("not-a-digest") is None
+
+
+def test_reads_are_zero_copy_views(store):
+    digest = store.put(encode_frame(20))
+    assert isinstance(store.get(digest), memoryview)
+
+
+def test_thumbnail_is_generated_in_background(store):
+    digest = store.put(encode_frame(30))
+
+    deadline = time.monotonic() + 5
+    while store.thumbnail(digest) is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    thumbnail = cv2.imdecode(np.frombuffer(store.thumbnail(digest), np.uint8), cv2.IMREAD_COLOR)
+    assert max(thumbnail.shape[:2]) == 32
+
+
+def test_segments_roll_over_and_survive_reopen(tmp_path):
+    store = FrameStore(str(tmp_path), segment_size=4096, thumbnail_size=32)
+    blobs = [os.urandom(1500) for _ in range(6)]
+    digests = [store.put(blob) for blob in blobs]
+    store.close()
+
+    assert len(list(tmp_path.glob("segment-*.dat"))) == 3
+    reopened = FrameStore(str(tmp_path), segment_size=4096, thumbnail_size=32)
+    try:
+        assert [bytes(reopened.get(digest)) for digest in digests] == blobs
+        extra = reopened.put(b"x" * 100)
+        assert bytes(reopened.get(extra)) == b"x" * 100
+        assert bytes(reopened.get(digests[-1])) == blobs[-1]
+    finally:
+        reopened.close()
+
+
+def test_workers_sharing_a_directory_see_each_others_frames(tmp_path):
+    first = FrameStore(str(tmp_path), segment_size=4096, thumbnail_size=32)
+    second = FrameStore(str(tmp_path), segment_size=4096, thumbnail_size=32)
+    try:
+        first_blob, second_blob = os.urandom(1000), os.urandom(1000)
+        second.open()
+        first_digest = first.put(first_blob)
+        second_digest = second.put(second_blob)
+
+        # The second worker appended after the first one's frame instead of over it.
+        assert bytes(first.get(first_digest)) == first_blob
+        assert bytes(first.get(second_digest)) == second_blob
+        assert bytes(second.get(first_digest)) == first_blob
+    finally:
+        first.close()
+        second.close()
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("tensorflow", "keras", "cv2", "sklearn", "matplotlib", "h5py")
+
+
+def test_app_main_does_not_import_ml_modules():
+    """Importing the API must stay cheap: models are loaded lazily by the recognizers."""
+    output = subprocess.run(
+        [sys.executable, "-c", "import sys, app.main; print('\\n'.join(sys.modules))"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+    imported = sorted(
+        name for name in output if name.split(".")[0] in HEAVY_MODULES
+    )
+    assert imported == [], f"app.main eagerly imports heavy modules: {imported}"
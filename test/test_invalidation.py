@@ -0,0 +1,45 @@
+import sys
+import os
+import json
+import time
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.entity_cache import PENDING_INVALIDATIONS
+from app.utils.invalidation import InvalidationBus
+from app.utils.row_counts import PENDING_DELTAS, row_counts
+
+
+def test_message_describes_pending_changes():
+    session = SimpleNamespace(info={PENDING_INVALIDATIONS: {("users", 1)}, PENDING_DELTAS: {"users": 1}})
+    message = json.loads(InvalidationBus.message(session))
+
+    assert message["keys"] == [["users", 1]]
+    assert message["deltas"] == {"users": 1}
+    assert InvalidationBus.message(SimpleNamespace(info={})) == ""
+
+
+def test_large_changes_ask_for_a_flush():
+    keys = {("comments", pk) for pk in range(2000)}
+    message = json.loads(InvalidationBus.message(SimpleNamespace(info={PENDING_INVALIDATIONS: keys})))
+    assert message["flush"] is True
+
+
+def test_applies_other_workers_changes_and_tracks_lag():
+    bus = InvalidationBus()
+    row_counts.set("users", 3)
+    own = InvalidationBus.message(SimpleNamespace(info={PENDING_DELTAS: {"users": 1}}))
+    bus.handle_notification(own)
+    assert bus.received == 0
+
+    bus.handle_notification(json.dumps({
+        "worker": "other", "sent": time.time() - 0.05, "keys": [["users", 7]], "deltas": {"users": 2},
+    }))
+    bus.handle_notification(json.dumps({"worker": "other", "sent": time.time(), "flush": True}))
+
+    stats = bus.stats()
+    assert stats["received"] == 2
+    assert stats["flushes"] == 1
+    assert stats["max_lag_ms"] >= 50
+    assert row_counts.get("users") is None
@@ -0,0 +1,154 @@
+import sys
+import os
+import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import BigInteger, ForeignKey, Numeric, String, create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+import app.repositories.ledger as ledger
+from app.services.ledger import LedgerService
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Entry(Base):
+    __tablename__ = "ledger_entries"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    user_id: Mapped[int]
+    amount: Mapped[Decimal] = mapped_column(Numeric(12, 2))
+    kind: Mapped[str] = mapped_column(String(20))
+    parking_session_id: Mapped[int] = mapped_column(ForeignKey("parking_sessions.id"), nullable=True, unique=True)
+    created_at: Mapped[datetime.datetime]
+
+
+class Balance(Base):
+    __tablename__ = "user_balances"
+
+    user_id: Mapped[int] = mapped_column(primary_key=True)
+    balance: Mapped[Decimal] = mapped_column(Numeric(12, 2))
+    updated_at: Mapped[datetime.datetime]
+
+
+class Parking(Base):
+    __tablename__ = "parking_sessions"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(nullable=True)
+    started_at: Mapped[datetime.datetime]
+    ended_at: Mapped[datetime.datetime] = mapped_column(nullable=True)
+
+
+class Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def one(self):
+        return self.rows[0]
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return self
+
+
+class RecordingSession:
+    """Compiles what the repository runs, as Postgres would receive it, and answers with canned rows."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt.compile(dialect=postgresql.dialect()))
+        return Result(self.rows)
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    # The application's mappers cannot be configured on their own, so the same tables are mapped here.
+    monkeypatch.setattr(ledger, "LedgerEntry", Entry)
+    monkeypatch.setattr(ledger, "UserBalance", Balance)
+    monkeypatch.setattr(ledger, "ParkingSession", Parking)
+    monkeypatch.setattr(ledger.LedgerRepository, "model", Entry)
+    return ledger.LedgerRepository(RecordingSession([SimpleNamespace(user_id=1, balance=Decimal("7.50"))]))
+
+
+def timestamps(compiled) -> list:
+    return [value for value in compiled.params.values() if isinstance(value, datetime.datetime)]
+
+
+@pytest.mark.asyncio
+async def test_append_inserts_and_upserts_the_balance_in_one_statement(repository):
+    assert await repository.append(1, Decimal("7.50"), "payment") == Decimal("7.50")
+
+    [compiled] = repository.session.statements
+    sql = " ".join(str(compiled).split())
+    assert sql.startswith("WITH entries AS (INSERT INTO ledger_entries")
+    assert "ON CONFLICT (user_id) DO UPDATE SET balance = (user_balances.balance + excluded.balance)" in sql
+    # The entry and the balance carry the same application timestamp.
+    assert "now()" not in sql
+    created_at, updated_at = timestamps(compiled)
+    assert created_at == updated_at
+
+
+@pytest.mark.asyncio
+async def test_settlement_charges_each_closed_session_once(repository):
+    await repository.settle_sessions(Decimal("2.00"), [3, 4])
+
+    [compiled] = repository.session.statements
+    sql = " ".join(str(compiled).split())
+    assert "parking_sessions.ended_at IS NOT NULL AND parking_sessions.user_id IS NOT NULL" in sql
+    assert "NOT (EXISTS (SELECT * FROM ledger_entries WHERE ledger_entries.parking_session_id = parking_sessions.id" in sql
+    assert "ON CONFLICT (parking_session_id) DO NOTHING" in sql
+    assert "now()" not in sql
+    created_at, updated_at = timestamps(compiled)
+    assert created_at == updated_at
+    assert compiled.params["id_1"] == [3, 4]
+
+
+class UnitOfWork:
+    def __init__(self, repository):
+        self.ledger = repository
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_history_pages_by_cursor(repository):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    start = datetime.datetime(2026, 1, 1)
+    with Session(engine) as session:
+        session.add_all([
+            Entry(id=index, user_id=1 if index != 3 else 2, amount=Decimal("1.00"), kind="payment", created_at=start)
+            for index in range(1, 7)
+        ])
+        session.flush()
+
+        async def execute(stmt, params=None):
+            return session.execute(stmt, params)
+
+        repository.session = SimpleNamespace(execute=execute)
+        uow = UnitOfWork(repository)
+
+        first = await LedgerService.get_history(uow, 1, limit=2)
+        assert [item.id for item in first.items] == [6, 5]
+        second = await LedgerService.get_history(uow, 1, limit=2, cursor=first.next_cursor)
+        assert [item.id for item in second.items] == [4, 2]
+        last = await LedgerService.get_history(uow, 1, limit=2, cursor=second.next_cursor)
+        assert [item.id for item in last.items] == [1]
+        assert last.next_cursor is None
@@ -0,0 +1,62 @@
+import sys
+import os
+import json
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.utils.metrics import Metrics, MetricsMiddleware
+
+
+def test_requests_are_timed_by_route_template():
+    metrics = Metrics(directory=None, buckets=(0.5, 1.0))
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+    @app.get("/users/{user_id}")
+    def get_user(user_id: int):
+        return {"id": user_id}
+
+    client = TestClient(app)
+    client.get("/users/1")
+    client.get("/users/2")
+    client.get("/nowhere")
+    text = metrics.render()
+
+    assert 'http_request_duration_seconds_bucket{route="/users/{user_id}",method="GET",status="200",le="0.5"} 2' in text
+    assert 'http_request_duration_seconds_count{route="/users/{user_id}",method="GET",status="200"} 2' in text
+    assert 'http_request_duration_seconds_count{route="unmatched",method="GET",status="404"} 1' in text
+    assert "http_requests_in_flight 0" in text
+
+
+def test_workers_are_added_up(tmp_path):
+    first = Metrics(directory=str(tmp_path), buckets=(1.0,), worker="1")
+    second = Metrics(directory=str(tmp_path), buckets=(1.0,), worker="2")
+    for worker, checked_out, lag in ((first, 2, 0.1), (second, 3, 0.4)):
+        worker.gauge("db_pool_checked_out", "Connections in use.", lambda value=checked_out: {"primary": value}, label="pool")
+        worker.gauge("event_loop_lag_seconds", "Loop lag.", lambda value=lag: value, aggregate=max)
+        worker.observe("/users/", "GET", 200, 0.2)
+    second.observe("/users/", "GET", 200, 2.0)
+    second.dump()
+
+    text = first.render()
+    assert 'http_request_duration_seconds_bucket{route="/users/",method="GET",status="200",le="1.0"} 2' in text
+    assert 'http_request_duration_seconds_bucket{route="/users/",method="GET",status="200",le="+Inf"} 3' in text
+    assert 'db_pool_checked_out{pool="primary"} 5' in text
+    assert "event_loop_lag_seconds 0.4" in text
+
+
+def test_gauges_of_stopped_workers_are_dropped(tmp_path):
+    stopped = Metrics(directory=str(tmp_path), worker="1")
+    stopped.in_flight = 7
+    stopped.observe("/users/", "GET", 200, 0.2)
+    stopped.dump()
+    snapshot = json.loads((tmp_path / "1.json").read_text())
+    snapshot["time"] = 0
+    (tmp_path / "1.json").write_text(json.dumps(snapshot))
+
+    text = Metrics(directory=str(tmp_path), worker="2").render()
+    assert "http_requests_in_flight 0" in text
+    assert 'http_request_duration_seconds_count{route="/users/",method="GET",status="200"} 1' in text
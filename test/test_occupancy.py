@@ -0,0 +1,42 @@
+import sys
+import os
+import asyncio
+import json
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.occupancy import OccupancyTracker
+
+
+def test_counts_local_and_remote_changes():
+    tracker = OccupancyTracker(capacity=10)
+    tracker.apply(1)
+    tracker.handle_notification(tracker.message(1))
+    tracker.handle_notification(json.dumps({"worker": "other", "delta": 1}))
+    tracker.handle_notification("not json")
+
+    snapshot = tracker.snapshot()
+    assert snapshot["occupied"] == 2
+    assert snapshot["available"] == 8
+
+    tracker.reconcile(5)
+    assert tracker.snapshot()["occupied"] == 5
+
+
+def test_subscribers_get_latest_state_and_keepalives():
+    async def main():
+        tracker = OccupancyTracker()
+        stream = tracker.subscribe(keepalive=0.01)
+        first = await stream.__anext__()
+        tracker.apply(1)
+        tracker.apply(1)
+        latest = await stream.__anext__()
+        idle = await stream.__anext__()
+        await stream.aclose()
+        return first, latest, idle, len(tracker._subscribers)
+
+    first, latest, idle, subscribers = asyncio.run(main())
+    assert first["occupied"] == 0
+    assert latest["occupied"] == 2
+    assert idle is None
+    assert subscribers == 0
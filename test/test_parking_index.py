@@ -0,0 +1,72 @@
+import sys
+import os
+import datetime
+import json
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.parking import ParkingEvent
+from app.services.parking import ActiveSession, ActiveSessionIndex, ParkingService, active_sessions
+
+
+def test_lookup_uses_normalized_plate():
+    index = ActiveSessionIndex()
+    index.add("ka 7777-ab", ActiveSession(1, datetime.datetime(2024, 1, 1)))
+
+    assert index.get("KA7777AB").id == 1
+    assert index.remove("ka7777ab").id == 1
+    assert index.get("KA7777AB") is None
+
+
+def test_rebuild_replaces_sessions():
+    index = ActiveSessionIndex()
+    index.add("OLD1", ActiveSession(1, datetime.datetime(2024, 1, 1)))
+    index.rebuild([SimpleNamespace(id=2, license_plate="new2", started_at=datetime.datetime(2024, 1, 2), user_id=7)])
+
+    assert len(index) == 1
+    assert index.get("OLD1") is None
+    assert index.get("NEW2").id == 2
+    assert index.get("NEW2").user_id == 7
+
+
+def test_notifications_from_other_workers_update_the_index():
+    index = ActiveSessionIndex()
+    session = SimpleNamespace(id=3, started_at=datetime.datetime(2024, 1, 3), user_id=5)
+    opened = json.loads(index.message("ab 123", session))
+    opened["worker"] = "other"
+    index.handle_notification(json.dumps(opened))
+    assert index.get("AB123").id == 3
+    assert index.get("AB123").user_id == 5
+
+    # A stale close for an older session of the plate leaves the newer one.
+    index.handle_notification(json.dumps({**opened, "id": 2, "closed": True}))
+    assert index.get("AB123").id == 3
+
+    index.handle_notification(json.dumps({**opened, "closed": True}))
+    assert index.get("AB123") is None
+
+
+def test_own_notifications_are_ignored():
+    index = ActiveSessionIndex()
+    session = SimpleNamespace(id=4, started_at=datetime.datetime(2024, 1, 4), user_id=None)
+    index.handle_notification(index.message("CD456", session))
+    assert index.get("CD456") is None
+
+
+@pytest.mark.asyncio
+async def test_gate_decisions_on_indexed_plates_skip_the_database():
+    active_sessions.add("GATE1", ActiveSession(9, datetime.datetime(2024, 1, 5), 3))
+    try:
+        # No unit of work: any database access would fail.
+        with pytest.raises(HTTPException) as error:
+            await ParkingService.start_session(None, ParkingEvent(license_plate="gate 1"))
+        assert error.value.status_code == 409
+
+        session = await ParkingService.get_open_session(None, "gate-1")
+        assert (session.id, session.license_plate, session.user_id) == (9, "GATE1", 3)
+    finally:
+        active_sessions.remove("GATE1")
@@ -0,0 +1,84 @@
+import sys
+import os
+import json
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from app.utils.plate_index import AmbiguousPlateError, PlateIndex, normalize_plate, plate_key
+
+
+@pytest.fixture
+def index():
+    index = PlateIndex(max_distance=2)
+    index.rebuild(["AB0123CD", "KA7777AA", "AX1111BC"])
+    return index
+
+
+def test_normalize_plate():
+    assert normalize_plate(" ab-0123 cd ") == "AB0123CD"
+    assert plate_key("AB0123CD") == plate_key("A80I23CD")
+
+
+def test_ocr_confusions_match_at_zero_distance(index):
+    assert index.search("A8O1Z3CD", 0) == [("AB0123CD", 0)]
+
+
+def test_search_within_distance(index):
+    assert index.search("KA7771AA", 1) == [("KA7777AA", 1)]
+    assert index.search("KA77AA", 1) == []
+    assert index.search("KA77AA", 2) == [("KA7777AA", 2)]
+
+
+def test_best_match_prefers_exact_plate(index):
+    index.add("AB0I23CD")
+    assert index.best_match("AB0I23CD") == "AB0I23CD"
+    assert index.best_match("ZZZZZZZZ") is None
+
+
+def test_incremental_updates(index):
+    index.add("BC5555XX")
+    assert "bc 5555 xx" in index
+    index.remove("BC5555XX")
+    assert "BC5555XX" not in index
+    assert index.search("BC5555XX") == []
+    assert len(index) == 3
+
+
+def test_distance_above_index_limit(index):
+    with pytest.raises(ValueError):
+        index.search("AB0123CD", 3)
+
+
+def test_notifications_from_other_workers_update_the_index(index):
+    message = json.loads(index.message(added=["BC5555XX"], removed=["KA7777AA"]))
+    message["worker"] = "other"
+    index.handle_notification(json.dumps(message))
+    assert "BC5555XX" in index
+    assert "KA7777AA" not in index
+
+    index.handle_notification(index.message(removed=["BC5555XX"]))
+    assert "BC5555XX" in index
+
+
+def test_shared_plate_stays_until_last_reference(index):
+    index.add("AB0123CD")
+    index.remove("AB0123CD")
+    assert "AB0123CD" in index
+    index.remove("AB0123CD")
+    assert "AB0123CD" not in index
+    assert index.search("AB0123CD", 0) == []
+
+
+def test_best_match_refuses_to_pick_between_equally_close_plates(index):
+    index.add("A80123CD")
+    # Both known plates read the same once confusable characters are collapsed.
+    with pytest.raises(AmbiguousPlateError) as error:
+        index.best_match("A8O123CD")
+    assert error.value.candidates == ["A80123CD", "AB0123CD"]
+    assert index.best_match("A80123CD") == "A80123CD"
+
+    index.add("KA7777AB")
+    with pytest.raises(AmbiguousPlateError):
+        index.best_match("KA7777AX", 1)
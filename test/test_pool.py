@@ -0,0 +1,67 @@
+import sys
+import os
+import asyncio
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from app.db.pool import warm_up
+
+
+class Engine:
+    def __init__(self, fail_after=None):
+        self.open = 0
+        self.max_open = 0
+        self.connects = 0
+        self.fail_after = fail_after
+
+    async def connect(self):
+        self.connects += 1
+        if self.fail_after is not None and self.connects > self.fail_after:
+            raise ConnectionError("too many clients")
+        await asyncio.sleep(0)
+        self.open += 1
+        self.max_open = max(self.max_open, self.open)
+        return Connection(self)
+
+
+class Connection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def close(self):
+        self.engine.open -= 1
+
+
+@pytest.mark.asyncio
+async def test_all_connections_are_open_at_once():
+    engine = Engine()
+    prepared = []
+
+    async def prepare(connection):
+        prepared.append(connection)
+
+    await warm_up(engine, 4, prepare)
+    assert engine.max_open == 4
+    assert len(set(map(id, prepared))) == 4
+    assert engine.open == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_connections_do_not_stop_the_others():
+    engine = Engine(fail_after=2)
+
+    async def prepare(connection):
+        pass
+
+    await warm_up(engine, 3, prepare)
+    assert engine.max_open == 2
+    assert engine.open == 0
+
+
+@pytest.mark.asyncio
+async def test_empty_pool_is_skipped():
+    engine = Engine()
+    await warm_up(engine, 0, None)
+    assert engine.connects == 0
@@ -0,0 +1,46 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import numpy as np
+import pytest
+
+from app.data_science.preprocessing import PlateBatchPreprocessor
+
+
+def render_plate(text, size=(40, 160)):
+    """Draws dark text on a white plate."""
+    image = np.full((*size, 3), 255, dtype=np.uint8)
+    cv2.putText(image, text, (5, size[0] - 10), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 0), 2)
+    return image
+
+
+@pytest.fixture
+def preprocessor():
+    return PlateBatchPreprocessor(max_batch=4)
+
+
+def test_process_writes_into_preallocated_batch(preprocessor):
+    first = preprocessor.process([render_plate("AB123C"), render_plate("XY98", (20, 90))])
+    second = preprocessor.process([render_plate("KA77")])
+
+    assert first.shape == (2, 64, 256, 1)
+    assert first.dtype == np.float32
+    assert 0.0 <= first.min() and first.max() <= 1.0
+    assert np.shares_memory(first, second)
+
+
+def test_segment_and_cut_characters(preprocessor):
+    preprocessor.process([render_plate("AB123C"), render_plate("XY98")])
+    segments = preprocessor.segment(2)
+    chars = preprocessor.characters(segments)
+
+    assert [len(plate) for plate in segments] == [6, 4]
+    assert chars.shape == (10, 28, 28, 1)
+
+
+def test_rejects_oversized_batch(preprocessor):
+    with pytest.raises(ValueError):
+        preprocessor.process([render_plate("A1")] * 5)
@@ -0,0 +1,56 @@
+import sys
+import os
+import logging
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.db.profiler import SQLProfilerMiddleware, assert_max_queries, instrument, profile_queries
+
+engine = create_engine("sqlite://")
+instrument(engine)
+
+
+def run_queries(count):
+    with engine.connect() as connection:
+        for value in range(count):
+            connection.execute(text("SELECT :value"), {"value": value})
+
+
+def test_statements_are_recorded_per_block():
+    with profile_queries() as profile:
+        run_queries(3)
+
+    assert len(profile) == 3
+    assert profile.repeated(threshold=3) == [("SELECT ?", 3)]
+    assert profile.repeated(threshold=4) == []
+    assert profile.total_time > 0
+
+
+def test_assert_max_queries_lists_the_statements():
+    with assert_max_queries(2):
+        run_queries(2)
+    with pytest.raises(AssertionError, match="3 queries ran, expected at most 2"):
+        with assert_max_queries(2):
+            run_queries(3)
+
+
+def test_middleware_adds_headers_and_flags_repeated_statements(caplog):
+    app = FastAPI()
+    app.add_middleware(SQLProfilerMiddleware, debug=True, threshold=4)
+
+    @app.get("/loop")
+    def loop():
+        run_queries(4)
+        return []
+
+    with caplog.at_level(logging.WARNING):
+        response = TestClient(app).get("/loop")
+
+    assert response.headers["X-DB-Queries"] == "4"
+    assert float(response.headers["X-DB-Time"]) > 0
+    assert "Likely N+1 in GET /loop: 4 runs of SELECT ?" in caplog.text
@@ -0,0 +1,56 @@
+import sys
+import os
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.schemas.comments import CommentResponse
+from app.schemas.posts import PostLiteResponse
+from app.utils.responses import (
+    json_list_response, json_response, list_adapter, parse_fields, partial_schema, validate_list,
+)
+
+
+def test_rows_are_validated_and_serialized_in_one_pass():
+    rows = [SimpleNamespace(id=index, comment_id=index * 10, extra="x") for index in range(1, 4)]
+    response = json_list_response(PostLiteResponse, rows)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == [
+        {"id": 1, "comment_id": 10}, {"id": 2, "comment_id": 20}, {"id": 3, "comment_id": 30},
+    ]
+
+
+def test_validated_models_are_dumped_as_they_are():
+    posts = validate_list(PostLiteResponse, [SimpleNamespace(id=1, comment_id=2)])
+
+    assert isinstance(posts[0], PostLiteResponse)
+    assert json.loads(json_list_response(PostLiteResponse, posts).body) == [{"id": 1, "comment_id": 2}]
+    assert json_list_response(PostLiteResponse, []).body == b"[]"
+    assert list_adapter(PostLiteResponse) is list_adapter(PostLiteResponse)
+
+
+def test_fields_are_checked_against_the_schema():
+    assert parse_fields(CommentResponse, None) is None
+    assert parse_fields(CommentResponse, "license_plate, id,id") == ("id", "license_plate")
+    with pytest.raises(HTTPException) as error:
+        parse_fields(CommentResponse, "id,password")
+    assert error.value.status_code == 400
+    with pytest.raises(HTTPException):
+        parse_fields(CommentResponse, " , ")
+
+
+def test_selected_fields_are_the_only_ones_serialized():
+    fields = parse_fields(CommentResponse, "license_plate")
+    row = SimpleNamespace(license_plate="AB123")
+
+    assert json.loads(json_list_response(CommentResponse, [row], fields).body) == [{"license_plate": "AB123"}]
+    assert json.loads(json_response(CommentResponse, row, fields).body) == {"license_plate": "AB123"}
+    full = CommentResponse(id=1, owner_id=2, license_plate="AB123")
+    assert json.loads(json_response(CommentResponse, full, fields).body) == {"license_plate": "AB123"}
+    assert partial_schema(CommentResponse, fields) is partial_schema(CommentResponse, fields)
+    assert partial_schema(CommentResponse, None) is CommentResponse
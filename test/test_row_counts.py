@@ -0,0 +1,40 @@
+import sys
+import os
+from types import SimpleNamespace
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.row_counts import RowCountCache
+
+
+def test_committed_changes_adjust_cached_counts():
+    cache = RowCountCache(ttl=60)
+    cache.set("users", 10)
+    session = SimpleNamespace(info={})
+
+    cache.record(session, "users", 1)
+    cache.record(session, "users", 1)
+    cache.record(session, "posts", -1)
+    cache.apply(session)
+
+    assert cache.get("users") == 12
+    assert cache.get("posts") is None
+    assert session.info == {}
+
+
+def test_rolled_back_changes_are_dropped():
+    cache = RowCountCache(ttl=60)
+    cache.set("users", 10)
+    session = SimpleNamespace(info={})
+
+    cache.record(session, "users", 1)
+    cache.discard(session)
+    cache.apply(session)
+
+    assert cache.get("users") == 10
+
+
+def test_counts_expire():
+    cache = RowCountCache(ttl=-1)
+    cache.set("users", 10)
+    assert cache.get("users") is None
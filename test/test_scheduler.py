@@ -0,0 +1,65 @@
+import asyncio
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+from app.data_science.scheduler import DropPolicy, Frame, FrameScheduler
+
+
+def drain(scheduler, count):
+    """Takes ``count`` frames one by one and returns their camera IDs."""
+    async def _drain():
+        return [(await scheduler.next_batch(1))[0].camera_id for _ in range(count)]
+    return asyncio.run(_drain())
+
+
+def test_noisy_camera_does_not_starve_others():
+    scheduler = FrameScheduler(queue_size=100, drop_policy=DropPolicy.DROP_OLDEST, weights={})
+    for i in range(50):
+        scheduler.submit(Frame("noisy", i))
+    scheduler.submit(Frame("quiet", 0))
+
+    assert drain(scheduler, 2) == ["noisy", "quiet"]
+
+
+def test_weighted_round_robin():
+    scheduler = FrameScheduler(queue_size=10, drop_policy=DropPolicy.DROP_OLDEST, weights={"a": 2})
+    for i in range(4):
+        scheduler.submit(Frame("a", i))
+        scheduler.submit(Frame("b", i))
+
+    assert drain(scheduler, 6) == ["a", "a", "b", "a", "a", "b"]
+
+
+def test_drop_oldest_keeps_newest_frames():
+    scheduler = FrameScheduler(queue_size=2, drop_policy=DropPolicy.DROP_OLDEST, weights={})
+    for i in range(5):
+        scheduler.submit(Frame("cam", i))
+
+    batch = asyncio.run(scheduler.next_batch(10))
+    assert [frame.image for frame in batch] == [3, 4]
+    assert scheduler.stats()["cam"].dropped == 3
+
+
+def test_drop_newest_rejects_incoming_frames():
+    scheduler = FrameScheduler(queue_size=2, drop_policy=DropPolicy.DROP_NEWEST, weights={})
+    accepted = [scheduler.submit(Frame("cam", i)) for i in range(3)]
+
+    assert accepted == [True, True, False]
+    batch = asyncio.run(scheduler.next_batch(10))
+    assert [frame.image for frame in batch] == [0, 1]
+
+
+def test_latest_only_keeps_single_frame():
+    scheduler = FrameScheduler(queue_size=8, drop_policy=DropPolicy.LATEST_ONLY, weights={})
+    for i in range(4):
+        scheduler.submit(Frame("cam", i))
+
+    batch = asyncio.run(scheduler.next_batch(10))
+    assert [frame.image for frame in batch] == [3]
+    stats = scheduler.stats()["cam"]
+    assert stats.submitted == 4
+    assert stats.dropped == 3
+    assert stats.depth == 0
@@ -0,0 +1,53 @@
+import sys
+import os
+import logging
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.db.profiler import instrument
+from app.db.slow_queries import SlowQueryLog, current_caller, redact, slow_query_log, trace_methods
+
+
+def test_parameters_are_redacted():
+    assert redact({"p_email": "a@b.co", "p_id": 3}) == {"p_email": "<str>", "p_id": "<int>"}
+    assert redact(("secret", None)) == ["<str>", "<NoneType>"]
+    assert redact([{"a": 1}, {"a": 2}]) == "<2 parameter sets>"
+
+
+def test_slow_statements_are_logged_with_their_caller(monkeypatch, caplog):
+    monkeypatch.setattr(slow_query_log, "threshold", 0)
+    engine = create_engine("sqlite://")
+    instrument(engine)
+
+    with caplog.at_level(logging.WARNING):
+        token = current_caller.set("UsersRepository.find_one")
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT :email"), {"email": "someone@example.com"})
+        finally:
+            current_caller.reset(token)
+
+    assert "from UsersRepository.find_one: SELECT ? parameters=['<str>']" in caplog.text
+    assert "someone@example.com" not in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_traced_methods_name_the_repository():
+    class TrucksRepository:
+        async def find_one(self):
+            return current_caller.get()
+
+    trace_methods(TrucksRepository)
+    assert await TrucksRepository().find_one() == "TrucksRepository.find_one"
+    assert current_caller.get() is None
+
+
+def test_only_sampled_postgres_selects_are_explained():
+    log = SlowQueryLog(explain_rate=1.0)
+    assert log.should_explain("SELECT 1", "postgresql")
+    assert not log.should_explain("UPDATE users SET name = $1", "postgresql")
+    assert not log.should_explain("SELECT 1", "sqlite")
+    assert not SlowQueryLog(explain_rate=0.0).should_explain("SELECT 1", "postgresql")
@@ -0,0 +1,80 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column
+
+from app.utils.repositories import SQLAlchemyRepository
+from app.utils.statement_cache import StatementCache, statement_cache
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Truck(Base):
+    __tablename__ = "trucks"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    plate: Mapped[str] = mapped_column(nullable=True)
+
+
+class TruckRepository(SQLAlchemyRepository):
+    model = Truck
+
+
+def test_same_filter_shape_reuses_the_statement():
+    repository = TruckRepository(None)
+    first, first_params = repository._select_by({"plate": "AB123"})
+    hits = statement_cache.hits
+    second, second_params = repository._select_by({"plate": "CD456"})
+
+    assert first is second
+    assert statement_cache.hits == hits + 1
+    assert (first_params, second_params) == ({"p_plate": "AB123"}, {"p_plate": "CD456"})
+    assert repository._select_by({"plate": None})[0] is not first
+
+
+def test_cached_statements_filter_like_filter_by():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    repository = TruckRepository(None)
+    with Session(engine) as session:
+        session.add_all([Truck(id=1, plate="AB123"), Truck(id=2, plate=None)])
+        session.flush()
+
+        stmt, params = repository._select_by({"plate": None})
+        assert [truck.id for truck in session.execute(stmt, params).scalars()] == [2]
+        stmt, params = repository._select_by({"id": 1, "plate": "AB123"})
+        assert [truck.id for truck in session.execute(stmt, params).scalars()] == [1]
+
+
+def test_least_recently_used_statements_are_evicted():
+    cache = StatementCache(maxsize=2)
+    cache.get("a", object)
+    cache.get("b", object)
+    cache.get("a", object)
+    cache.get("c", object)
+
+    assert cache.stats() == {"size": 2, "hits": 1, "misses": 3}
+    cache.get("b", object)
+    assert cache.misses == 4
+
+
+def test_cached_update_and_delete_sync_loaded_objects():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    repository = TruckRepository(None)
+    with Session(engine) as session:
+        session.add_all([Truck(id=1, plate="AB123"), Truck(id=2, plate="CD456")])
+        session.flush()
+        first, second = session.get(Truck, 1), session.get(Truck, 2)
+
+        session.execute(repository._update_by_id(("plate",)), {"p_id": 1, "v_plate": "EF789"})
+        TruckRepository(session)._sync_loaded(1, {"plate": "EF789"})
+        assert first.plate == "EF789"
+        assert session.scalars(select(Truck.plate).where(Truck.id == 1)).one() == "EF789"
+        session.execute(repository._delete_by_id(), {"p_id": 2})
+        assert second not in session
@@ -0,0 +1,90 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pytest
+
+from app.data_science.character_recogniser import ALPHABET, PlateRead
+from app.data_science.pipeline import RecognitionPipeline
+from app.data_science.scheduler import Frame
+from app.data_science.voting import PlateVoter
+
+
+def make_read(text, confidence):
+    """Builds a read whose characters each have the given probability."""
+    probabilities = np.full((len(text), len(ALPHABET)), (1 - confidence) / (len(ALPHABET) - 1))
+    for position, char in enumerate(text):
+        probabilities[position, ALPHABET.index(char)] = confidence
+    return PlateRead(text, probabilities)
+
+
+class FakeDetector:
+    def detect_batch(self, images):
+        return [[(0, 0, 4, 4)] for _ in images]
+
+
+class FakeRecognizer:
+    def __init__(self, read):
+        self.read = read
+        self.calls = 0
+
+    def read_batch(self, crops):
+        self.calls += len(crops)
+        return [self.read for _ in crops]
+
+
+@pytest.fixture
+def voter():
+    return PlateVoter(threshold=0.95, min_frames=2, max_frames=5, track_ttl=10)
+
+
+def test_votes_fix_a_misread_character(voter):
+    assert voter.add("car", make_read("AB123", 0.7)) is None
+    assert voter.add("car", make_read("AB128", 0.4)) is None
+    result = voter.add("car", make_read("AB123", 0.9))
+
+    assert result.text == "AB123"
+    assert result.confidence >= 0.95
+    assert not voter.should_recognize("car")
+
+
+def test_max_frames_finalizes_best_guess(voter):
+    ambiguous = make_read("AB123", 0.99)
+    ambiguous.probabilities[4, ALPHABET.index("3")] = 0.46
+    ambiguous.probabilities[4, ALPHABET.index("8")] = 0.45
+    results = [voter.add("car", ambiguous) for _ in range(5)]
+
+    assert results[:4] == [None] * 4
+    assert results[4].text == "AB123"
+    assert results[4].confidence < 0.95
+    assert results[4].frames == 5
+
+
+def test_expire_forgets_idle_tracks(voter):
+    voter.add("car", make_read("AB123", 0.9))
+    assert voter.expire(now=10 ** 9) == ["car"]
+    assert voter.should_recognize("car")
+
+
+def test_pipeline_stops_recognizing_final_tracks(voter):
+    recognizer = FakeRecognizer(make_read("KA7777", 0.99))
+    pipeline = RecognitionPipeline(FakeDetector(), recognizer, voter)
+    image = np.zeros((8, 8, 3), dtype=np.uint8)
+
+    for _ in range(6):
+        pipeline.process_batch([Frame("gate", image, track_id="car")])
+
+    assert voter.result("car").text == "KA7777"
+    assert recognizer.calls == 2
+    assert pipeline.stats.skipped == 4
+
+
+def test_pipeline_forgets_idle_tracks():
+    voter = PlateVoter(threshold=0.95, min_frames=2, max_frames=5, track_ttl=-1)
+    pipeline = RecognitionPipeline(FakeDetector(), FakeRecognizer(make_read("KA7777", 0.99)), voter)
+    pipeline.process_batch([Frame("gate", np.zeros((8, 8, 3), dtype=np.uint8), track_id="car")])
+
+    assert pipeline.stats.expired == 1
+    assert voter.expire() == []
@@ -0,0 +1,42 @@
+import sys
+import os
+import asyncio
+import json
+import logging
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.routing import APIRoute
+
+from app.utils.watchdog import LoopWatchdog
+
+
+def hash_password_inline():
+    time.sleep(0.3)
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_is_reported_with_its_stack_and_route(caplog):
+    watchdog = LoopWatchdog(interval=0.01, threshold=0.1)
+    watchdog.start()
+    try:
+        await asyncio.sleep(0.05)
+        watchdog.requests[asyncio.current_task()] = {
+            "method": "POST", "path": "/auth/login", "route": APIRoute("/auth/login", lambda: None),
+        }
+        with caplog.at_level(logging.WARNING):
+            hash_password_inline()
+            await asyncio.sleep(0.05)
+    finally:
+        watchdog.stop()
+
+    reports = [json.loads(record.getMessage()) for record in caplog.records if "event_loop_blocked" in record.getMessage()]
+    assert len(reports) == 1
+    assert reports[0]["route"] == "/auth/login"
+    assert reports[0]["method"] == "POST"
+    assert reports[0]["blocked_ms"] >= 100
+    assert any("in hash_password_inline" in frame for frame in reports[0]["stack"])
+    assert watchdog.blocks == 1
+    assert watchdog.max_lag >= 0.2